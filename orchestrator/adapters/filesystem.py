@@ -1,12 +1,31 @@
 """Filesystem utilities for path management, hashing, and locking."""
 
+import atexit
+import dataclasses
 import fcntl
+import fnmatch
 import hashlib
 import json
+import mmap
 import os
+import struct
+import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # Fall back to stdlib json
+
+
+# Lock metadata header: timestamp (float64), pid (uint32), ttl (int32),
+# command (first 64 bytes, NUL padded)
+_LOCK_STRUCT = struct.Struct("<dIi64s")
 
 
 class LockError(Exception):
@@ -43,28 +62,6 @@ class FileLock:
         # Create lock directory if needed
         self.lock_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check for existing lock
-        if self.lock_path.exists():
-            if force:
-                # Force mode - remove existing lock
-                self.lock_path.unlink()
-            else:
-                existing_metadata = self._read_lock_metadata()
-                if existing_metadata:
-                    timestamp = existing_metadata.get("timestamp", 0)
-                    ttl = self.ttl_seconds  # Always use configured TTL for security
-                    age = time.time() - timestamp
-
-                    if age < ttl:
-                        raise LockError(
-                            f"Lock already held by PID {existing_metadata.get('pid')} "
-                            f"for command '{existing_metadata.get('command')}' "
-                            f"(age: {int(age)}s, TTL: {int(ttl)}s)"
-                        )
-                    else:
-                        # Stale lock - remove it
-                        self.lock_path.unlink()
-
         # Write lock metadata
         self.metadata = {
             "pid": os.getpid(),
@@ -72,23 +69,105 @@ class FileLock:
             "timestamp": time.time(),
             "ttl": self.ttl_seconds,
         }
+        payload = _LOCK_STRUCT.pack(
+            self.metadata["timestamp"],
+            self.metadata["pid"],
+            self.ttl_seconds,
+            command.encode("utf-8")[:64],
+        )
+
+        # Linking a fully written file into place is a single atomic step, so
+        # there is no window where the lock exists without its metadata.
+        # At most one forced or stale lock is removed before giving up.
+        for attempt in range(2):
+            try:
+                self.lock_file = self._create_lock_file(payload)
+                return
+            except FileExistsError as e:
+                if attempt == 0 and (force or self._is_stale()):
+                    self.lock_path.unlink(missing_ok=True)
+                    continue
+                raise LockError(f"Failed to acquire lock: {e}") from e
+            except (OSError, IOError) as e:
+                raise LockError(f"Failed to acquire lock: {e}") from e
+
+    def _is_stale(self) -> bool:
+        """Check whether the existing lock has outlived its TTL.
+
+        Returns:
+            True if the lock is stale
 
-        # Create lock file
-        try:
-            self.lock_file = os.open(
-                str(self.lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644
+        Raises:
+            LockError: If the lock is still held
+        """
+        existing_metadata = self._read_lock_metadata()
+        if not existing_metadata:
+            return False
+
+        timestamp = existing_metadata.get("timestamp", 0)
+        ttl = self.ttl_seconds  # Always use configured TTL for security
+        age = time.time() - timestamp
+
+        if age < ttl:
+            raise LockError(
+                f"Lock already held by PID {existing_metadata.get('pid')} "
+                f"for command '{existing_metadata.get('command')}' "
+                f"(age: {int(age)}s, TTL: {int(ttl)}s)"
             )
-            os.write(self.lock_file, json.dumps(self.metadata).encode())
-            os.close(self.lock_file)
-            self.lock_file = os.open(str(self.lock_path), os.O_RDONLY)
-            fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
-        except (OSError, IOError) as e:
-            if self.lock_file is not None:
-                try:
-                    os.close(self.lock_file)
-                except:
-                    pass
-            raise LockError(f"Failed to acquire lock: {e}") from e
+        return True
+
+    def _create_lock_file(self, payload: bytes) -> int:
+        """Atomically create the lock file with its metadata and flock it.
+
+        Uses an anonymous O_TMPFILE linked into place on Linux, and a named
+        temporary file plus os.link elsewhere.
+
+        Args:
+            payload: Serialized lock metadata
+
+        Returns:
+            File descriptor holding the lock
+
+        Raises:
+            FileExistsError: If the lock file already exists
+        """
+        fd = None
+        if hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd"):
+            try:
+                fd = os.open(self.lock_path.parent, os.O_TMPFILE | os.O_RDWR, 0o644)
+            except OSError:
+                fd = None  # Filesystem without O_TMPFILE support
+
+        if fd is not None:
+            try:
+                os.write(fd, payload)
+                os.link(f"/proc/self/fd/{fd}", self.lock_path)
+            except FileExistsError:
+                os.close(fd)
+                raise
+            except OSError:
+                # /proc linking unavailable (e.g. sandboxed procfs)
+                os.close(fd)
+                fd = None
+
+        if fd is None:
+            fd, tmp_name = tempfile.mkstemp(dir=self.lock_path.parent, prefix=".lock-")
+            try:
+                os.fchmod(fd, 0o644)
+                os.write(fd, payload)
+                os.link(tmp_name, self.lock_path)
+            except BaseException:
+                os.close(fd)
+                raise
+            finally:
+                os.unlink(tmp_name)
+
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BaseException:
+            os.close(fd)
+            raise
+        return fd
 
     def release(self) -> None:
         """Release the lock."""
@@ -110,8 +189,16 @@ class FileLock:
     def _read_lock_metadata(self) -> dict:
         """Read metadata from existing lock file."""
         try:
-            with open(self.lock_path, "r") as f:
-                return json.load(f)
+            data = self.lock_path.read_bytes()
+            if len(data) != _LOCK_STRUCT.size:
+                return _loads(data)  # JSON lock written by an older version
+            timestamp, pid, ttl, command = _LOCK_STRUCT.unpack(data)
+            return {
+                "pid": pid,
+                "command": command.rstrip(b"\0").decode("utf-8", "replace"),
+                "timestamp": timestamp,
+                "ttl": ttl,
+            }
         except:
             return {}
 
@@ -125,6 +212,41 @@ class FileLock:
         return False
 
 
+# Files larger than this are memory-mapped when hashing
+_MMAP_HASH_THRESHOLD = 1 << 20
+# Directories with fewer matching files than this are hashed without a thread pool
+_PARALLEL_HASH_MIN_FILES = 16
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for the stdlib path: dataclasses as dicts, else str()."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+def _dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it is installed.
+
+    Dataclass instances are encoded as objects; orjson does this natively, so
+    callers need not build an ``asdict()`` copy first. Datetimes are passed
+    through to ``default=str`` so both encoders emit identical timestamps.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=indent, default=_json_default).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def compute_file_hash(file_path: Path) -> str:
     """Compute SHA256 hash of a file.
 
@@ -137,20 +259,36 @@ def compute_file_hash(file_path: Path) -> str:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    sha256 = hashlib.sha256()
+    # open() raises FileNotFoundError itself; no separate exists() stat
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            sha256.update(chunk)
+        size = os.fstat(f.fileno()).st_size
+        if size > _MMAP_HASH_THRESHOLD:
+            # Hash large files straight from the page cache in one C call
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).hexdigest()
+
+        # file_digest reuses a single read buffer and feeds it straight to OpenSSL
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
-    return sha256.hexdigest()
+
+def _hash_file_or_none(file_path: Path) -> Optional[str]:
+    """Hash a file, returning None if it cannot be read."""
+    try:
+        return compute_file_hash(file_path)
+    except OSError:
+        return None
 
 
 def compute_directory_hash(directory: Path, pattern: str = "*") -> str:
     """Compute combined hash of all files in a directory matching pattern.
 
+    A pattern without a path separator or ``**`` is matched against the names
+    of the files directly in ``directory``. Other patterns (e.g. ``**/*.md``
+    or ``sub/*.json``) are resolved with ``Path.glob``. Either way, each file
+    contributes its name, not its relative path, to the combined hash.
+
     Args:
         directory: Directory path
         pattern: Glob pattern for files (default: "*")
@@ -161,28 +299,75 @@ def compute_directory_hash(directory: Path, pattern: str = "*") -> str:
     if not directory.exists():
         return ""
 
-    hashes = []
-    for file_path in sorted(directory.glob(pattern)):
-        if file_path.is_file():
-            try:
-                file_hash = compute_file_hash(file_path)
-                hashes.append(f"{file_path.name}:{file_hash}")
-            except:
-                pass
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        file_paths = sorted(p for p in directory.glob(pattern) if p.is_file())
+    else:
+        # DirEntry.is_file() uses the cached dirent type, avoiding a stat per file
+        with os.scandir(directory) as it:
+            file_paths = sorted(
+                Path(entry.path)
+                for entry in it
+                if entry.is_file() and fnmatch.fnmatchcase(entry.name, pattern)
+            )
 
-    combined = "\n".join(hashes)
-    return hashlib.sha256(combined.encode()).hexdigest()
+    if len(file_paths) < _PARALLEL_HASH_MIN_FILES:
+        # Starting a pool costs more than hashing a handful of files
+        file_hashes = [_hash_file_or_none(file_path) for file_path in file_paths]
+    else:
+        # hashlib releases the GIL while digesting, so files hash in parallel;
+        # map() preserves the sorted order the combined hash depends on
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            file_hashes = list(executor.map(_hash_file_or_none, file_paths))
+
+    # Feed "name:hash" lines to the outer hasher one at a time; the digest is
+    # the same as hashing the newline-joined lines
+    combined = hashlib.sha256()
+    separator = b""
+    for file_path, file_hash in zip(file_paths, file_hashes):
+        if file_hash is None:
+            continue
+        combined.update(separator)
+        combined.update(file_path.name.encode())
+        combined.update(b":")
+        combined.update(file_hash.encode())
+        separator = b"\n"
+    return combined.hexdigest()
+
+
+# (path, mode) pairs already created and chmod-ed by ensure_directory
+_ENSURED_DIRECTORIES: set[tuple[str, int]] = set()
 
 
 def ensure_directory(path: Path, mode: int = 0o755) -> None:
     """Ensure a directory exists with proper permissions.
 
+    Directories are only created and chmod-ed the first time they are seen
+    in this process.
+
     Args:
         path: Directory path
         mode: Permission mode (default: 0o755)
     """
+    key = (os.fspath(path), mode)
+    if key in _ENSURED_DIRECTORIES:
+        return
     path.mkdir(parents=True, exist_ok=True)
     os.chmod(path, mode)
+    _ENSURED_DIRECTORIES.add(key)
+
+
+def _write_to_directory(path: Path, data: bytes, append: bool = False) -> None:
+    """Write bytes to a file, creating its parent directory if needed."""
+    write = _append_bytes if append else write_bytes
+    ensure_directory(path.parent)
+    try:
+        write(path, data)
+    except FileNotFoundError:
+        # Parent was removed after it was ensured (e.g. by cleanup)
+        _ENSURED_DIRECTORIES.discard((os.fspath(path.parent), 0o755))
+        ensure_directory(path.parent)
+        write(path, data)
 
 
 def get_dated_path(base_path: Path, date_str: str, filename: str) -> Path:
@@ -201,17 +386,90 @@ def get_dated_path(base_path: Path, date_str: str, filename: str) -> Path:
     return dated_dir / filename
 
 
-def write_json(path: Path, data: dict, indent: int = 2) -> None:
+def write_bytes(path: Path, data: bytes, append: bool = False) -> None:
+    """Write bytes to a file with unbuffered OS-level writes.
+
+    Appends use O_APPEND so each record lands in a single write call.
+
+    Args:
+        path: File path
+        data: Bytes to write
+        append: Append instead of truncating (default: False)
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Open O_APPEND descriptors for JSONL files, most recently used last:
+# path -> (fd, st_dev, st_ino)
+_APPEND_FDS: "OrderedDict[str, tuple[int, int, int]]" = OrderedDict()
+_APPEND_FDS_MAX = 64
+_APPEND_FDS_LOCK = threading.Lock()
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """Append bytes to a file through a cached O_APPEND descriptor.
+
+    The cached descriptor is reused only while the path still refers to the
+    same inode, so deleted or rotated files are reopened.
+    """
+    key = os.fspath(path)
+    with _APPEND_FDS_LOCK:
+        cached = _APPEND_FDS.get(key)
+        if cached is not None:
+            fd, dev, ino = cached
+            try:
+                st = os.stat(key)
+                reusable = (st.st_dev, st.st_ino) == (dev, ino)
+            except FileNotFoundError:
+                reusable = False
+            if not reusable:
+                del _APPEND_FDS[key]
+                os.close(fd)
+                cached = None
+
+        if cached is None:
+            fd = os.open(key, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+            st = os.fstat(fd)
+            _APPEND_FDS[key] = (fd, st.st_dev, st.st_ino)
+            while len(_APPEND_FDS) > _APPEND_FDS_MAX:
+                _, (old_fd, _, _) = _APPEND_FDS.popitem(last=False)
+                os.close(old_fd)
+        else:
+            _APPEND_FDS.move_to_end(key)
+
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+
+@atexit.register
+def close_append_files() -> None:
+    """Close all cached JSONL append descriptors."""
+    with _APPEND_FDS_LOCK:
+        while _APPEND_FDS:
+            _, (fd, _, _) = _APPEND_FDS.popitem()
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def write_json(path: Path, data: Any, indent: int = 2) -> None:
     """Write JSON data to file.
 
     Args:
         path: File path
-        data: Data to write
+        data: Data to write (dict or dataclass instance)
         indent: JSON indentation (default: 2)
     """
-    ensure_directory(path.parent)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, default=str)
+    _write_to_directory(path, _dumps(data, indent=indent))
 
 
 def read_json(path: Path) -> dict:
@@ -229,20 +487,27 @@ def read_json(path: Path) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _loads(path.read_bytes())
 
 
-def append_jsonl(path: Path, data: dict) -> None:
+def append_jsonl(path: Path, data: Any) -> None:
     """Append a JSON line to a JSONL file.
 
     Args:
         path: File path
-        data: Data to append
+        data: Data to append (dict or dataclass instance)
     """
-    ensure_directory(path.parent)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(data, default=str) + "\n")
+    _write_to_directory(path, _dumps(data) + b"\n", append=True)
+
+
+def append_text(path: Path, text: str) -> None:
+    """Append UTF-8 text to a file through a cached O_APPEND descriptor.
+
+    Args:
+        path: File path
+        text: Text to append (include the trailing newline)
+    """
+    _write_to_directory(path, text.encode("utf-8"), append=True)
 
 
 def read_jsonl(path: Path) -> list[dict]:
@@ -253,13 +518,21 @@ def read_jsonl(path: Path) -> list[dict]:
 
     Returns:
         List of parsed JSON objects
+
+    Raises:
+        json.JSONDecodeError: If a line is not a single JSON value
     """
     if not path.exists():
         return []
 
+    # One read for the whole log, but each line is decoded on its own so a
+    # corrupt line fails instead of merging into its neighbours
     entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                entries.append(json.loads(line))
+    for lineno, line in enumerate(path.read_bytes().splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            entries.append(_loads(line))
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"{e.msg} in {path} line {lineno}", e.doc, e.pos) from e
     return entries
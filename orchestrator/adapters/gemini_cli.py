@@ -1,14 +1,52 @@
 """Gemini CLI adapter with retries and timeouts."""
 
+import asyncio
+import functools
+import os
+import random
+import re
 import subprocess
+import tempfile
+import threading
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 
 from config.settings_schema import PromptPolicy
 from services.rate_limiter import RateLimitError, get_rate_limiter
 
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover
+    hyperscan = None  # Fall back to the regex scan
+
+# Retry backoff bounds in seconds (base, cap)
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+RATE_LIMIT_BACKOFF_BASE = 30.0
+RATE_LIMIT_BACKOFF_CAP = 120.0
+
+# Substrings in CLI output that indicate rate limiting
+_RATE_LIMIT_INDICATORS = (
+    "429",  # HTTP 429 Too Many Requests
+    "rate limit",
+    "quota exceeded",
+    "too many requests",
+    "resource exhausted",
+    "requests per minute",
+)
+_RATE_LIMIT_RE = re.compile(
+    "|".join(re.escape(indicator) for indicator in _RATE_LIMIT_INDICATORS),
+    re.IGNORECASE,
+)
+# Error output at least this long is scanned with Hyperscan when installed
+_HYPERSCAN_MIN_LENGTH = 64 * 1024
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after\D{0,3}(\d+)", re.IGNORECASE)
+
+_DRY_RUN_OUTPUT = "[DRY RUN] Would execute Gemini CLI"
+
 
 class GeminiCLIError(Exception):
     """Exception raised when Gemini CLI execution fails."""
@@ -25,19 +63,35 @@ class RateLimitDetectedError(Exception):
 class GeminiCLIAdapter:
     """Adapter for executing Gemini CLI commands with retry logic and rate limiting."""
 
-    def __init__(self, repo_root: Path, enable_rate_limiting: bool = True):
+    def __init__(
+        self,
+        repo_root: Path,
+        enable_rate_limiting: bool = True,
+        max_concurrency: int = 4,
+    ):
         """Initialize the Gemini CLI adapter.
 
         Args:
             repo_root: Repository root directory
             enable_rate_limiting: Whether to enable rate limiting
+            max_concurrency: Maximum in-flight invocations for execute_prompt_async
         """
         self.repo_root = repo_root
         self.enable_rate_limiting = enable_rate_limiting
+        self.max_concurrency = max_concurrency
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
         if enable_rate_limiting:
             self.rate_limiter = get_rate_limiter()
         else:
             self.rate_limiter = None
+        # Subprocess environment, prepared once: inherit the current env and
+        # default GEMINI_APPROVAL_MODE to yolo for automation
+        self._env = {
+            **os.environ,
+            "GEMINI_APPROVAL_MODE": os.environ.get("GEMINI_APPROVAL_MODE", "yolo"),
+        }
+        # Last backoff delay per prompt, for decorrelated jitter
+        self._prev_backoff: dict[str, float] = {}
 
     def execute_prompt(
         self,
@@ -57,42 +111,24 @@ class GeminiCLIAdapter:
             dry_run: If True, skip actual execution
 
         Returns:
-            Tuple of (exit_code, output, started_at, ended_at, retries)
+            Tuple of (exit_code, output, started_at, ended_at, retries); the
+            model response itself is written to output_path
 
         Raises:
             GeminiCLIError: If execution fails after all retries
         """
         started_at = datetime.now()
-        retries = 0
-        last_error = None
-
-        # Build full prompt with context
-        full_prompt = prompt_text
-        if context_data:
-            full_prompt = f"{prompt_text}\n\n{context_data}"
+        full_prompt = _full_prompt(prompt_text, context_data)
 
         # Dry run mode
         if dry_run:
-            return (
-                0,
-                "[DRY RUN] Would execute Gemini CLI",
-                started_at,
-                datetime.now(),
-                0,
-            )
+            return (0, _DRY_RUN_OUTPUT, started_at, datetime.now(), 0)
 
         # Retry loop
+        last_error = None
         for attempt in range(policy.max_retries + 1):
             try:
-                # Wait for rate limiter token if enabled
-                if self.rate_limiter:
-                    try:
-                        self.rate_limiter.wait_if_needed(timeout=120.0)
-                    except RateLimitError as e:
-                        # Daily limit exceeded - fail immediately
-                        ended_at = datetime.now()
-                        raise GeminiCLIError(f"Rate limit exceeded: {e}") from e
-
+                self._acquire_rate_limit_token()
                 exit_code, output = self._invoke_gemini_cli(
                     prompt=full_prompt,
                     model=policy.model,
@@ -100,52 +136,187 @@ class GeminiCLIAdapter:
                     timeout_sec=policy.timeout_sec,
                     output_path=output_path,
                 )
+            except GeminiCLIError:
+                raise
+            except Exception as e:
+                last_error, delay = self._failed_attempt(policy, attempt, error=e)
+            else:
+                if exit_code == 0:
+                    self._prev_backoff.pop(policy.prompt_id, None)
+                    return (exit_code, output, started_at, datetime.now(), attempt)
+                last_error, delay = self._failed_attempt(
+                    policy, attempt, exit_code=exit_code, output=output
+                )
 
-                ended_at = datetime.now()
+            if delay is not None:
+                time.sleep(delay)
 
-                if exit_code == 0:
-                    retries = attempt  # Track number of attempts before success
-                    return (exit_code, output, started_at, ended_at, retries)
-                else:
-                    # Check if this is a rate limit error
-                    is_rate_limit = self._is_rate_limit_error(output)
-
-                    # Capture stderr in error message
-                    last_error = f"Gemini CLI exited with code {exit_code}: {output[:500]}"
-                    retries = attempt
-
-                    # Retry with exponential backoff
-                    if attempt < policy.max_retries:
-                        if is_rate_limit:
-                            # Longer backoff for rate limits (30-120 seconds)
-                            backoff_time = min(30 * (2 ** attempt), 120)
-                        else:
-                            # Standard exponential backoff
-                            backoff_time = min(2 ** attempt, 60)
-                        time.sleep(backoff_time)
-
-            except subprocess.TimeoutExpired as e:
-                last_error = f"Timeout after {policy.timeout_sec}s"
-                retries = attempt
-
-                if attempt < policy.max_retries:
-                    backoff_time = min(2 ** attempt, 60)
-                    time.sleep(backoff_time)
+        raise self._retries_exhausted(policy, last_error)
+
+    async def execute_prompt_async(
+        self,
+        policy: PromptPolicy,
+        prompt_text: str,
+        output_path: Path,
+        context_data: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> tuple[int, str, datetime, datetime, int]:
+        """Execute a prompt via Gemini CLI without blocking the event loop.
+
+        Behaves like execute_prompt, but many prompts can be awaited together
+        (e.g. with asyncio.gather) from a single thread. At most
+        max_concurrency invocations run at once.
+
+        Args:
+            policy: Prompt policy configuration
+            prompt_text: The prompt to execute
+            output_path: Path to write output
+            context_data: Optional context data to append to prompt
+            dry_run: If True, skip actual execution
+
+        Returns:
+            Tuple of (exit_code, output, started_at, ended_at, retries); the
+            model response itself is written to output_path
+
+        Raises:
+            GeminiCLIError: If execution fails after all retries
+        """
+        started_at = datetime.now()
+        full_prompt = _full_prompt(prompt_text, context_data)
+
+        # Dry run mode
+        if dry_run:
+            return (0, _DRY_RUN_OUTPUT, started_at, datetime.now(), 0)
+
+        if self._async_semaphore is None:
+            self._async_semaphore = asyncio.Semaphore(self.max_concurrency)
 
+        # Retry loop
+        last_error = None
+        for attempt in range(policy.max_retries + 1):
+            try:
+                await asyncio.to_thread(self._acquire_rate_limit_token)
+                async with self._async_semaphore:
+                    exit_code, output = await self._invoke_gemini_cli_async(
+                        prompt=full_prompt,
+                        model=policy.model,
+                        timeout_sec=policy.timeout_sec,
+                        output_path=output_path,
+                    )
+            except GeminiCLIError:
+                raise
             except Exception as e:
-                last_error = str(e)
-                retries = attempt
+                last_error, delay = self._failed_attempt(policy, attempt, error=e)
+            else:
+                if exit_code == 0:
+                    self._prev_backoff.pop(policy.prompt_id, None)
+                    return (exit_code, output, started_at, datetime.now(), attempt)
+                last_error, delay = self._failed_attempt(
+                    policy, attempt, exit_code=exit_code, output=output
+                )
+
+            if delay is not None:
+                await asyncio.sleep(delay)
+
+        raise self._retries_exhausted(policy, last_error)
+
+    def _acquire_rate_limit_token(self) -> None:
+        """Wait for a rate limiter token when rate limiting is enabled.
+
+        Raises:
+            GeminiCLIError: If the daily limit is exceeded
+        """
+        if not self.rate_limiter:
+            return
+        try:
+            self.rate_limiter.wait_if_needed(timeout=120.0)
+        except RateLimitError as e:
+            # Daily limit exceeded - fail immediately
+            raise GeminiCLIError(f"Rate limit exceeded: {e}") from e
+
+    def _failed_attempt(
+        self,
+        policy: PromptPolicy,
+        attempt: int,
+        error: Optional[Exception] = None,
+        exit_code: int = 0,
+        output: str = "",
+    ) -> tuple[str, Optional[float]]:
+        """Describe a failed attempt and pick the delay before the next one.
+
+        Args:
+            policy: Prompt policy configuration
+            attempt: Zero-based attempt number
+            error: Exception raised by the attempt, if any
+            exit_code: Gemini CLI exit code when no exception was raised
+            output: stderr from Gemini CLI when no exception was raised
+
+        Returns:
+            Tuple of (error message, retry delay in seconds); the delay is None
+            once all retries are spent
+        """
+        if error is None:
+            message = f"Gemini CLI exited with code {exit_code}: {output[:500]}"
+        elif isinstance(error, subprocess.TimeoutExpired):
+            message = f"Timeout after {policy.timeout_sec}s"
+        else:
+            message = str(error)
+
+        if attempt >= policy.max_retries:
+            return message, None
+        if error is None:
+            # Retry with jittered exponential backoff
+            return message, self._backoff_delay(
+                policy.prompt_id, self._is_rate_limit_error(output), output
+            )
+        return message, self._backoff_delay(policy.prompt_id)
 
-                if attempt < policy.max_retries:
-                    backoff_time = min(2 ** attempt, 60)
-                    time.sleep(backoff_time)
+    def _retries_exhausted(self, policy: PromptPolicy, last_error: Optional[str]) -> GeminiCLIError:
+        """Build the error raised once every attempt has failed.
+
+        Args:
+            policy: Prompt policy configuration
+            last_error: Message describing the final failure
 
-        ended_at = datetime.now()
-        raise GeminiCLIError(
+        Returns:
+            Error to raise
+        """
+        self._prev_backoff.pop(policy.prompt_id, None)
+        return GeminiCLIError(
             f"Failed to execute prompt '{policy.prompt_id}' after "
             f"{policy.max_retries + 1} attempts. Last error: {last_error}"
         )
 
+    def _backoff_delay(
+        self, prompt_id: str, rate_limited: bool = False, error_output: str = ""
+    ) -> float:
+        """Compute the next retry delay using decorrelated jitter.
+
+        Randomizing the delay keeps concurrent runs from retrying in lock-step.
+        A Retry-After hint in rate limit errors takes precedence, up to
+        RATE_LIMIT_BACKOFF_CAP.
+
+        Args:
+            prompt_id: Prompt being retried
+            rate_limited: Whether the failure was a rate limit error
+            error_output: stderr or error message from Gemini CLI
+
+        Returns:
+            Delay in seconds
+        """
+        if rate_limited:
+            match = _RETRY_AFTER_RE.search(error_output) if error_output else None
+            if match:
+                return min(float(match.group(1)), RATE_LIMIT_BACKOFF_CAP)
+            base, cap = RATE_LIMIT_BACKOFF_BASE, RATE_LIMIT_BACKOFF_CAP
+        else:
+            base, cap = BACKOFF_BASE, BACKOFF_CAP
+
+        prev = self._prev_backoff.get(prompt_id, base)
+        delay = min(cap, random.uniform(base, max(base, prev * 3)))
+        self._prev_backoff[prompt_id] = delay
+        return delay
+
     def _invoke_gemini_cli(
         self,
         prompt: str,
@@ -164,71 +335,97 @@ class GeminiCLIAdapter:
             output_path: Path to write output
 
         Returns:
-            Tuple of (exit_code, stdout)
+            Tuple of (exit_code, stderr); stderr is empty on success since
+            stdout is written to output_path
         """
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Build command (Gemini CLI doesn't support --temperature flag)
-        cmd = [
-            "gemini",
-            "--model",
-            model,
-            prompt,
-        ]
-
-        # Prepare environment - inherit current env and ensure Gemini settings
-        import os
-        env = os.environ.copy()
-
-        # Ensure GEMINI_APPROVAL_MODE is set (default to yolo for automation)
-        if "GEMINI_APPROVAL_MODE" not in env:
-            env["GEMINI_APPROVAL_MODE"] = "yolo"
+        cmd = [*_command_prefix(model), prompt]
 
         try:
-            # Execute with timeout
-            result = subprocess.run(
-                cmd,
-                stdin=subprocess.DEVNULL,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=timeout_sec,
-                text=True,
-                cwd=str(self.repo_root),
-                env=env,
-            )
-
-            # Write output to file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(result.stdout)
+            # Execute with timeout, streaming stdout into a file that replaces
+            # output_path only once the CLI has finished
+            with _staged_output(output_path) as output_file:
+                result = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=output_file,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout_sec,
+                    text=True,
+                    cwd=str(self.repo_root),
+                    env=self._env,
+                )
 
             # If command failed, include stderr in return
             if result.returncode != 0:
                 error_msg = result.stderr if result.stderr else f"Exit code {result.returncode}"
                 return result.returncode, error_msg
 
-            return result.returncode, result.stdout
+            return result.returncode, ""
 
         except subprocess.TimeoutExpired as e:
             # subprocess.run() will already attempt to terminate the process on timeout.
             raise
 
+    async def _invoke_gemini_cli_async(
+        self,
+        prompt: str,
+        model: str,
+        timeout_sec: int,
+        output_path: Path,
+    ) -> tuple[int, str]:
+        """Invoke the Gemini CLI as an asyncio subprocess.
+
+        Args:
+            prompt: Prompt text
+            model: Model name
+            timeout_sec: Timeout in seconds
+            output_path: Path to write output
+
+        Returns:
+            Tuple of (exit_code, stderr); stderr is empty on success since
+            stdout is written to output_path
+
+        Raises:
+            subprocess.TimeoutExpired: If the CLI does not finish in time
+        """
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [*_command_prefix(model), prompt]
+
+        with _staged_output(output_path) as output_file:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=output_file,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.repo_root),
+                env=self._env,
+            )
+            try:
+                _, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout_sec)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise subprocess.TimeoutExpired(cmd, timeout_sec)
+
+        if proc.returncode != 0:
+            error_msg = stderr.decode("utf-8", "replace") if stderr else ""
+            return proc.returncode, error_msg or f"Exit code {proc.returncode}"
+
+        return proc.returncode, ""
+
     def check_gemini_cli_available(self) -> bool:
         """Check if Gemini CLI is available.
 
         Returns:
             True if Gemini CLI is available
         """
-        try:
-            result = subprocess.run(
-                ["gemini", "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return self.get_gemini_version() is not None
 
     def get_gemini_version(self) -> Optional[str]:
         """Get Gemini CLI version.
@@ -236,19 +433,7 @@ class GeminiCLIAdapter:
         Returns:
             Version string or None if not available
         """
-        try:
-            result = subprocess.run(
-                ["gemini", "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=5,
-                text=True,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return None
-        except Exception:
-            return None
+        return _probe_gemini_version()
 
     def _is_rate_limit_error(self, error_output: str) -> bool:
         """Detect if error is due to rate limiting.
@@ -262,14 +447,125 @@ class GeminiCLIAdapter:
         if not error_output:
             return False
 
-        error_lower = error_output.lower()
-        rate_limit_indicators = [
-            "429",  # HTTP 429 Too Many Requests
-            "rate limit",
-            "quota exceeded",
-            "too many requests",
-            "resource exhausted",
-            "requests per minute",
-        ]
-
-        return any(indicator in error_lower for indicator in rate_limit_indicators)
+        if hyperscan is not None and len(error_output) >= _HYPERSCAN_MIN_LENGTH:
+            return _hyperscan_has_rate_limit(error_output)
+
+        return _RATE_LIMIT_RE.search(error_output) is not None
+
+
+# A Hyperscan database owns one scratch space, so scans are serialized
+_hyperscan_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _rate_limit_database():
+    """Compile the rate limit indicators into a Hyperscan block database."""
+    count = len(_RATE_LIMIT_INDICATORS)
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[re.escape(i).encode() for i in _RATE_LIMIT_INDICATORS],
+        ids=list(range(count)),
+        elements=count,
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * count,
+    )
+    return db
+
+
+def _hyperscan_has_rate_limit(error_output: str) -> bool:
+    """Scan large error output for rate limit indicators with Hyperscan.
+
+    Args:
+        error_output: stderr or error message from Gemini CLI
+
+    Returns:
+        True if any rate limit indicator is present
+    """
+    matched = False
+
+    def on_match(*_args) -> None:
+        nonlocal matched
+        matched = True
+
+    with _hyperscan_lock:
+        _rate_limit_database().scan(
+            error_output.encode("utf-8", "replace"), match_event_handler=on_match
+        )
+    return matched
+
+
+@contextmanager
+def _staged_output(output_path: Path) -> Iterator[BinaryIO]:
+    """Open a temporary file that replaces output_path when the block exits.
+
+    The temporary file lives next to output_path so the final rename is
+    atomic. If the block raises (e.g. on timeout or a missing CLI), it is
+    removed and any existing output is left untouched.
+
+    Args:
+        output_path: Path the output is published to
+
+    Yields:
+        Binary file object to stream output into
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.")
+    try:
+        with open(fd, "wb") as output_file:
+            os.fchmod(fd, 0o644)
+            yield output_file
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def _full_prompt(prompt_text: str, context_data: Optional[str]) -> str:
+    """Append optional context data to a prompt.
+
+    Args:
+        prompt_text: The prompt to execute
+        context_data: Optional context data to append to prompt
+
+    Returns:
+        Full prompt text
+    """
+    if context_data:
+        return f"{prompt_text}\n\n{context_data}"
+    return prompt_text
+
+
+@functools.lru_cache(maxsize=32)
+def _command_prefix(model: str) -> tuple[str, ...]:
+    """Build the Gemini CLI argument prefix for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Command arguments preceding the prompt
+    """
+    return ("gemini", "--model", model)
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_gemini_version() -> Optional[str]:
+    """Run `gemini --version` once per process and return its output.
+
+    The CLI binary does not change mid-run, so every adapter shares the
+    result.
+
+    Returns:
+        Version string or None if the CLI is unavailable
+    """
+    try:
+        result = subprocess.run(
+            ["gemini", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=5,
+            text=True,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+        return None
+    except Exception:
+        return None
@@ -1,11 +1,15 @@
 """Pydantic models for configuration and settings."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+
+# Prompt identifiers: alphanumeric with underscores/hyphens, checked in pydantic-core
+PromptId = Annotated[str, StringConstraints(pattern=r"^[A-Za-z0-9_-]+$")]
 
 
 class WaveType(str, Enum):
@@ -28,10 +32,53 @@ class ConcurrencyClass(str, Enum):
     HIGH = "high"  # 8 workers
 
 
+# Direct value -> member lookups for row-loading hot paths
+WAVE_BY_VALUE = WaveType._value2member_map_
+CONC_BY_VALUE = ConcurrencyClass._value2member_map_
+
+
+def parse_wave(value: str) -> WaveType:
+    """Look up a WaveType by its value.
+
+    Args:
+        value: Wave value (e.g. "search")
+
+    Returns:
+        Matching WaveType member
+
+    Raises:
+        ValueError: If value is not a valid wave
+    """
+    try:
+        return WAVE_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid WaveType") from None
+
+
+def parse_concurrency_class(value: str) -> ConcurrencyClass:
+    """Look up a ConcurrencyClass by its value.
+
+    Args:
+        value: Concurrency class value (e.g. "medium")
+
+    Returns:
+        Matching ConcurrencyClass member
+
+    Raises:
+        ValueError: If value is not a valid concurrency class
+    """
+    try:
+        return CONC_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid ConcurrencyClass") from None
+
+
 class PromptPolicy(BaseModel):
     """Policy configuration for a single prompt."""
 
-    prompt_id: str = Field(..., description="Unique identifier for the prompt")
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    prompt_id: PromptId = Field(..., description="Unique identifier for the prompt")
     title: str = Field(..., description="Human-readable title")
     wave: WaveType = Field(..., description="Pipeline wave this prompt belongs to")
     category: str = Field(..., description="Category for grouping")
@@ -48,18 +95,19 @@ class PromptPolicy(BaseModel):
     prompt: str = Field(..., description="The actual prompt text to execute")
     notes: Optional[str] = Field(default=None, description="Additional notes")
 
-    @field_validator("prompt_id")
-    @classmethod
-    def validate_prompt_id(cls, v: str) -> str:
-        """Ensure prompt_id is valid."""
-        if not v or not v.replace("_", "").replace("-", "").isalnum():
-            raise ValueError("prompt_id must be alphanumeric with underscores/hyphens")
-        return v
+
+# Validates a whole registry in a single pydantic-core call; like the models,
+# its schema is only built on first use
+PromptPolicyListAdapter = TypeAdapter(
+    list[PromptPolicy], config=ConfigDict(defer_build=True)
+)
 
 
 class NHSettings(BaseModel):
     """Global settings for NeuroHelix orchestrator."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     repo_root: Path = Field(..., description="Repository root directory")
     default_model: str = Field(default="gemini-2.5-pro", description="Default Gemini model")
     max_parallel_jobs: int = Field(default=4, gt=0, description="Maximum parallel jobs")
@@ -84,73 +132,77 @@ class NHSettings(BaseModel):
         default=10, gt=0, description="Token bucket burst size"
     )
 
-    class Config:
-        """Pydantic config."""
-
-        frozen = True
-
 
 class RunManifest(BaseModel):
     """Manifest for a single pipeline run."""
 
-    run_id: str = Field(..., description="Unique run identifier")
-    date: str = Field(..., description="Run date (YYYY-MM-DD)")
-    started_at: datetime = Field(..., description="Run start timestamp")
-    ended_at: Optional[datetime] = Field(default=None, description="Run end timestamp")
-    forced_prompts: list[str] = Field(
-        default_factory=list, description="Prompts forced to rerun"
-    )
-    forced_waves: list[WaveType] = Field(default_factory=list, description="Waves forced to rerun")
-    completed_prompts: list[str] = Field(
-        default_factory=list, description="Successfully completed prompts"
-    )
-    failed_prompts: list[str] = Field(default_factory=list, description="Failed prompts")
-    publish_metadata: Optional[dict[str, Any]] = Field(
-        default=None, description="Publishing metadata"
-    )
-    dry_run: bool = Field(default=False, description="Whether this was a dry run")
+    # Mutable: run results are filled in as the run progresses
+    model_config = ConfigDict(defer_build=True)
+
+    run_id: str  # Unique run identifier
+    date: str  # Run date (YYYY-MM-DD)
+    started_at: datetime  # Run start timestamp
+    ended_at: Optional[datetime] = None  # Run end timestamp
+    forced_prompts: list[str] = Field(default_factory=list)  # Prompts forced to rerun
+    forced_waves: list[WaveType] = Field(default_factory=list)  # Waves forced to rerun
+    completed_prompts: list[str] = Field(default_factory=list)  # Successfully completed prompts
+    failed_prompts: list[str] = Field(default_factory=list)  # Failed prompts
+    publish_metadata: Optional[dict[str, Any]] = None  # Publishing metadata
+    dry_run: bool = False  # Whether this was a dry run
+
 
+# Per-artifact records are plain slotted dataclasses: they are built from
+# trusted values on the write path and validated via TypeAdapter on read.
 
-class CompletionMarker(BaseModel):
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CompletionMarker:
     """Completion status for a single artifact."""
 
-    prompt_id: str = Field(..., description="Associated prompt ID")
-    started_at: datetime = Field(..., description="Start timestamp")
-    ended_at: datetime = Field(..., description="End timestamp")
-    exit_code: int = Field(..., description="Process exit code")
-    retries: int = Field(default=0, ge=0, description="Number of retries")
-    sha256: Optional[str] = Field(default=None, description="SHA256 hash of output file")
-    error_message: Optional[str] = Field(default=None, description="Error message if failed")
+    # Not a field: lets CompletionMarkerAdapter defer building its schema
+    __pydantic_config__ = ConfigDict(defer_build=True)
+
+    prompt_id: str  # Associated prompt ID
+    started_at: datetime  # Start timestamp
+    ended_at: datetime  # End timestamp
+    exit_code: int  # Process exit code
+    retries: Annotated[int, Field(ge=0)] = 0  # Number of retries
+    sha256: Optional[str] = None  # SHA256 hash of output file
+    error_message: Optional[str] = None  # Error message if failed
 
 
-class LedgerEntry(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LedgerEntry:
     """Single entry in the execution ledger."""
 
-    run_id: str = Field(..., description="Associated run ID")
-    prompt_id: str = Field(..., description="Prompt identifier")
-    registry_hash: str = Field(..., description="Hash of registry configuration")
-    config_fingerprint: str = Field(..., description="Configuration fingerprint")
-    started_at: datetime = Field(..., description="Start timestamp")
-    ended_at: Optional[datetime] = Field(default=None, description="End timestamp")
-    duration_seconds: Optional[float] = Field(default=None, description="Execution duration")
-    success: bool = Field(..., description="Whether execution succeeded")
-    retries: int = Field(default=0, ge=0, description="Number of retries")
-    output_sha256: Optional[str] = Field(default=None, description="Output file hash")
-    dependent_inputs: list[str] = Field(
-        default_factory=list, description="List of input dependencies"
-    )
-    output_paths: list[str] = Field(default_factory=list, description="Output file paths")
-    error_message: Optional[str] = Field(default=None, description="Error message if failed")
+    run_id: str  # Associated run ID
+    prompt_id: str  # Prompt identifier
+    registry_hash: str  # Hash of registry configuration
+    config_fingerprint: str  # Configuration fingerprint
+    started_at: datetime  # Start timestamp
+    ended_at: Optional[datetime] = None  # End timestamp
+    duration_seconds: Optional[float] = None  # Execution duration
+    success: bool  # Whether execution succeeded
+    retries: Annotated[int, Field(ge=0)] = 0  # Number of retries
+    output_sha256: Optional[str] = None  # Output file hash
+    dependent_inputs: tuple[str, ...] = ()  # List of input dependencies
+    output_paths: tuple[str, ...] = ()  # Output file paths
+    error_message: Optional[str] = None  # Error message if failed
+
+
+# Validate records read back from disk; schemas are built on first use
+CompletionMarkerAdapter = TypeAdapter(CompletionMarker)
+LedgerEntryListAdapter = TypeAdapter(list[LedgerEntry], config=ConfigDict(defer_build=True))
 
 
 class AuditLogEntry(BaseModel):
     """Single entry in the audit log for maintenance operations."""
 
-    timestamp: datetime = Field(..., description="Operation timestamp")
-    operator: str = Field(..., description="Operator (user or system)")
-    cli_version: str = Field(..., description="CLI version")
-    command: str = Field(..., description="Command executed")
-    affected_paths: list[str] = Field(default_factory=list, description="Affected file paths")
-    metadata: Optional[dict[str, Any]] = Field(
-        default=None, description="Additional metadata"
-    )
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    timestamp: datetime  # Operation timestamp
+    operator: str  # Operator (user or system)
+    cli_version: str  # CLI version
+    command: str  # Command executed
+    affected_paths: tuple[str, ...] = ()  # Affected file paths
+    metadata: Optional[dict[str, Any]] = None  # Additional metadata
@@ -2,77 +2,247 @@
 
 from __future__ import annotations
 
+import codecs
+import copy
+import hashlib
 import os
+import pickle
+import re
+import sys
+import tempfile
+import threading
 import warnings
+from dataclasses import dataclass, fields, replace
+from functools import cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Callable, Optional
 
-try:
-    import tomllib  # Python 3.11+
-except ImportError:  # pragma: no cover
-    import tomli as tomllib  # Fallback for older Python
+import pydantic
+from pydantic import BaseModel, ConfigDict, Field
 
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field
 
+# Section configs are plain dataclasses; NHConfig validates and coerces them
+# when it is built from the merged settings dict.
 
-class OrchestratorConfig(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class OrchestratorConfig:
     """Orchestrator settings."""
 
-    default_model: str = Field(default="gemini-2.5-pro", description="Default Gemini model")
-    max_parallel_jobs: int = Field(default=4, ge=1, le=16, description="Max parallel jobs")
-    enable_rate_limiting: bool = Field(default=True, description="Enable rate limiting")
-    approval_mode: str = Field(default="yolo", description="Gemini approval mode")
+    default_model: str = "gemini-2.5-pro"  # Default Gemini model
+    max_parallel_jobs: Annotated[int, Field(ge=1, le=16)] = 4  # Max parallel jobs
+    enable_rate_limiting: bool = True  # Enable rate limiting
+    approval_mode: str = "yolo"  # Gemini approval mode
 
 
-class PathsConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PathsConfig:
     """Path settings."""
 
-    repo_root: Optional[str] = Field(default=None, description="Repository root directory")
-    data_dir: Optional[str] = Field(default=None, description="Data directory")
-    logs_dir: Optional[str] = Field(default=None, description="Logs directory")
+    repo_root: Optional[str] = None  # Repository root directory
+    data_dir: Optional[str] = None  # Data directory
+    logs_dir: Optional[str] = None  # Logs directory
 
 
-class RegistryConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RegistryConfig:
     """Registry settings."""
 
-    backend: str = Field(default="tsv", description="Registry backend (tsv or sqlite)")
-    sqlite_path: str = Field(default="config/prompts.db", description="SQLite database path")
-    tsv_path: str = Field(default="config/prompts.tsv", description="TSV registry path")
+    backend: str = "tsv"  # Registry backend (tsv or sqlite)
+    sqlite_path: str = "config/prompts.db"  # SQLite database path
+    tsv_path: str = "config/prompts.tsv"  # TSV registry path
 
 
-class CloudflareConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CloudflareConfig:
     """Cloudflare publishing settings."""
 
-    api_token: Optional[str] = Field(default=None, description="Cloudflare API token")
-    account_id: Optional[str] = Field(default=None, description="Cloudflare account ID")
-    project_name: str = Field(
-        default="neurohelix-site", description="Cloudflare Pages project name"
-    )
+    api_token: Optional[str] = None  # Cloudflare API token
+    account_id: Optional[str] = None  # Cloudflare account ID
+    project_name: str = "neurohelix-site"  # Cloudflare Pages project name
 
 
-class MaintenanceConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MaintenanceConfig:
     """Maintenance operation options."""
 
-    require_clean_git: bool = Field(
-        default=True,
-        description="Require clean git working tree before destructive commands",
-    )
+    # Require clean git working tree before destructive commands
+    require_clean_git: bool = True
 
 
-class NotifierConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class NotifierConfig:
     """Notifier hook configuration."""
 
-    enable_success: bool = Field(default=False, description="Call success notifier script")
-    enable_failure: bool = Field(default=False, description="Call failure notifier script")
-    success_script: str = Field(
-        default="scripts/notifiers/notify.sh",
-        description="Path to success notifier script",
-    )
-    failure_script: str = Field(
-        default="scripts/notifiers/notify_failures.sh",
-        description="Path to failure notifier script",
-    )
+    enable_success: bool = False  # Call success notifier script
+    enable_failure: bool = False  # Call failure notifier script
+    success_script: str = "scripts/notifiers/notify.sh"  # Path to success notifier script
+    failure_script: str = "scripts/notifiers/notify_failures.sh"  # Path to failure notifier script
+
+
+class NHConfig(BaseModel):
+    """Complete NH configuration."""
+
+    # Built once per load from trusted defaults + env overrides; the schema is
+    # only compiled on first use.
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
+
+    orchestrator: OrchestratorConfig = Field(default_factory=OrchestratorConfig)
+    paths: PathsConfig = Field(default_factory=PathsConfig)
+    registry: RegistryConfig = Field(default_factory=RegistryConfig)
+    cloudflare: CloudflareConfig = Field(default_factory=CloudflareConfig)
+    maintenance: MaintenanceConfig = Field(default_factory=MaintenanceConfig)
+    notifier: NotifierConfig = Field(default_factory=NotifierConfig)
+
+
+# Quoted values as python-dotenv reads them: the closing quote may be
+# followed by whitespace and a trailing comment
+_DOUBLE_QUOTED_RE = re.compile(r'"((?:\\.|[^"\\])*)"\s*(?:#.*)?')
+_SINGLE_QUOTED_RE = re.compile(r"'((?:\\.|[^'\\])*)'\s*(?:#.*)?")
+_DOUBLE_QUOTE_ESCAPES_RE = re.compile(r"\\[\\'\"abfnrtv]")
+_SINGLE_QUOTE_ESCAPES_RE = re.compile(r"\\[\\']")
+# Comments on unquoted values must be preceded by whitespace
+_INLINE_COMMENT_RE = re.compile(r"\s+#.*")
+
+
+def _decode_escapes(pattern: re.Pattern[str], value: str) -> str:
+    """Decode the backslash escapes matched by pattern."""
+    return pattern.sub(lambda match: codecs.decode(match.group(0), "unicode-escape"), value)
+
+
+def _parse_env_value(value: str) -> Optional[str]:
+    """Parse the right-hand side of a .env assignment like python-dotenv.
+
+    Args:
+        value: Raw value with surrounding whitespace removed
+
+    Returns:
+        Value with quotes, escapes and trailing comments resolved, or None
+        for a malformed quoted value (python-dotenv skips those lines)
+    """
+    if value.startswith('"'):
+        match = _DOUBLE_QUOTED_RE.fullmatch(value)
+        return _decode_escapes(_DOUBLE_QUOTE_ESCAPES_RE, match.group(1)) if match else None
+    if value.startswith("'"):
+        match = _SINGLE_QUOTED_RE.fullmatch(value)
+        return _decode_escapes(_SINGLE_QUOTE_ESCAPES_RE, match.group(1)) if match else None
+    return _INLINE_COMMENT_RE.sub("", value)
+
+
+def _parse_env_file(path: Path) -> dict[str, str]:
+    """Parse KEY=VALUE lines from a .env file.
+
+    Follows python-dotenv for single-line values: blank lines, ``#``
+    comments, an optional ``export`` prefix, single or double quotes
+    (escape sequences are decoded inside double quotes) and trailing
+    `` #`` comments after unquoted or quoted values. Lines with an
+    unterminated quote are skipped. Multi-line values and variable
+    interpolation are not supported.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Mapping of variable names to values
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    values: dict[str, str] = {}
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+
+        parsed = _parse_env_value(value.strip())
+        if parsed is not None:
+            values[key] = parsed
+
+    return values
+
+
+# Contents written by ConfigLoader.create_sample_config
+_SAMPLE_ENV = b"""# NeuroHelix environment configuration (.env.local)
+# Copy this file to .env.local and update values as needed.
+
+# Orchestrator defaults
+NH_DEFAULT_MODEL=gemini-2.5-pro
+NH_MAX_PARALLEL_JOBS=4
+NH_ENABLE_RATE_LIMITING=true
+GEMINI_APPROVAL_MODE=yolo
+
+# Paths
+NH_REPO_ROOT=
+NH_DATA_DIR=
+NH_LOGS_DIR=
+
+# Registry
+NH_REGISTRY_BACKEND=tsv
+NH_REGISTRY_TSV_PATH=config/prompts.tsv
+NH_REGISTRY_SQLITE_PATH=config/prompts.db
+
+# Cloudflare
+CLOUDFLARE_API_TOKEN=
+CLOUDFLARE_ACCOUNT_ID=
+CLOUDFLARE_PROJECT_NAME=neurohelix-site
+
+# Maintenance
+NH_REQUIRE_CLEAN_GIT=true
+
+# Notifiers
+ENABLE_NOTIFICATIONS=false
+ENABLE_FAILURE_NOTIFICATIONS=false
+NH_SUCCESS_NOTIFIER_SCRIPT=scripts/notifiers/notify.sh
+NH_FAILURE_NOTIFIER_SCRIPT=scripts/notifiers/notify_failures.sh
+"""
+
+
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+_MAX_TRUE_LENGTH = max(len(v) for v in _TRUE_VALUES)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value (true/1/yes, any case)."""
+    if value in _TRUE_VALUES:
+        return True
+    # Only lowercase short values that could still match
+    return len(value) <= _MAX_TRUE_LENGTH and value.lower() in _TRUE_VALUES
+
+
+# Environment overrides as (env var, config section, key, coercer)
+_ENV_OVERRIDES: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
+    # Orchestrator settings
+    ("NH_DEFAULT_MODEL", "orchestrator", "default_model", str),
+    ("NH_MAX_PARALLEL_JOBS", "orchestrator", "max_parallel_jobs", int),
+    ("NH_ENABLE_RATE_LIMITING", "orchestrator", "enable_rate_limiting", _parse_bool),
+    ("GEMINI_APPROVAL_MODE", "orchestrator", "approval_mode", str),
+    # Path settings
+    ("NH_REPO_ROOT", "paths", "repo_root", str),
+    ("NH_DATA_DIR", "paths", "data_dir", str),
+    ("NH_LOGS_DIR", "paths", "logs_dir", str),
+    # Registry settings
+    ("NH_REGISTRY_BACKEND", "registry", "backend", str),
+    ("NH_REGISTRY_SQLITE_PATH", "registry", "sqlite_path", str),
+    ("NH_REGISTRY_TSV_PATH", "registry", "tsv_path", str),
+    # Cloudflare settings
+    ("CLOUDFLARE_API_TOKEN", "cloudflare", "api_token", str),
+    ("CLOUDFLARE_ACCOUNT_ID", "cloudflare", "account_id", str),
+    ("CLOUDFLARE_PROJECT_NAME", "cloudflare", "project_name", str),
+    # Maintenance settings
+    ("NH_REQUIRE_CLEAN_GIT", "maintenance", "require_clean_git", _parse_bool),
+    # Notifier settings (map from legacy env vars)
+    ("ENABLE_NOTIFICATIONS", "notifier", "enable_success", _parse_bool),
+    ("ENABLE_FAILURE_NOTIFICATIONS", "notifier", "enable_failure", _parse_bool),
+    ("NH_SUCCESS_NOTIFIER_SCRIPT", "notifier", "success_script", str),
+    ("NH_FAILURE_NOTIFIER_SCRIPT", "notifier", "failure_script", str),
+)
 
 
 class ConfigLoader:
@@ -91,6 +261,9 @@ class ConfigLoader:
         self.config_path = self.repo_root / self.DEFAULT_CONFIG_NAME
         self.legacy_config_path = self.repo_root / ".nh.toml"
         self._config: Optional[NHConfig] = None
+        self._registry_path: Optional[Path] = None
+        # Parsed .nh.toml keyed by (st_mtime_ns, st_size)
+        self._legacy_cache: Optional[tuple[int, int, dict[str, Any]]] = None
         self._env_loaded = False
         self._override_env = False
 
@@ -108,6 +281,7 @@ class ConfigLoader:
 
         if reload:
             self._config = None
+            self._registry_path = None
             self._env_loaded = False
             self._override_env = True
 
@@ -117,14 +291,15 @@ class ConfigLoader:
         config_dict: dict[str, Any] = {}
 
         # Legacy fallback: .nh.toml
-        if self.legacy_config_path.exists():
+        legacy_dict = self._read_legacy_config()
+        if legacy_dict is not None:
             warnings.warn(
                 ".nh.toml is deprecated. Move settings into .env/.env.local",
                 DeprecationWarning,
                 stacklevel=2,
             )
-            with open(self.legacy_config_path, "rb") as f:
-                config_dict = tomllib.load(f)
+            # Env overrides are merged in place, so keep the cached dict intact
+            config_dict = copy.deepcopy(legacy_dict)
 
         config_dict = self._apply_env_overrides(config_dict)
 
@@ -132,111 +307,71 @@ class ConfigLoader:
         self._config = NHConfig(**config_dict)
         return self._config
 
+    def _read_legacy_config(self) -> Optional[dict[str, Any]]:
+        """Read the legacy .nh.toml file, reusing the last parse if unchanged.
+
+        Returns:
+            Parsed TOML settings, or None if the file does not exist
+        """
+        try:
+            st = os.stat(self.legacy_config_path)
+        except FileNotFoundError:
+            self._legacy_cache = None
+            return None
+
+        if self._legacy_cache is not None and self._legacy_cache[:2] == (
+            st.st_mtime_ns,
+            st.st_size,
+        ):
+            return self._legacy_cache[2]
+
+        # Imported only for repos that still carry a legacy file
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib  # type: ignore[no-redef]  # Fallback for older Python
+
+        with open(self.legacy_config_path, "rb") as f:
+            legacy_dict = tomllib.load(f)
+        self._legacy_cache = (st.st_mtime_ns, st.st_size, legacy_dict)
+        return legacy_dict
+
     def _load_env_files(self) -> None:
         """Load .env stack into process environment."""
 
         if self._env_loaded:
             return
 
+        # One directory listing instead of probing each candidate file
+        present: set[str] = set()
+        try:
+            with os.scandir(self.repo_root) as entries:
+                for entry in entries:
+                    if entry.name in self.ENV_FILENAMES and entry.is_file():
+                        present.add(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
         for filename in self.ENV_FILENAMES:
-            env_path = self.repo_root / filename
-            if env_path.exists():
-                load_dotenv(env_path, override=self._override_env)
+            if filename not in present:
+                continue
+            try:
+                values = _parse_env_file(self.repo_root / filename)
+            except FileNotFoundError:
+                continue
+            for key, value in values.items():
+                if self._override_env or key not in os.environ:
+                    os.environ[key] = value
 
         self._env_loaded = True
         self._override_env = False
 
     def _apply_env_overrides(self, config_dict: dict) -> dict:
         """Apply environment variable overrides."""
-        # Orchestrator settings
-        if "NH_DEFAULT_MODEL" in os.environ:
-            config_dict.setdefault("orchestrator", {})["default_model"] = os.environ[
-                "NH_DEFAULT_MODEL"
-            ]
-
-        if "NH_MAX_PARALLEL_JOBS" in os.environ:
-            config_dict.setdefault("orchestrator", {})["max_parallel_jobs"] = int(
-                os.environ["NH_MAX_PARALLEL_JOBS"]
-            )
-
-        if "NH_ENABLE_RATE_LIMITING" in os.environ:
-            config_dict.setdefault("orchestrator", {})["enable_rate_limiting"] = (
-                os.environ["NH_ENABLE_RATE_LIMITING"].lower() in ("true", "1", "yes")
-            )
-
-        if "GEMINI_APPROVAL_MODE" in os.environ:
-            config_dict.setdefault("orchestrator", {})["approval_mode"] = os.environ[
-                "GEMINI_APPROVAL_MODE"
-            ]
-
-        # Path settings
-        if "NH_REPO_ROOT" in os.environ:
-            config_dict.setdefault("paths", {})["repo_root"] = os.environ["NH_REPO_ROOT"]
-
-        if "NH_DATA_DIR" in os.environ:
-            config_dict.setdefault("paths", {})["data_dir"] = os.environ["NH_DATA_DIR"]
-
-        if "NH_LOGS_DIR" in os.environ:
-            config_dict.setdefault("paths", {})["logs_dir"] = os.environ["NH_LOGS_DIR"]
-
-        # Registry settings
-        if "NH_REGISTRY_BACKEND" in os.environ:
-            config_dict.setdefault("registry", {})["backend"] = os.environ[
-                "NH_REGISTRY_BACKEND"
-            ]
-
-        if "NH_REGISTRY_SQLITE_PATH" in os.environ:
-            config_dict.setdefault("registry", {})["sqlite_path"] = os.environ[
-                "NH_REGISTRY_SQLITE_PATH"
-            ]
-
-        if "NH_REGISTRY_TSV_PATH" in os.environ:
-            config_dict.setdefault("registry", {})["tsv_path"] = os.environ[
-                "NH_REGISTRY_TSV_PATH"
-            ]
-
-        # Cloudflare settings
-        if "CLOUDFLARE_API_TOKEN" in os.environ:
-            config_dict.setdefault("cloudflare", {})["api_token"] = os.environ[
-                "CLOUDFLARE_API_TOKEN"
-            ]
-
-        if "CLOUDFLARE_ACCOUNT_ID" in os.environ:
-            config_dict.setdefault("cloudflare", {})["account_id"] = os.environ[
-                "CLOUDFLARE_ACCOUNT_ID"
-            ]
-
-        if "CLOUDFLARE_PROJECT_NAME" in os.environ:
-            config_dict.setdefault("cloudflare", {})["project_name"] = os.environ[
-                "CLOUDFLARE_PROJECT_NAME"
-            ]
-
-        # Maintenance settings
-        if "NH_REQUIRE_CLEAN_GIT" in os.environ:
-            config_dict.setdefault("maintenance", {})["require_clean_git"] = (
-                os.environ["NH_REQUIRE_CLEAN_GIT"].lower() in ("true", "1", "yes")
-            )
-
-        # Notifier settings (map from legacy env vars)
-        if "ENABLE_NOTIFICATIONS" in os.environ:
-            config_dict.setdefault("notifier", {})["enable_success"] = (
-                os.environ["ENABLE_NOTIFICATIONS"].lower() in ("true", "1", "yes")
-            )
-
-        if "ENABLE_FAILURE_NOTIFICATIONS" in os.environ:
-            config_dict.setdefault("notifier", {})["enable_failure"] = (
-                os.environ["ENABLE_FAILURE_NOTIFICATIONS"].lower() in ("true", "1", "yes")
-            )
-
-        if "NH_SUCCESS_NOTIFIER_SCRIPT" in os.environ:
-            config_dict.setdefault("notifier", {})["success_script"] = os.environ[
-                "NH_SUCCESS_NOTIFIER_SCRIPT"
-            ]
-
-        if "NH_FAILURE_NOTIFIER_SCRIPT" in os.environ:
-            config_dict.setdefault("notifier", {})["failure_script"] = os.environ[
-                "NH_FAILURE_NOTIFIER_SCRIPT"
-            ]
+        for env_var, section, key, coerce in _ENV_OVERRIDES:
+            value = os.environ.get(env_var)
+            if value is not None:
+                config_dict.setdefault(section, {})[key] = coerce(value)
 
         return config_dict
 
@@ -246,14 +381,15 @@ class ConfigLoader:
         Returns:
             Path to registry file (TSV or SQLite)
         """
-        config = self.load()
+        if self._registry_path is None:
+            config = self.load()
 
-        if config.registry.backend == "sqlite":
-            path = self.repo_root / config.registry.sqlite_path
-        else:
-            path = self.repo_root / config.registry.tsv_path
+            if config.registry.backend == "sqlite":
+                self._registry_path = self.repo_root / config.registry.sqlite_path
+            else:
+                self._registry_path = self.repo_root / config.registry.tsv_path
 
-        return path
+        return self._registry_path
 
     def get_registry_backend(self) -> str:
         """Get configured registry backend type.
@@ -270,62 +406,183 @@ class ConfigLoader:
         if output_path is None:
             output_path = self.config_path
 
-        sample_config = """# NeuroHelix environment configuration (.env.local)
-# Copy this file to .env.local and update values as needed.
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(_SAMPLE_ENV)
+        return output_path
 
-# Orchestrator defaults
-NH_DEFAULT_MODEL=gemini-2.5-pro
-NH_MAX_PARALLEL_JOBS=4
-NH_ENABLE_RATE_LIMITING=true
-GEMINI_APPROVAL_MODE=yolo
 
-# Paths
-NH_REPO_ROOT=
-NH_DATA_DIR=
-NH_LOGS_DIR=
+# Shared config loaders, keyed by resolved repository root
+_config_loaders: dict[Path, ConfigLoader] = {}
+_config_loaders_lock = threading.Lock()
 
-# Registry
-NH_REGISTRY_BACKEND=tsv
-NH_REGISTRY_TSV_PATH=config/prompts.tsv
-NH_REGISTRY_SQLITE_PATH=config/prompts.db
 
-# Cloudflare
-CLOUDFLARE_API_TOKEN=
-CLOUDFLARE_ACCOUNT_ID=
-CLOUDFLARE_PROJECT_NAME=neurohelix-site
+def get_config_loader(repo_root: Optional[Path] = None) -> ConfigLoader:
+    """Get or create the shared config loader for a repository root.
 
-# Maintenance
-NH_REQUIRE_CLEAN_GIT=true
+    Args:
+        repo_root: Repository root directory (defaults to current working directory)
 
-# Notifiers
-ENABLE_NOTIFICATIONS=false
-ENABLE_FAILURE_NOTIFICATIONS=false
-NH_SUCCESS_NOTIFIER_SCRIPT=scripts/notifiers/notify.sh
-NH_FAILURE_NOTIFIER_SCRIPT=scripts/notifiers/notify_failures.sh
-"""
+    Returns:
+        ConfigLoader instance reused across calls
+    """
+    root = repo_root or Path.cwd()
+    key = root.resolve()
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(sample_config.strip() + "\n", encoding="utf-8")
-        return output_path
+    loader = _config_loaders.get(key)
+    if loader is None:
+        with _config_loaders_lock:
+            loader = _config_loaders.get(key)
+            if loader is None:
+                loader = ConfigLoader(root)
+                _config_loaders[key] = loader
+
+    return loader
 
 
 def get_config(repo_root: Optional[Path] = None) -> NHConfig:
     """Get global configuration instance.
 
+    The configuration is loaded once per repository root and cached; use
+    ConfigLoader.load(reload=True) or reset_config_cache() to re-read it.
+
     Args:
         repo_root: Repository root directory
 
     Returns:
         NHConfig object
     """
-    loader = ConfigLoader(repo_root)
-    return loader.load()
-class NHConfig(BaseModel):
-    """Complete NH configuration."""
+    return get_config_loader(repo_root).load()
 
-    orchestrator: OrchestratorConfig = Field(default_factory=OrchestratorConfig)
-    paths: PathsConfig = Field(default_factory=PathsConfig)
-    registry: RegistryConfig = Field(default_factory=RegistryConfig)
-    cloudflare: CloudflareConfig = Field(default_factory=CloudflareConfig)
-    maintenance: MaintenanceConfig = Field(default_factory=MaintenanceConfig)
-    notifier: NotifierConfig = Field(default_factory=NotifierConfig)
+
+def reset_config_cache() -> None:
+    """Reset the shared config loaders (mainly for testing)."""
+    with _config_loaders_lock:
+        _config_loaders.clear()
+
+
+# Override variables holding credentials; never written to the config cache
+_SECRET_ENV_VARS = frozenset({"CLOUDFLARE_API_TOKEN"})
+
+
+@cache
+def _config_schema_signature() -> str:
+    """Describe the NHConfig schema, so pickles from other code are ignored.
+
+    Returns:
+        Stable text covering section names, field names, annotations and
+        defaults
+    """
+    sections = []
+    for name, field in NHConfig.model_fields.items():
+        section_type = field.annotation
+        # Built by the section's own constructor, so edited defaults show up
+        defaults = field.default_factory()
+        section_fields = tuple(
+            (f.name, str(f.type), repr(getattr(defaults, f.name))) for f in fields(section_type)
+        )
+        sections.append((name, section_type.__qualname__, section_fields))
+    return repr((pydantic.VERSION, sections))
+
+
+def _config_cache_key(loader: ConfigLoader) -> Optional[str]:
+    """Digest every input that feeds ConfigLoader.load().
+
+    Must be called after the .env stack is loaded, so the override variables
+    already reflect .env file contents.
+
+    Args:
+        loader: Config loader whose inputs are fingerprinted
+
+    Returns:
+        Hex digest, or None if a legacy .nh.toml is present (not cached)
+    """
+    if os.path.exists(loader.legacy_config_path):
+        return None
+    parts = (
+        _config_schema_signature(),
+        str(loader.repo_root.resolve()),
+        tuple(os.environ.get(env_var) for env_var, *_ in _ENV_OVERRIDES),
+    )
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+def _with_secrets_from_env(config: NHConfig, strip: bool = False) -> NHConfig:
+    """Return a copy of config with its secret fields cleared or refilled.
+
+    Args:
+        config: Configuration to copy
+        strip: Reset secrets to their defaults instead of reading the environment
+
+    Returns:
+        NHConfig with secret fields taken from the environment (or defaults)
+    """
+    updates: dict[str, Any] = {}
+    for env_var, section, key, coerce in _ENV_OVERRIDES:
+        if env_var not in _SECRET_ENV_VARS:
+            continue
+        current = updates.get(section, getattr(config, section))
+        value = None if strip else os.environ.get(env_var)
+        if value is None:
+            default = next(f.default for f in fields(current) if f.name == key)
+            updates[section] = replace(current, **{key: default})
+        else:
+            updates[section] = replace(current, **{key: coerce(value)})
+    return config.model_copy(update=updates)
+
+
+def load_cached_config(repo_root: Path, cache_path: Path) -> NHConfig:
+    """Get the shared configuration, reusing a copy pickled by an earlier process.
+
+    The cache is keyed on a digest of the resolved override variables and
+    the NHConfig field set, so editing a .env file, exporting a variable or
+    changing the schema invalidates it; the digest is stored instead of the
+    raw values. Secrets are left out of the pickle and re-read from the
+    environment on every hit, and only a cache file owned by the current user
+    is loaded. A hit skips building the NHConfig validator. Repositories still
+    using .nh.toml bypass the cache so the deprecation warning keeps firing.
+
+    Args:
+        repo_root: Repository root directory passed to the config loader
+        cache_path: Pickle file to read and refresh
+
+    Returns:
+        NHConfig object, also installed on the shared loader for repo_root
+    """
+    loader = get_config_loader(repo_root)
+    if loader._config is not None:
+        return loader._config
+
+    loader._load_env_files()
+    key = _config_cache_key(loader)
+    if key is None:
+        return loader.load()
+
+    try:
+        with open(cache_path, "rb") as f:
+            # Never unpickle a file another user could have planted
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                raise PermissionError(cache_path)
+            cached_key, config = pickle.load(f)
+        if cached_key == key and isinstance(config, NHConfig):
+            config = _with_secrets_from_env(config)
+            loader._config = config
+            return config
+    except Exception:
+        pass  # Missing, foreign, corrupt or incompatible cache; rebuild below
+
+    config = loader.load()
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file 0600; secrets are stripped before writing
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                payload = (key, _with_secrets_from_env(config, strip=True))
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # Read-only checkout; caching is best effort
+    return config
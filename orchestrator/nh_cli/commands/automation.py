@@ -2,18 +2,23 @@
 
 import os
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from services.audit import AuditService
+from nh_cli.utils.console import get_console
+from nh_cli.utils.paths import get_repo_root
+
+# Rich and the audit service are imported inside each command so that
+# loading this module (which `nh` does for every subcommand) stays cheap
 
 app = typer.Typer()
-console = Console()
+
+# Default per-user LaunchAgent location for the daily job
+PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / "com.neurohelix.daily.plist"
 
 PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
@@ -39,9 +44,9 @@ PLIST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
     <key>StartCalendarInterval</key>
     <dict>
         <key>Hour</key>
-        <integer>7</integer>
+        <integer>{hour}</integer>
         <key>Minute</key>
-        <integer>0</integer>
+        <integer>{minute}</integer>
     </dict>
     <key>StandardOutPath</key>
     <string>{repo_root}/logs/launchd_stdout.log</string>
@@ -90,17 +95,18 @@ def install(
 
         nh automation install --plist /path      # Use custom plist
     """
+    from services.audit import AuditService
+
+    console = get_console()
     console.print("\n[bold cyan]Install LaunchD Automation[/bold cyan]\n")
 
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Validate environment
     console.print("Validating environment...")
 
     # Check for Python
-    import sys
-
     python_path = sys.executable
     console.print(f"  Python: {python_path} ✓")
 
@@ -115,24 +121,23 @@ def install(
         plist_path = Path(plist)
     else:
         # Auto-generate
-        launchagents_dir = Path.home() / "Library" / "LaunchAgents"
-        launchagents_dir.mkdir(parents=True, exist_ok=True)
-        plist_path = launchagents_dir / "com.neurohelix.daily.plist"
+        PLIST_PATH.parent.mkdir(parents=True, exist_ok=True)
+        plist_path = PLIST_PATH
 
         # Generate plist content
         plist_content = PLIST_TEMPLATE.format(
             python_path=python_path,
             repo_root=str(repo_root),
             path_env=path_env,
+            hour=hour,
+            minute=minute,
         )
 
-        # Update hour/minute
-        plist_content = plist_content.replace("<integer>7</integer>", f"<integer>{hour}</integer>")
-        plist_content = plist_content.replace("<integer>0</integer>", f"<integer>{minute}</integer>", 1)
-
-        # Write plist
-        with open(plist_path, "w") as f:
-            f.write(plist_content)
+        # Write plist atomically so launchctl never sees a partial file
+        tmp_path = plist_path.with_suffix(".plist.tmp")
+        with open(tmp_path, "wb", buffering=0) as f:
+            f.write(plist_content.encode("utf-8"))
+        os.replace(tmp_path, plist_path)
 
         console.print(f"  Generated plist: {plist_path} ✓")
 
@@ -175,25 +180,23 @@ def status():
 
         nh automation status
     """
-    console.print("\n[bold cyan]Automation Status[/bold cyan]\n")
-
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
-    # Check if job is loaded
+    # Check if job is loaded; `launchctl list <label>` exits 0 only if it is
     try:
         result = subprocess.run(
-            ["launchctl", "list"],
+            ["launchctl", "list", "com.neurohelix.daily"],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            check=True,
         )
-        is_loaded = "com.neurohelix.daily" in result.stdout
-    except:
+        is_loaded = result.returncode == 0
+    except OSError:
         is_loaded = False
 
     # Check for plist file
-    plist_path = Path.home() / "Library" / "LaunchAgents" / "com.neurohelix.daily.plist"
+    plist_path = PLIST_PATH
     plist_exists = plist_path.exists()
 
     # Get last run from ledger
@@ -208,6 +211,19 @@ def status():
     lock_path = repo_root / "var" / "locks" / "nh-run.lock"
     is_locked = lock_path.exists()
 
+    # Plain key/value output for scripts polling status; skips Rich entirely
+    if not sys.stdout.isatty():
+        print(f"LaunchD Job: {'Loaded' if is_loaded else 'Not Loaded'}")
+        print(f"Plist File: {plist_path if plist_exists else 'Not Found'}")
+        print(f"Last Run: {last_run or 'Never'}")
+        print(f"Lock Status: {'Locked' if is_locked else 'Available'}")
+        return
+
+    from rich.table import Table
+
+    console = get_console()
+    console.print("\n[bold cyan]Automation Status[/bold cyan]\n")
+
     # Display table
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Property", style="cyan")
@@ -243,13 +259,16 @@ def remove():
 
         nh automation remove
     """
+    from services.audit import AuditService
+
+    console = get_console()
     console.print("\n[bold cyan]Remove LaunchD Automation[/bold cyan]\n")
 
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Plist path
-    plist_path = Path.home() / "Library" / "LaunchAgents" / "com.neurohelix.daily.plist"
+    plist_path = PLIST_PATH
 
     # Unload if loaded
     console.print("Unloading LaunchD job...")
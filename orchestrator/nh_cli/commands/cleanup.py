@@ -1,19 +1,205 @@
 """Cleanup command - Remove temporary files and stale locks."""
 
+import os
+import re
+import sys
 from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from config.toml_config import ConfigLoader
-from services.audit import AuditService
-from services.cloudflare import CloudflareService
-from services.git_safety import GitDirtyError, ensure_clean_repo, get_git_status
+from nh_cli.utils.console import get_console
+from nh_cli.utils.json_output import emit_json
+from nh_cli.utils.paths import get_orchestrator_root, get_repo_root
+
+# Rich, config and service modules are imported inside main() so that loading
+# this module (which `nh` does for every subcommand) stays cheap
 
 app = typer.Typer()
-console = Console()
+
+# Daily output directories are named YYYY-MM-DD
+_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+
+
+def _remove_expired_files(
+    directory: Path, pattern: str, cutoff_timestamp: float, dry_run: bool
+) -> tuple[list[str], int]:
+    """Remove files in a directory whose mtime is older than the cutoff.
+
+    Each entry is listed and stat'd once via os.scandir.
+
+    Args:
+        directory: Directory to scan (non-recursive)
+        pattern: Glob-style pattern matched against entry names
+        cutoff_timestamp: Files modified before this timestamp are removed
+        dry_run: If True, report files without removing them
+
+    Returns:
+        Tuple of (removed_paths, bytes_freed)
+    """
+    removed: list[str] = []
+    bytes_freed = 0
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return removed, bytes_freed
+
+    with entries:
+        for entry in entries:
+            if not fnmatchcase(entry.name, pattern):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+                if st.st_mtime >= cutoff_timestamp:
+                    continue
+                if not dry_run:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        continue  # Already removed by someone else
+                removed.append(entry.path)
+                bytes_freed += st.st_size
+            except Exception as e:
+                get_console().print(
+                    f"[yellow]Warning:[/yellow] Could not remove {entry.path}: {e}"
+                )
+
+    return removed, bytes_freed
+
+
+def _remove_expired_date_dirs(
+    outputs_dir: Path, cutoff_date: datetime, dry_run: bool
+) -> tuple[list[str], int]:
+    """Remove daily output directories dated before the cutoff.
+
+    Args:
+        outputs_dir: Directory containing YYYY-MM-DD subdirectories
+        cutoff_date: Directories dated before this are removed
+        dry_run: If True, report directories without removing them
+
+    Returns:
+        Tuple of (removed_paths, bytes_freed)
+    """
+    removed: list[str] = []
+    bytes_freed = 0
+    try:
+        with os.scandir(outputs_dir) as date_entries:
+            date_dirs = [Path(entry.path) for entry in date_entries if entry.is_dir()]
+    except FileNotFoundError:
+        return removed, bytes_freed
+
+    for date_dir in date_dirs:
+        # Skip non-date directories without raising
+        match = _DATE_RE.match(date_dir.name)
+        if match is None:
+            continue
+        try:
+            # Parse date from directory name
+            dir_date = datetime(int(match[1]), int(match[2]), int(match[3]))
+            if dir_date < cutoff_date:
+                if dry_run:
+                    dir_size = _directory_size(date_dir)
+                else:
+                    dir_size = _remove_tree(date_dir)
+                removed.append(str(date_dir))
+                bytes_freed += dir_size
+        except ValueError:
+            # Skip impossible dates such as 2025-13-01
+            pass
+        except Exception as e:
+            get_console().print(f"[yellow]Warning:[/yellow] Could not remove {date_dir}: {e}")
+
+    return removed, bytes_freed
+
+
+def _directory_size(directory: Path) -> int:
+    """Sum the sizes of all regular files under a directory.
+
+    Symlinked directories are not followed. On POSIX the tree is walked with
+    os.fwalk so each file is stat'd relative to its directory fd.
+
+    Args:
+        directory: Directory to measure
+
+    Returns:
+        Total size in bytes
+    """
+    total = 0
+    if not hasattr(os, "fwalk"):  # Windows
+        pending = [directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+        return total
+
+    for _, _, filenames, dir_fd in os.fwalk(directory):
+        for name in filenames:
+            try:
+                total += os.stat(name, dir_fd=dir_fd).st_size
+            except FileNotFoundError:
+                pass  # Dangling symlink or removed concurrently
+    return total
+
+
+def _remove_tree(directory: Path) -> int:
+    """Recursively remove a directory and report the bytes it held.
+
+    On Linux the tree is walked bottom-up with os.fwalk and every entry is
+    unlinked relative to its parent directory fd, so sizing and removal share
+    one stat per file and no path is re-resolved. Only files that were actually
+    unlinked count towards the total. Other POSIX platforms use a single
+    ``rm -rf`` process; Windows falls back to shutil.rmtree.
+
+    Args:
+        directory: Directory to remove
+
+    Returns:
+        Bytes freed by removed regular files
+
+    Raises:
+        OSError: If an entry cannot be removed
+        subprocess.CalledProcessError: If rm exits non-zero
+    """
+    if sys.platform == "linux":
+        import stat
+
+        freed = 0
+        for _, dirnames, filenames, dir_fd in os.fwalk(directory, topdown=False):
+            for name in filenames:
+                try:
+                    st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+                    os.unlink(name, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    continue  # Removed concurrently
+                if stat.S_ISREG(st.st_mode):
+                    freed += st.st_size
+            for name in dirnames:
+                try:
+                    os.rmdir(name, dir_fd=dir_fd)
+                except NotADirectoryError:
+                    os.unlink(name, dir_fd=dir_fd)  # Symlink to a directory
+                except FileNotFoundError:
+                    pass
+        os.rmdir(directory)
+        return freed
+
+    size = _directory_size(directory)
+    if sys.platform == "win32":
+        import shutil
+
+        shutil.rmtree(directory)
+    else:
+        import subprocess
+
+        subprocess.run(["/bin/rm", "-rf", "--", str(directory)], check=True)
+    return size
 
 
 @app.command()
@@ -56,11 +242,20 @@ def main(
 
         nh cleanup --dry-run            # Preview what would be removed
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from config.toml_config import ConfigLoader
+    from services.audit import AuditService
+    from services.cloudflare import CloudflareService
+    from services.git_safety import GitDirtyError, ensure_clean_repo, get_git_status
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Load config for maintenance + Cloudflare settings
-    orchestrator_root = repo_root / "orchestrator" if repo_root.name != "orchestrator" else repo_root
+    orchestrator_root = get_orchestrator_root()
     config_loader = ConfigLoader(orchestrator_root)
     config = config_loader.load()
 
@@ -74,16 +269,12 @@ def main(
     except GitDirtyError as err:
         status = get_git_status(repo_root)
         if json_output:
-            import json
-
-            console.print(
-                json.dumps(
-                    {
-                        "error": str(err),
-                        "git_clean": False,
-                        "dirty_files": status.dirty_files,
-                    }
-                )
+            emit_json(
+                {
+                    "error": str(err),
+                    "git_clean": False,
+                    "dirty_files": status.dirty_files,
+                }
             )
         else:
             console.print(f"[red]Error:[/red] {err}", style="bold")
@@ -106,8 +297,6 @@ def main(
     cutoff_timestamp = cutoff_date.timestamp()
 
     removed_files = []
-    removed_locks = []
-    bytes_freed = 0
 
     git_status = git_status or get_git_status(repo_root)
 
@@ -133,132 +322,44 @@ def main(
     if not json_output:
         console.print()
 
-    # 1. Clean stale locks
-    locks_dir = repo_root / "var" / "locks"
-    if locks_dir.exists():
-        for lock_file in locks_dir.glob("*.lock"):
-            try:
-                mtime = lock_file.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    size = lock_file.stat().st_size
-                    if not dry_run:
-                        lock_file.unlink()
-                    removed_locks.append(str(lock_file))
-                    bytes_freed += size
-            except Exception as e:
-                console.print(f"[yellow]Warning:[/yellow] Could not remove {lock_file}: {e}")
-
-    # 2. Clean old daily outputs
-    outputs_dir = repo_root / "data" / "outputs" / "daily"
-    if outputs_dir.exists():
-        for date_dir in outputs_dir.iterdir():
-            if date_dir.is_dir():
-                try:
-                    # Parse date from directory name
-                    dir_date = datetime.strptime(date_dir.name, "%Y-%m-%d")
-                    if dir_date < cutoff_date:
-                        # Calculate size
-                        dir_size = sum(
-                            f.stat().st_size for f in date_dir.rglob("*") if f.is_file()
-                        )
-                        if not dry_run:
-                            import shutil
-
-                            shutil.rmtree(date_dir)
-                        removed_files.append(str(date_dir))
-                        bytes_freed += dir_size
-                except ValueError:
-                    # Skip non-date directories
-                    pass
-                except Exception as e:
-                    console.print(
-                        f"[yellow]Warning:[/yellow] Could not remove {date_dir}: {e}"
-                    )
-
-    # 3. Clean old reports
-    reports_dir = repo_root / "data" / "reports"
-    if reports_dir.exists():
-        for report_file in reports_dir.glob("daily_report_*.md"):
-            try:
-                mtime = report_file.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    size = report_file.stat().st_size
-                    if not dry_run:
-                        report_file.unlink()
-                    removed_files.append(str(report_file))
-                    bytes_freed += size
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning:[/yellow] Could not remove {report_file}: {e}"
-                )
-
-    # 4. Clean old manifests
-    manifests_dir = repo_root / "data" / "manifests"
-    if manifests_dir.exists():
-        for manifest_file in manifests_dir.glob("*.json"):
-            try:
-                mtime = manifest_file.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    size = manifest_file.stat().st_size
-                    if not dry_run:
-                        manifest_file.unlink()
-                    removed_files.append(str(manifest_file))
-                    bytes_freed += size
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning:[/yellow] Could not remove {manifest_file}: {e}"
-                )
-
-    # 5. Clean old logs
-    for log_type in ["runs", "ledger"]:
-        log_dir = repo_root / "logs" / log_type
-        if log_dir.exists():
-            for log_file in log_dir.iterdir():
-                if log_file.is_file():
-                    try:
-                        mtime = log_file.stat().st_mtime
-                        if mtime < cutoff_timestamp:
-                            size = log_file.stat().st_size
-                            if not dry_run:
-                                log_file.unlink()
-                            removed_files.append(str(log_file))
-                            bytes_freed += size
-                    except Exception as e:
-                        console.print(
-                            f"[yellow]Warning:[/yellow] Could not remove {log_file}: {e}"
-                        )
-
-    # 6. Clean old dashboards
-    dashboards_dir = repo_root / "dashboards"
-    if dashboards_dir.exists():
-        for dashboard_file in dashboards_dir.glob("dashboard_*.html"):
-            try:
-                mtime = dashboard_file.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    size = dashboard_file.stat().st_size
-                    if not dry_run:
-                        dashboard_file.unlink()
-                    removed_files.append(str(dashboard_file))
-                    bytes_freed += size
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning:[/yellow] Could not remove {dashboard_file}: {e}"
-                )
+    # The passes touch disjoint directories, so run them concurrently; results
+    # are gathered in submission order to keep the report stable
+    file_passes = (
+        (repo_root / "data" / "reports", "daily_report_*.md"),
+        (repo_root / "data" / "manifests", "*.json"),
+        (repo_root / "logs" / "runs", "*"),
+        (repo_root / "logs" / "ledger", "*"),
+        (repo_root / "dashboards", "dashboard_*.html"),
+        (repo_root / "data" / "publishing", "*.json"),
+    )
+    with ThreadPoolExecutor(max_workers=2 + len(file_passes)) as executor:
+        # 1. Stale locks
+        locks_future = executor.submit(
+            _remove_expired_files,
+            repo_root / "var" / "locks",
+            "*.lock",
+            cutoff_timestamp,
+            dry_run,
+        )
+        # 2. Old daily outputs; 3-7. reports, manifests, logs, dashboards, publishing
+        futures = [
+            executor.submit(
+                _remove_expired_date_dirs,
+                repo_root / "data" / "outputs" / "daily",
+                cutoff_date,
+                dry_run,
+            )
+        ]
+        futures.extend(
+            executor.submit(_remove_expired_files, directory, pattern, cutoff_timestamp, dry_run)
+            for directory, pattern in file_passes
+        )
 
-    # 7. Clean old publishing artifacts
-    publishing_dir = repo_root / "data" / "publishing"
-    if publishing_dir.exists():
-        for pub_file in publishing_dir.glob("*.json"):
-            try:
-                mtime = pub_file.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    size = pub_file.stat().st_size
-                    if not dry_run:
-                        pub_file.unlink()
-                    removed_files.append(str(pub_file))
-                    bytes_freed += size
-            except Exception as e:
-                console.print(f"[yellow]Warning:[/yellow] Could not remove {pub_file}: {e}")
+        removed_locks, bytes_freed = locks_future.result()
+        for future in futures:
+            removed, freed = future.result()
+            removed_files.extend(removed)
+            bytes_freed += freed
 
     # Log to audit trail
     if not dry_run:
@@ -274,8 +375,6 @@ def main(
 
     # Display results
     if json_output:
-        import json
-
         result = {
             "files_removed": len(removed_files),
             "locks_removed": len(removed_locks),
@@ -285,19 +384,28 @@ def main(
             "dirty_files": git_status.dirty_files,
             "cloudflare_deploy_id": cloudflare_deploy_id,
         }
-        console.print(json.dumps(result))
+        emit_json(result)
     else:
         console.print("[bold]Cleanup Summary[/bold]\n")
 
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right")
+        space_freed = f"{bytes_freed / 1024 / 1024:.2f} MB"
+        # Plain lines when output is not a terminal
+        if sys.stdout.isatty():
+            from rich.table import Table
 
-        table.add_row("Files Removed", str(len(removed_files)))
-        table.add_row("Locks Removed", str(len(removed_locks)))
-        table.add_row("Space Freed", f"{bytes_freed / 1024 / 1024:.2f} MB")
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", justify="right")
 
-        console.print(table)
+            table.add_row("Files Removed", str(len(removed_files)))
+            table.add_row("Locks Removed", str(len(removed_locks)))
+            table.add_row("Space Freed", space_freed)
+
+            console.print(table)
+        else:
+            print(f"Files Removed: {len(removed_files)}")
+            print(f"Locks Removed: {len(removed_locks)}")
+            print(f"Space Freed: {space_freed}")
 
         if dry_run:
             console.print(
@@ -1,16 +1,59 @@
 """Compare command - Parity harness for Bash vs Python outputs."""
 
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from adapters.filesystem import compute_file_hash
+from nh_cli.utils.console import get_console
+from nh_cli.utils.json_output import emit_json
+from nh_cli.utils.paths import get_repo_root, scan_parent_dirs
+
+# The filesystem adapter and Rich are imported where they are used so that
+# loading this module stays cheap
 
 app = typer.Typer()
-console = Console()
+
+# Per-day artifacts as (path template relative to repo root, python_only)
+_ARTIFACT_SPECS = (
+    ("data/reports/daily_report_{date}.md", False),
+    ("data/publishing/tags_{date}.json", False),
+    ("dashboards/dashboard_{date}.html", False),
+    ("data/publishing/{date}.json", False),
+    ("data/manifests/{date}.json", True),  # Python-only artifact
+)
+
+
+def _check_artifact(
+    path: Path, size: Optional[int], repo_prefix: str, python_only: bool
+) -> Optional[dict]:
+    """Hash a single artifact for the parity report.
+
+    Args:
+        path: Artifact path
+        size: File size from the directory scan, or None if the file does not exist
+        repo_prefix: Repository root plus separator, stripped to form relative paths
+        python_only: Whether the artifact is only produced by the Python orchestrator
+
+    Returns:
+        Result entry for the report, or None if the file does not exist
+    """
+    from adapters.filesystem import compute_file_hash
+
+    if size is None:
+        return None
+
+    result = {"path": str(path).removeprefix(repo_prefix)}
+    try:
+        result.update(exists=True, hash=compute_file_hash(path), size=size)
+    except Exception as e:
+        result.update(exists=False, error=str(e))
+    if python_only:
+        result["python_only"] = True
+    return result
 
 
 @app.command()
@@ -41,6 +84,10 @@ def main(
 
         nh compare 2025-11-14 --bash-manifest path  # Compare with manifest
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    console = get_console()
+
     # Validate date format
     try:
         datetime.strptime(date, "%Y-%m-%d")
@@ -50,179 +97,64 @@ def main(
         raise typer.Exit(code=10)
 
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Display header
     if not json_output:
         console.print(f"\n[bold cyan]NeuroHelix Parity Check[/bold cyan]")
         console.print(f"Date: {date}\n")
 
-    # Paths to check
-    outputs_dir = repo_root / "data" / "outputs" / "daily" / date
-    report_file = repo_root / "data" / "reports" / f"daily_report_{date}.md"
-    tags_file = repo_root / "data" / "publishing" / f"tags_{date}.json"
-    dashboard_file = repo_root / "dashboards" / f"dashboard_{date}.html"
-    export_file = repo_root / "data" / "publishing" / f"{date}.json"
-    manifest_file = repo_root / "data" / "manifests" / f"{date}.json"
-
-    # Check file existence and compute hashes
-    results = []
+    # Collect (path, python_only, size) triples: prompt outputs first, then fixed
+    # artifacts. Sizes come from directory scans; None marks a missing file.
+    artifacts: list[tuple[Path, bool, Optional[int]]] = []
     missing_files = []
-    total_files = 0
-
-    # 1. Check daily outputs (22 prompt files expected)
-    if outputs_dir.exists():
-        for prompt_file in outputs_dir.glob("*.md"):
-            total_files += 1
-            try:
-                file_hash = compute_file_hash(prompt_file)
-                results.append(
-                    {
-                        "path": str(prompt_file.relative_to(repo_root)),
-                        "exists": True,
-                        "hash": file_hash,
-                        "size": prompt_file.stat().st_size,
-                    }
-                )
-            except Exception as e:
-                results.append(
-                    {
-                        "path": str(prompt_file.relative_to(repo_root)),
-                        "exists": False,
-                        "error": str(e),
-                    }
-                )
-                missing_files.append(str(prompt_file.relative_to(repo_root)))
-    else:
-        missing_files.append(f"data/outputs/daily/{date}/")
 
-    # 2. Check report
-    total_files += 1
-    if report_file.exists():
-        try:
-            file_hash = compute_file_hash(report_file)
-            results.append(
-                {
-                    "path": str(report_file.relative_to(repo_root)),
-                    "exists": True,
-                    "hash": file_hash,
-                    "size": report_file.stat().st_size,
-                }
-            )
-        except Exception as e:
-            results.append(
-                {
-                    "path": str(report_file.relative_to(repo_root)),
-                    "exists": False,
-                    "error": str(e),
-                }
-            )
-            missing_files.append(str(report_file.relative_to(repo_root)))
-    else:
-        missing_files.append(str(report_file.relative_to(repo_root)))
-
-    # 3. Check tags
-    total_files += 1
-    if tags_file.exists():
-        try:
-            file_hash = compute_file_hash(tags_file)
-            results.append(
-                {
-                    "path": str(tags_file.relative_to(repo_root)),
-                    "exists": True,
-                    "hash": file_hash,
-                    "size": tags_file.stat().st_size,
-                }
-            )
-        except Exception as e:
-            results.append(
-                {
-                    "path": str(tags_file.relative_to(repo_root)),
-                    "exists": False,
-                    "error": str(e),
-                }
-            )
-            missing_files.append(str(tags_file.relative_to(repo_root)))
-    else:
-        missing_files.append(str(tags_file.relative_to(repo_root)))
-
-    # 4. Check dashboard
-    total_files += 1
-    if dashboard_file.exists():
-        try:
-            file_hash = compute_file_hash(dashboard_file)
-            results.append(
-                {
-                    "path": str(dashboard_file.relative_to(repo_root)),
-                    "exists": True,
-                    "hash": file_hash,
-                    "size": dashboard_file.stat().st_size,
-                }
-            )
-        except Exception as e:
-            results.append(
-                {
-                    "path": str(dashboard_file.relative_to(repo_root)),
-                    "exists": False,
-                    "error": str(e),
-                }
-            )
-            missing_files.append(str(dashboard_file.relative_to(repo_root)))
-    else:
-        missing_files.append(str(dashboard_file.relative_to(repo_root)))
-
-    # 5. Check export
-    total_files += 1
-    if export_file.exists():
-        try:
-            file_hash = compute_file_hash(export_file)
-            results.append(
-                {
-                    "path": str(export_file.relative_to(repo_root)),
-                    "exists": True,
-                    "hash": file_hash,
-                    "size": export_file.stat().st_size,
-                }
-            )
-        except Exception as e:
-            results.append(
-                {
-                    "path": str(export_file.relative_to(repo_root)),
-                    "exists": False,
-                    "error": str(e),
-                }
-            )
-            missing_files.append(str(export_file.relative_to(repo_root)))
-    else:
-        missing_files.append(str(export_file.relative_to(repo_root)))
-
-    # 6. Check manifest (Python-only artifact)
-    if manifest_file.exists():
-        try:
-            file_hash = compute_file_hash(manifest_file)
-            results.append(
-                {
-                    "path": str(manifest_file.relative_to(repo_root)),
-                    "exists": True,
-                    "hash": file_hash,
-                    "size": manifest_file.stat().st_size,
-                    "python_only": True,
-                }
+    # 1. Daily outputs (22 prompt files expected)
+    outputs_dir = repo_root / "data" / "outputs" / "daily" / date
+    try:
+        with os.scandir(outputs_dir) as entries:
+            artifacts.extend(
+                (Path(entry.path), False, entry.stat().st_size)
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file()
             )
-        except Exception as e:
-            results.append(
-                {
-                    "path": str(manifest_file.relative_to(repo_root)),
-                    "exists": False,
-                    "error": str(e),
-                    "python_only": True,
-                }
+    except FileNotFoundError:
+        missing_files.append(f"data/outputs/daily/{date}/")
+
+    # 2-6. Report, tags, dashboard, export, manifest; one scan per parent directory
+    fixed = [
+        (repo_root / template.format(date=date), python_only)
+        for template, python_only in _ARTIFACT_SPECS
+    ]
+    listings = scan_parent_dirs(path for path, _ in fixed)
+    for path, python_only in fixed:
+        entry = listings[path.parent].get(path.name)
+        size = entry.stat().st_size if entry is not None and entry.is_file() else None
+        artifacts.append((path, python_only, size))
+
+    repo_prefix = f"{repo_root}{os.sep}"
+    total_files = sum(1 for _, python_only, _ in artifacts if not python_only)
+
+    # Hash files concurrently; map() keeps results in artifact order
+    with ThreadPoolExecutor(max_workers=min(16, len(artifacts))) as executor:
+        checked = list(
+            executor.map(
+                lambda item: _check_artifact(item[0], item[2], repo_prefix, item[1]),
+                artifacts,
             )
+        )
+
+    results = []
+    for (path, python_only, _), result in zip(artifacts, checked):
+        if result is not None:
+            results.append(result)
+        if python_only:
+            continue
+        if result is None or not result["exists"]:
+            missing_files.append(str(path).removeprefix(repo_prefix))
 
     # Display results
     if json_output:
-        import json
-
         output = {
             "date": date,
             "total_files": total_files,
@@ -231,29 +163,37 @@ def main(
             "missing_files": missing_files,
             "results": results,
         }
-        console.print(json.dumps(output, indent=2))
+        emit_json(output, indent=2)
     else:
-        # Summary table
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", justify="right")
-
         files_found = len([r for r in results if r.get("exists", False)])
-        table.add_row("Total Files Checked", str(total_files))
-        table.add_row(
-            "Files Found",
-            f"[green]{files_found}[/green]"
-            if files_found == total_files
-            else f"[red]{files_found}[/red]",
-        )
-        table.add_row(
-            "Files Missing",
-            f"[red]{len(missing_files)}[/red]"
-            if missing_files
-            else "[green]0[/green]",
-        )
 
-        console.print(table)
+        # Summary table; plain lines when output is not a terminal
+        if sys.stdout.isatty():
+            from rich.table import Table
+
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", justify="right")
+
+            table.add_row("Total Files Checked", str(total_files))
+            table.add_row(
+                "Files Found",
+                f"[green]{files_found}[/green]"
+                if files_found == total_files
+                else f"[red]{files_found}[/red]",
+            )
+            table.add_row(
+                "Files Missing",
+                f"[red]{len(missing_files)}[/red]"
+                if missing_files
+                else "[green]0[/green]",
+            )
+
+            console.print(table)
+        else:
+            print(f"Total Files Checked: {total_files}")
+            print(f"Files Found: {files_found}")
+            print(f"Files Missing: {len(missing_files)}")
 
         # Show missing files
         if missing_files:
@@ -1,15 +1,17 @@
 """Config command - Manage .env-based configuration."""
 
-from pathlib import Path
-
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from config.toml_config import ConfigLoader, get_config
+from nh_cli.utils.console import get_console
+from nh_cli.utils.paths import get_config_cache_path, get_repo_root
+
+# Config loading and Rich are imported inside each command so that loading
+# this module (which `nh` does for every subcommand) stays cheap
 
 app = typer.Typer()
-console = Console()
+
+# NHConfig sections exposed through `nh config get`
+_GETTABLE_SECTIONS = ("orchestrator", "paths", "registry", "cloudflare")
 
 
 @app.command("init")
@@ -22,8 +24,12 @@ def init(
     ),
 ):
     """Initialize a new .env.local configuration file with sample values."""
+    from config.toml_config import ConfigLoader
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
     orchestrator_root = repo_root / "orchestrator"
 
     config_loader = ConfigLoader(orchestrator_root)
@@ -56,59 +62,59 @@ def show(
     ),
 ):
     """Show current configuration resolved from .env files and env vars."""
+    from config.toml_config import ConfigLoader, load_cached_config
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
     orchestrator_root = repo_root / "orchestrator"
 
     try:
-        config = get_config(orchestrator_root)
-
-        console.print("\n[bold]Current Configuration[/bold]\n")
-
-        # Orchestrator settings
-        console.print("[cyan]Orchestrator:[/cyan]")
-        console.print(f"  default_model: {config.orchestrator.default_model}")
-        console.print(f"  max_parallel_jobs: {config.orchestrator.max_parallel_jobs}")
-        console.print(
-            f"  enable_rate_limiting: {config.orchestrator.enable_rate_limiting}"
-        )
-        console.print(f"  approval_mode: {config.orchestrator.approval_mode}")
-
-        # Paths
-        console.print("\n[cyan]Paths:[/cyan]")
-        console.print(f"  repo_root: {config.paths.repo_root or '(default: cwd)'}")
-        console.print(f"  data_dir: {config.paths.data_dir or '(default: data/)'}")
-        console.print(f"  logs_dir: {config.paths.logs_dir or '(default: logs/)'}")
-
-        # Registry
-        console.print("\n[cyan]Registry:[/cyan]")
-        console.print(f"  backend: {config.registry.backend}")
-        console.print(f"  sqlite_path: {config.registry.sqlite_path}")
-        console.print(f"  tsv_path: {config.registry.tsv_path}")
-
-        # Cloudflare
-        console.print("\n[cyan]Cloudflare:[/cyan]")
-        console.print(
-            f"  api_token: {'(set)' if config.cloudflare.api_token else '(not set)'}"
-        )
-        console.print(
-            f"  account_id: {config.cloudflare.account_id or '(not set)'}"
-        )
-        console.print(f"  project_name: {config.cloudflare.project_name}")
+        config = load_cached_config(orchestrator_root, get_config_cache_path())
 
-        # Show config file location
         config_loader = ConfigLoader(orchestrator_root)
-        console.print(f"\n[dim]Primary .env file: {config_loader.config_path}[/dim]")
+
+        # Build the whole report and render it with a single print
+        lines = [
+            "\n[bold]Current Configuration[/bold]\n",
+            # Orchestrator settings
+            "[cyan]Orchestrator:[/cyan]",
+            f"  default_model: {config.orchestrator.default_model}",
+            f"  max_parallel_jobs: {config.orchestrator.max_parallel_jobs}",
+            f"  enable_rate_limiting: {config.orchestrator.enable_rate_limiting}",
+            f"  approval_mode: {config.orchestrator.approval_mode}",
+            # Paths
+            "\n[cyan]Paths:[/cyan]",
+            f"  repo_root: {config.paths.repo_root or '(default: cwd)'}",
+            f"  data_dir: {config.paths.data_dir or '(default: data/)'}",
+            f"  logs_dir: {config.paths.logs_dir or '(default: logs/)'}",
+            # Registry
+            "\n[cyan]Registry:[/cyan]",
+            f"  backend: {config.registry.backend}",
+            f"  sqlite_path: {config.registry.sqlite_path}",
+            f"  tsv_path: {config.registry.tsv_path}",
+            # Cloudflare
+            "\n[cyan]Cloudflare:[/cyan]",
+            f"  api_token: {'(set)' if config.cloudflare.api_token else '(not set)'}",
+            f"  account_id: {config.cloudflare.account_id or '(not set)'}",
+            f"  project_name: {config.cloudflare.project_name}",
+            # Show config file location
+            f"\n[dim]Primary .env file: {config_loader.config_path}[/dim]",
+        ]
         if config_loader.config_path.exists():
-            console.print("[dim]Status: Loaded from .env stack[/dim]")
+            lines.append("[dim]Status: Loaded from .env stack[/dim]")
         else:
-            console.print("[dim]Status: Using defaults + environment variables[/dim]")
+            lines.append("[dim]Status: Using defaults + environment variables[/dim]")
 
         if config_loader.legacy_config_path.exists():
-            console.print(
-                f"[yellow]Warning:[/yellow] Legacy file detected: {config_loader.legacy_config_path}"
+            lines.append(
+                "[yellow]Warning:[/yellow] Legacy file detected: "
+                f"{config_loader.legacy_config_path}"
             )
-            console.print("  Values from .nh.toml will be removed in a future release.")
+            lines.append("  Values from .nh.toml will be removed in a future release.")
+
+        console.print("\n".join(lines))
 
     except Exception as e:
         console.print(f"[red]Error:[/red] Failed to load config: {e}")
@@ -118,8 +124,12 @@ def show(
 @app.command("validate")
 def validate():
     """Validate active configuration regardless of source (.env or env vars)."""
+    from config.toml_config import ConfigLoader
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
     orchestrator_root = repo_root / "orchestrator"
 
     config_loader = ConfigLoader(orchestrator_root)
@@ -185,12 +195,16 @@ def get_value(
 
         nh config get registry.backend
     """
+    from config.toml_config import load_cached_config
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
     orchestrator_root = repo_root / "orchestrator"
 
     try:
-        config = get_config(orchestrator_root)
+        config = load_cached_config(orchestrator_root, get_config_cache_path())
 
         # Parse key
         parts = key.split(".")
@@ -202,18 +216,11 @@ def get_value(
         section, field = parts
 
         # Get value
-        if section == "orchestrator":
-            value = getattr(config.orchestrator, field, None)
-        elif section == "paths":
-            value = getattr(config.paths, field, None)
-        elif section == "registry":
-            value = getattr(config.registry, field, None)
-        elif section == "cloudflare":
-            value = getattr(config.cloudflare, field, None)
-        else:
+        if section not in _GETTABLE_SECTIONS:
             console.print(f"[red]Error:[/red] Unknown section: {section}")
-            console.print("Valid sections: orchestrator, paths, registry, cloudflare")
+            console.print(f"Valid sections: {', '.join(_GETTABLE_SECTIONS)}")
             raise typer.Exit(code=10)
+        value = getattr(getattr(config, section), field, None)
 
         if value is None:
             console.print(f"[yellow]Warning:[/yellow] {key} is not set")
@@ -1,6 +1,5 @@
 """Diagnostics command - System status and environment check."""
 
-import json
 import os
 import shutil
 import subprocess
@@ -8,11 +7,53 @@ import sys
 from pathlib import Path
 
 import typer
-from rich.console import Console
-from rich.table import Table
+
+from nh_cli.utils.console import get_console
+from nh_cli.utils.json_output import emit_json
+from nh_cli.utils.paths import get_repo_root, scan_parent_dirs
+
+# Rich is imported inside main() so that loading this module (which `nh` does
+# for every subcommand) stays cheap
 
 app = typer.Typer()
-console = Console()
+
+
+def _probe_binary(binary: str, check_version: bool = True) -> dict:
+    """Locate a binary on PATH and optionally query its version.
+
+    Args:
+        binary: Executable name
+        check_version: Whether to run ``<binary> --version``
+
+    Returns:
+        Status entry with availability, path and (if checked) version
+    """
+    path = shutil.which(binary)
+    if not path:
+        return {"available": False}
+    if not check_version:
+        return {"available": True, "path": path}
+
+    # Get version; exec the resolved path so the spawn does not search PATH again
+    try:
+        result = subprocess.run(
+            [path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode != 0:
+            version = "unknown"
+        elif binary == "gemini":
+            version = result.stdout.strip()
+        elif binary == "git":
+            version = result.stdout.strip().split()[-1]
+        else:
+            version = result.stdout.strip().split()[0]
+    except Exception:
+        version = "unknown"
+
+    return {"available": True, "path": path, "version": version}
 
 
 @app.command()
@@ -22,6 +63,11 @@ def main(
         "--json",
         help="Output as JSON",
     ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Only check binary availability; skip --version probes",
+    ),
 ):
     """Print diagnostics and system status.
 
@@ -33,7 +79,13 @@ def main(
         nh diag            # Human-readable output
 
         nh diag --json     # JSON output for scripting
+
+        nh diag --json --fast  # Availability only, no subprocesses
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    console = get_console()
+
     diagnostics = {}
 
     # Python version
@@ -41,43 +93,13 @@ def main(
 
     # Check for required binaries
     binaries = ["gemini", "pnpm", "wrangler", "git"]
-    binary_status = {}
-
-    for binary in binaries:
-        path = shutil.which(binary)
-        if path:
-            # Get version
-            try:
-                if binary == "gemini":
-                    result = subprocess.run(
-                        [binary, "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    version = result.stdout.strip() if result.returncode == 0 else "unknown"
-                elif binary == "git":
-                    result = subprocess.run(
-                        [binary, "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    version = result.stdout.strip().split()[-1] if result.returncode == 0 else "unknown"
-                else:
-                    result = subprocess.run(
-                        [binary, "--version"],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                    version = result.stdout.strip().split()[0] if result.returncode == 0 else "unknown"
-            except Exception:
-                version = "unknown"
-
-            binary_status[binary] = {"available": True, "path": path, "version": version}
-        else:
-            binary_status[binary] = {"available": False}
+
+    if fast:
+        binary_status = {binary: _probe_binary(binary, check_version=False) for binary in binaries}
+    else:
+        # Probes are independent subprocess waits; map() keeps display order
+        with ThreadPoolExecutor(max_workers=len(binaries)) as executor:
+            binary_status = dict(zip(binaries, executor.map(_probe_binary, binaries)))
 
     diagnostics["binaries"] = binary_status
 
@@ -95,7 +117,7 @@ def main(
     diagnostics["environment"] = env_status
 
     # Directory permissions
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
     directories = [
         repo_root / "data" / "outputs",
         repo_root / "data" / "reports",
@@ -105,9 +127,12 @@ def main(
         repo_root / "var" / "locks",
     ]
 
+    # One listing per parent; access() is only probed for directories that exist
+    listings = scan_parent_dirs(directories)
     dir_status = {}
     for directory in directories:
-        exists = directory.exists()
+        entry = listings[directory.parent].get(directory.name)
+        exists = entry is not None and entry.is_dir()
         writable = os.access(directory, os.W_OK) if exists else False
         dir_status[str(directory)] = {"exists": exists, "writable": writable}
 
@@ -115,8 +140,10 @@ def main(
 
     # Output
     if json_output:
-        console.print(json.dumps(diagnostics, indent=2))
+        emit_json(diagnostics, indent=2)
     else:
+        from rich.table import Table
+
         console.print("\n[bold]NeuroHelix Diagnostics[/bold]\n")
 
         # Python
@@ -134,7 +161,7 @@ def main(
                 table.add_row(
                     binary,
                     "[green]✓[/green]",
-                    status.get("version", "unknown"),
+                    status.get("version", "not checked"),
                 )
             else:
                 table.add_row(binary, "[red]✗[/red]", "not found")
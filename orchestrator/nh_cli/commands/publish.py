@@ -1,17 +1,85 @@
 """Publish command - Trigger export and Cloudflare deploy."""
 
+import os
+import re
 import subprocess
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 import typer
-from rich.console import Console
 
-from services.audit import AuditService
+from nh_cli.utils.console import get_console
+from nh_cli.utils.paths import get_repo_root
+
+# The audit service and Rich are imported inside main() so that loading this
+# module (which `nh` does for every subcommand) stays cheap
 
 app = typer.Typer()
-console = Console()
+
+# Dates are given as YYYY-MM-DD
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+# Cloudflare Pages deploy URL as printed by wrangler; matched against raw log bytes
+_PAGES_DEV_RE = re.compile(rb"https://\S+\.pages\.dev\S*")
+
+# wrangler prints the deploy URL at the end of a run, so only the log tail is read
+_LOG_TAIL_BYTES = 64 * 1024
+
+
+def _latest_publish_log(log_dir: Path) -> Optional[str]:
+    """Find the most recently modified publish log.
+
+    Args:
+        log_dir: Directory containing publish_*.log files
+
+    Returns:
+        Path of the newest log, or None if the directory is missing or empty
+    """
+    try:
+        with os.scandir(log_dir) as entries:
+            latest = max(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.startswith("publish_") and entry.name.endswith(".log")
+                ),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return latest.path if latest is not None else None
+
+
+def _run_publish_script(publish_script: Path, repo_root: Path) -> tuple[int, Optional[str]]:
+    """Run the publish script, echoing its stdout and watching for the deploy URL.
+
+    Output is passed through line by line as it arrives; stderr is inherited.
+
+    Args:
+        publish_script: Script to execute
+        repo_root: Working directory for the script
+
+    Returns:
+        Tuple of (exit code, last deploy URL printed or None)
+    """
+    deploy_url = None
+    out = sys.stdout.buffer
+    sys.stdout.flush()  # Keep ordering with text already written
+    with subprocess.Popen(
+        [str(publish_script)], cwd=str(repo_root), stdout=subprocess.PIPE
+    ) as proc:
+        for line in proc.stdout:
+            out.write(line)
+            out.flush()
+            if b"pages.dev" in line:
+                match = _PAGES_DEV_RE.search(line)
+                if match:
+                    deploy_url = match.group(0).decode(errors="replace")
+    return proc.returncode, deploy_url
 
 
 @app.command()
@@ -34,16 +102,23 @@ def main(
 
         nh publish 2025-11-14 --skip-build # Deploy only
     """
-    # Validate date format
+    from services.audit import AuditService
+
+    console = get_console()
+
+    # Validate date format; the datetime() call range-checks month and day
+    match = _DATE_RE.fullmatch(date)
     try:
-        datetime.strptime(date, "%Y-%m-%d")
+        if match is None:
+            raise ValueError(date)
+        datetime(int(match[1]), int(match[2]), int(match[3]))
     except ValueError:
         console.print(f"[red]Error:[/red] Invalid date format: {date}", style="bold")
         console.print("Expected format: YYYY-MM-DD")
         raise typer.Exit(code=10)
 
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Verify export JSON exists
     export_json = repo_root / "data" / "publishing" / f"{date}.json"
@@ -84,39 +159,35 @@ def main(
 
         console.print(f"[dim]Running: {publish_script}[/dim]\n")
 
-        # Execute script
-        result = subprocess.run(
-            [str(publish_script)],
-            cwd=str(repo_root),
-            capture_output=False,
-            text=True,
-        )
+        # Execute script, picking the deploy URL out of its output as it streams
+        returncode, deploy_url = _run_publish_script(publish_script, repo_root)
 
-        success = result.returncode == 0
+        success = returncode == 0
 
         if success:
             console.print("\n[green]✓[/green] Publish completed successfully")
-            # Try to parse deploy URL from logs if available
-            log_dir = repo_root / "logs" / "publishing"
-            if log_dir.exists():
-                latest_log = max(log_dir.glob("publish_*.log"), default=None, key=lambda p: p.stat().st_mtime)
-                if latest_log:
-                    with open(latest_log) as f:
-                        for line in f:
-                            if "https://" in line and "pages.dev" in line:
-                                # Extract URL from line
-                                import re
-                                match = re.search(r'https://[^\s]+\.pages\.dev[^\s]*', line)
-                                if match:
-                                    deploy_url = match.group(0)
-                                    break
+            # Fall back to the publish log if the URL was not echoed to stdout
+            latest_log = (
+                _latest_publish_log(repo_root / "logs" / "publishing")
+                if deploy_url is None
+                else None
+            )
+            if latest_log:
+                with open(latest_log, "rb") as f:
+                    size = os.fstat(f.fileno()).st_size
+                    f.seek(max(0, size - _LOG_TAIL_BYTES))
+                    tail = f.read()
+                # Last URL in the tail is the most recent deploy
+                urls = _PAGES_DEV_RE.findall(tail)
+                if urls:
+                    deploy_url = urls[-1].decode(errors="replace")
 
             if deploy_url:
                 console.print(f"Deploy URL: {deploy_url}")
 
         else:
             console.print(
-                f"\n[red]✗[/red] Publish failed with exit code {result.returncode}"
+                f"\n[red]✗[/red] Publish failed with exit code {returncode}"
             )
 
         # Log to audit trail
@@ -125,7 +196,7 @@ def main(
             date=date, deploy_url=deploy_url, success=success, duration_seconds=duration
         )
 
-        raise typer.Exit(code=result.returncode)
+        raise typer.Exit(code=returncode)
 
     except FileNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}", style="bold")
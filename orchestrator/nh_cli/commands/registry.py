@@ -1,17 +1,17 @@
 """Registry command - Validate and inspect prompt registry."""
 
-from pathlib import Path
+import sys
+from collections import Counter
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from services.registry import get_registry_provider
-from services.sqlite_registry import migrate_tsv_to_sqlite, SQLiteRegistryProvider
-from config.toml_config import ConfigLoader
+from nh_cli.utils.console import get_console
+from nh_cli.utils.paths import get_config_cache_path, get_repo_root
+
+# Registry providers, config loading and Rich are imported inside each command
+# so that loading this module (which `nh` does for every subcommand) stays cheap
 
 app = typer.Typer()
-console = Console()
 
 
 @app.command("validate")
@@ -34,8 +34,12 @@ def validate(
 
         nh registry validate --format tsv # Explicit format
     """
+    from services.registry import get_registry_provider
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Get registry path
     if format_type == "tsv":
@@ -59,25 +63,27 @@ def validate(
         console.print(f"Prompts loaded: {len(prompts)}\n")
 
         # Validate
-        is_valid, errors = provider.validate()
+        is_valid, errors = provider.validate(prompts)
 
         if is_valid:
             console.print("[green]✓[/green] Registry is valid\n")
 
-            # Display summary
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("Wave", style="cyan")
-            table.add_column("Prompts", justify="right")
-
-            waves = {}
-            for prompt in prompts:
-                wave = prompt.wave.value
-                waves[wave] = waves.get(wave, 0) + 1
-
-            for wave, count in sorted(waves.items()):
-                table.add_row(wave, str(count))
-
-            console.print(table)
+            waves = Counter(prompt.wave.value for prompt in prompts)
+
+            # Display summary; plain lines when output is not a terminal
+            if sys.stdout.isatty():
+                from rich.table import Table
+
+                table = Table(show_header=True, header_style="bold magenta")
+                table.add_column("Wave", style="cyan")
+                table.add_column("Prompts", justify="right")
+                for wave, count in sorted(waves.items()):
+                    table.add_row(wave, str(count))
+                console.print(table)
+            else:
+                sys.stdout.write(
+                    "".join(f"{wave}\t{count}\n" for wave, count in sorted(waves.items()))
+                )
         else:
             console.print("[red]✗[/red] Registry validation failed:\n")
             for error in errors:
@@ -122,8 +128,12 @@ def migrate(
 
         nh registry migrate --force                   # Overwrite existing DB
     """
+    from services.sqlite_registry import migrate_tsv_to_sqlite
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Resolve paths
     input_path = repo_root / "orchestrator" / input_tsv
@@ -185,11 +195,18 @@ def list_prompts(
 
         nh registry list --backend sqlite   # Use SQLite backend
     """
+    from config.toml_config import get_config_loader, load_cached_config
+    from services.registry import get_registry_provider
+
+    console = get_console()
+
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
     # Load config to determine backend
-    config_loader = ConfigLoader(repo_root / "orchestrator")
+    orchestrator_root = repo_root / "orchestrator"
+    load_cached_config(orchestrator_root, get_config_cache_path())
+    config_loader = get_config_loader(orchestrator_root)
 
     if backend is None:
         backend = config_loader.get_registry_backend()
@@ -215,7 +232,19 @@ def list_prompts(
             wave_type = WaveType(wave)
             prompts = [p for p in prompts if p.wave == wave_type]
 
+        rows = [
+            (p.prompt_id, p.title, p.wave.value, p.model, p.concurrency_class.value)
+            for p in prompts
+        ]
+
+        # Tab-separated rows when output is not a terminal (pipes, CI)
+        if not sys.stdout.isatty():
+            sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+            return
+
         # Display table
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Title", style="white")
@@ -223,14 +252,8 @@ def list_prompts(
         table.add_column("Model", style="green")
         table.add_column("Concurrency", style="blue")
 
-        for prompt in prompts:
-            table.add_row(
-                prompt.prompt_id,
-                prompt.title,
-                prompt.wave.value,
-                prompt.model,
-                prompt.concurrency_class.value,
-            )
+        for row in rows:
+            table.add_row(*row)
 
         console.print(f"\n[bold]Registry: {backend.upper()}[/bold]")
         console.print(f"Total prompts: {len(prompts)}\n")
@@ -5,17 +5,25 @@ import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
-from getpass import getuser
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import List, Optional
 
 import typer
-from rich.console import Console
 
-from config.toml_config import ConfigLoader
+from nh_cli.utils.console import get_console
 from nh_cli.utils.default_command_group import create_default_command_group
-from services.audit import AuditService
-from services.git_safety import GitDirtyError, ensure_clean_repo, get_git_status
+from nh_cli.utils.operator import get_current_operator
+from nh_cli.utils.paths import (
+    get_config_cache_path,
+    get_orchestrator_root,
+    get_repo_root,
+    path_present,
+    scan_parent_dirs,
+)
+
+# Config loading, git and audit services are imported inside main() so that
+# `nh reprocess --help` stays cheap
 
 
 @dataclass
@@ -23,6 +31,8 @@ class CleanupTarget:
     label: str
     path: Path
     is_glob: bool = False
+    # Matching directory entries, filled in once by _resolve_targets()
+    resolved: Optional[List[os.DirEntry]] = None
 
 
 @dataclass
@@ -32,7 +42,6 @@ class CleanupSummary:
 
 
 app = typer.Typer(cls=create_default_command_group("main"))
-console = Console()
 
 
 def _relative_to_repo(path: Path, repo_root: Path) -> str:
@@ -81,23 +90,48 @@ def _build_cleanup_targets(repo_root: Path, date: str) -> List[CleanupTarget]:
     return base_targets + glob_targets
 
 
+def _resolve_targets(targets: List[CleanupTarget]) -> None:
+    """Match every target against its parent directory listing.
+
+    Each parent is listed once, and the plan and the cleanup both use the
+    result, so they agree on the set of files even if the directory changes.
+
+    Args:
+        targets: Cleanup targets; their ``resolved`` field is set in place
+    """
+    listings = scan_parent_dirs(target.path for target in targets)
+
+    for target in targets:
+        entries = listings[target.path.parent]
+        if target.is_glob:
+            target.resolved = [
+                entry for name, entry in entries.items() if fnmatchcase(name, target.path.name)
+            ]
+        else:
+            entry = entries.get(target.path.name)
+            target.resolved = [entry] if entry is not None else []
+
+
 def _print_cleanup_plan(repo_root: Path, targets: List[CleanupTarget]) -> None:
+    console = get_console()
     console.print("[bold]Cleanup plan[/bold]")
     if not targets:
         console.print("  [dim]No cleanup targets defined.[/dim]")
         console.print()
         return
 
+    if any(target.resolved is None for target in targets):
+        _resolve_targets(targets)
+
     for target in targets:
         rel = _relative_to_repo(target.path, repo_root)
         if target.is_glob:
-            matches = list(target.path.parent.glob(target.path.name))
-            if matches:
-                console.print(f"  - {rel} ({len(matches)} file(s))")
+            if target.resolved:
+                console.print(f"  - {rel} ({len(target.resolved)} file(s))")
             else:
                 console.print(f"  - {rel} [dim](no matches)[/dim]")
         else:
-            if target.path.exists():
+            if target.resolved:
                 console.print(f"  - {rel}")
             else:
                 console.print(f"  - {rel} [dim](not found)[/dim]")
@@ -109,52 +143,104 @@ def _execute_cleanup(
 ) -> CleanupSummary:
     summary = CleanupSummary()
 
-    for target in targets:
-        if target.is_glob:
-            matches = list(target.path.parent.glob(target.path.name))
-            if not matches:
-                summary.skipped += 1
-                continue
-            for match in matches:
-                if _handle_single_path(repo_root, match, dry_run):
-                    summary.touched += 1
-                else:
-                    summary.skipped += 1
-            continue
+    if any(target.resolved is None for target in targets):
+        _resolve_targets(targets)
 
-        if not target.path.exists():
+    for target in targets:
+        if not target.resolved:
             summary.skipped += 1
             continue
 
-        if _handle_single_path(repo_root, target.path, dry_run):
-            summary.touched += 1
-        else:
-            summary.skipped += 1
+        for match in target.resolved:
+            if _handle_single_path(repo_root, match, dry_run):
+                summary.touched += 1
+            else:
+                summary.skipped += 1
 
     return summary
 
 
-def _handle_single_path(repo_root: Path, path: Path, dry_run: bool) -> bool:
-    if not path.exists():
-        return False
-
+def _handle_single_path(repo_root: Path, entry: os.DirEntry, dry_run: bool) -> bool:
+    console = get_console()
+    path = Path(entry.path)
     rel = _relative_to_repo(path, repo_root)
     if dry_run:
         console.print(f"[yellow][DRY RUN][/yellow] Would remove {rel}")
         return True
 
     try:
-        if path.is_dir():
+        # DirEntry caches the type from the listing; symlinks are unlinked, not followed
+        if entry.is_dir(follow_symlinks=False):
             shutil.rmtree(path)
         else:
-            path.unlink()
+            os.unlink(path)
         console.print(f"[green]Removed[/green] {rel}")
         return True
+    except FileNotFoundError:
+        return False  # Removed since the directory was listed
     except Exception as exc:  # pragma: no cover - defensive logging
         console.print(f"[red]Error:[/red] Failed to remove {rel}: {exc}")
         raise typer.Exit(code=30) from exc
 
 
+def _run_in_process(date: str, force: Optional[str], overrides: dict[str, str]) -> int:
+    """Run the pipeline through run.main in this process.
+
+    Avoids starting a second interpreter and re-importing the CLI stack.
+
+    Args:
+        date: Date to rerun
+        force: Prompt ID or wave name to force, if any
+        overrides: Environment variables set for the duration of the run
+
+    Returns:
+        Exit code reported by the run command
+    """
+    from nh_cli.commands import run as run_cmd
+
+    saved = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        run_cmd.main(date=date, wave=None, force=force, dry_run=False, json_output=False)
+    except typer.Exit as exc:
+        return exc.exit_code
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    return 0
+
+
+def _run_subprocess(cmd: List[str], overrides: dict[str, str]) -> int:
+    """Run the pipeline as a separate `nh run` process.
+
+    Args:
+        cmd: Command line to execute
+        overrides: Environment variables added to the child environment
+
+    Returns:
+        Exit code of the child process
+    """
+    console = get_console()
+    env = {**os.environ, **overrides}
+    # Hand the child our terminal settings so its console skips detection.
+    # Rich treats any non-empty FORCE_COLOR as a terminal, so it is only set
+    # when we are on one.
+    env.setdefault("COLUMNS", str(console.width))
+    if console.is_terminal:
+        env.setdefault("FORCE_COLOR", "1")
+
+    try:
+        result = subprocess.run(cmd, check=False, env=env)
+    except FileNotFoundError:
+        console.print("[red]Error:[/red] 'nh' command not found", style="bold")
+        console.print("Make sure you're running from within the virtual environment")
+        raise typer.Exit(code=10)
+    return result.returncode
+
+
 @app.command()
 def main(
     date: str = typer.Argument(..., help="Date to reprocess (YYYY-MM-DD)"),
@@ -174,6 +260,11 @@ def main(
         "--allow-dirty",
         help="Allow reprocess even if git working tree is dirty",
     ),
+    use_subprocess: bool = typer.Option(
+        False,
+        "--subprocess",
+        help="Run the pipeline in a separate 'nh run' process",
+    ),
 ):
     """Rebuild artifacts for a past day.
 
@@ -187,7 +278,15 @@ def main(
         nh reprocess 2025-11-14 --force search # Force rerun search wave
 
         nh reprocess 2025-11-14 --dry-run      # Preview what would be rerun
+
+        nh reprocess 2025-11-14 --subprocess   # Run the pipeline as a child process
     """
+    from config.toml_config import load_cached_config
+    from services.audit import AuditService
+    from services.git_safety import GitDirtyError, ensure_clean_repo, get_git_status
+
+    console = get_console()
+
     # Validate date format
     try:
         datetime.strptime(date, "%Y-%m-%d")
@@ -197,11 +296,11 @@ def main(
         raise typer.Exit(code=10)
 
     # Get repo root
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
+    repo_root = get_repo_root()
 
-    orchestrator_root = repo_root / "orchestrator" if repo_root.name != "orchestrator" else repo_root
-    config_loader = ConfigLoader(orchestrator_root)
-    config = config_loader.load()
+    orchestrator_root = get_orchestrator_root()
+    # Shared with the delegated run, in process or through the on-disk cache
+    config = load_cached_config(orchestrator_root, get_config_cache_path())
 
     require_clean = config.maintenance.require_clean_git
     try:
@@ -219,7 +318,7 @@ def main(
     outputs_dir = repo_root / "data" / "outputs" / "daily" / date
     manifest_path = repo_root / "data" / "manifests" / f"{date}.json"
 
-    if not outputs_dir.exists() and not manifest_path.exists():
+    if not path_present(outputs_dir) and not path_present(manifest_path):
         console.print(
             f"[red]Error:[/red] No existing data found for {date}", style="bold"
         )
@@ -241,6 +340,7 @@ def main(
     console.print()
 
     cleanup_targets = _build_cleanup_targets(repo_root, date)
+    _resolve_targets(cleanup_targets)
     _print_cleanup_plan(repo_root, cleanup_targets)
     cleanup_summary = _execute_cleanup(repo_root, cleanup_targets, dry_run=dry_run)
 
@@ -269,35 +369,30 @@ def main(
     if force:
         cmd.extend(["--force", force])
 
-    env = os.environ.copy()
-    env["RUN_MODE"] = "manual_override"
-    env["MANUAL_OVERRIDE_OPERATOR"] = (
-        os.environ.get("USER") or os.environ.get("LOGNAME") or getuser()
-    )
-    env["MANUAL_OVERRIDE_REASON"] = "force reprocess"
-    env["MANUAL_OVERRIDE_DATE"] = date
+    overrides = {
+        "RUN_MODE": "manual_override",
+        "MANUAL_OVERRIDE_OPERATOR": get_current_operator(),
+        "MANUAL_OVERRIDE_REASON": "force reprocess",
+        "MANUAL_OVERRIDE_DATE": date,
+    }
 
     # Show command
     console.print(f"[dim]Delegating to: {' '.join(cmd)}[/dim]\n")
 
-    # Execute via nh run
-    try:
-        result = subprocess.run(cmd, check=False, env=env)
+    if use_subprocess:
+        returncode = _run_subprocess(cmd, overrides)
+    else:
+        returncode = _run_in_process(date, force, overrides)
 
-        # Log to audit trail (only if not dry run)
-        if not dry_run and result.returncode == 0:
-            # We don't know which files were regenerated without reading ledger
-            # So we just log that reprocess was successful
-            audit_service.log_reprocess(
-                date=date,
-                forced_items=forced_items,
-                regenerated_files=[],  # Would need to parse ledger to get this
-                dry_run=dry_run,
-            )
-
-        raise typer.Exit(code=result.returncode)
+    # Log to audit trail (only if not dry run)
+    if not dry_run and returncode == 0:
+        # We don't know which files were regenerated without reading ledger
+        # So we just log that reprocess was successful
+        audit_service.log_reprocess(
+            date=date,
+            forced_items=forced_items,
+            regenerated_files=[],  # Would need to parse ledger to get this
+            dry_run=dry_run,
+        )
 
-    except FileNotFoundError:
-        console.print("[red]Error:[/red] 'nh' command not found", style="bold")
-        console.print("Make sure you're running from within the virtual environment")
-        raise typer.Exit(code=10)
+    raise typer.Exit(code=returncode)
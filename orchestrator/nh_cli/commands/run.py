@@ -1,26 +1,23 @@
 """Run command - Execute daily pipeline."""
 
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from adapters.filesystem import FileLock, LockError
-from adapters.gemini_cli import GeminiCLIAdapter
-from config.settings_schema import WaveType
-from config.toml_config import ConfigLoader
+from nh_cli.utils.console import get_console
 from nh_cli.utils.default_command_group import create_default_command_group
-from services.ledger import LedgerService
-from services.manifest import ManifestService
-from services.notifier import NotifierHooksConfig, NotifierService
-from services.registry import get_registry_provider
-from services.runner import RunnerService
+from nh_cli.utils.paths import (
+    get_config_cache_path,
+    get_orchestrator_root,
+    get_repo_root,
+    path_present,
+)
+
+# Services, adapters, config loading and Rich are imported inside main() so
+# that `nh run --help` does not load the Gemini adapter and runner stack
 
 app = typer.Typer(cls=create_default_command_group("main"))
-console = Console()
 
 
 @app.command()
@@ -71,6 +68,20 @@ def main(
 
         nh run --dry-run                 # Preview without executing
     """
+    from rich.table import Table
+
+    from adapters.filesystem import FileLock, LockError
+    from adapters.gemini_cli import GeminiCLIAdapter
+    from config.settings_schema import WaveType
+    from config.toml_config import load_cached_config
+    from services.ledger import LedgerService
+    from services.manifest import ManifestService
+    from services.notifier import NotifierHooksConfig, NotifierService
+    from services.registry import get_registry_provider
+    from services.runner import RunnerService
+
+    console = get_console()
+
     # Resolve date
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
@@ -84,11 +95,11 @@ def main(
         raise typer.Exit(code=10)
 
     # Get repo root (assume we're running from orchestrator/)
-    repo_root = Path.cwd().parent if Path.cwd().name == "orchestrator" else Path.cwd()
-    orchestrator_root = repo_root / "orchestrator" if repo_root.name != "orchestrator" else repo_root
+    repo_root = get_repo_root()
+    orchestrator_root = get_orchestrator_root()
 
-    config_loader = ConfigLoader(orchestrator_root)
-    config = config_loader.load()
+    # Reuses the parsed config cached by an earlier command (e.g. reprocess)
+    config = load_cached_config(orchestrator_root, get_config_cache_path())
 
     # Initialize services
     ledger_service = LedgerService(repo_root)
@@ -107,7 +118,7 @@ def main(
 
     # Load registry
     registry_path = repo_root / "orchestrator" / "config" / "prompts.tsv"
-    if not registry_path.exists():
+    if not path_present(registry_path):
         console.print(
             f"[red]Error:[/red] Registry not found: {registry_path}", style="bold"
         )
@@ -118,7 +129,7 @@ def main(
         prompts = registry_provider.load()
 
         # Validate registry
-        is_valid, errors = registry_provider.validate()
+        is_valid, errors = registry_provider.validate(prompts)
         if not is_valid:
             console.print("[red]Error:[/red] Registry validation failed:", style="bold")
             for error in errors:
@@ -1,41 +1,30 @@
 """Main Typer CLI application for NeuroHelix orchestrator."""
 
 import typer
-from rich.console import Console
-
-from nh_cli.commands import (
-    automation,
-    cleanup,
-    compare,
-    config,
-    diag,
-    publish,
-    registry,
-    reprocess,
-    run,
-)
 
-# Create console for rich output
-console = Console()
+from nh_cli.utils.default_command_group import create_lazy_command_group
+
+# Command modules as name -> (module, help); each is imported only when invoked
+COMMANDS = {
+    "run": ("nh_cli.commands.run", "Execute daily pipeline"),
+    "reprocess": ("nh_cli.commands.reprocess", "Rebuild artifacts for a past day"),
+    "cleanup": ("nh_cli.commands.cleanup", "Remove temporary files and stale locks"),
+    "publish": ("nh_cli.commands.publish", "Trigger export and Cloudflare deploy"),
+    "automation": ("nh_cli.commands.automation", "Manage LaunchD automation"),
+    "registry": ("nh_cli.commands.registry", "Validate and inspect prompt registry"),
+    "config": ("nh_cli.commands.config", "Manage .env configuration"),
+    "diag": ("nh_cli.commands.diag", "Print diagnostics and system status"),
+    "compare": ("nh_cli.commands.compare", "Compare Bash vs Python outputs"),
+}
 
 # Create main Typer app
 app = typer.Typer(
     name="nh",
     help="NeuroHelix orchestrator CLI - Automated AI research pipeline",
     add_completion=False,
+    cls=create_lazy_command_group(COMMANDS),
 )
 
-# Add command modules
-app.add_typer(run.app, name="run", help="Execute daily pipeline")
-app.add_typer(reprocess.app, name="reprocess", help="Rebuild artifacts for a past day")
-app.add_typer(cleanup.app, name="cleanup", help="Remove temporary files and stale locks")
-app.add_typer(publish.app, name="publish", help="Trigger export and Cloudflare deploy")
-app.add_typer(automation.app, name="automation", help="Manage LaunchD automation")
-app.add_typer(registry.app, name="registry", help="Validate and inspect prompt registry")
-app.add_typer(config.app, name="config", help="Manage .env configuration")
-app.add_typer(diag.app, name="diag", help="Print diagnostics and system status")
-app.add_typer(compare.app, name="compare", help="Compare Bash vs Python outputs")
-
 
 @app.callback()
 def main_callback():
@@ -0,0 +1,24 @@
+"""Shared Rich console for CLI commands."""
+
+from __future__ import annotations
+
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@cache
+def get_console() -> Console:
+    """Return the process-wide Rich console, creating it on first use.
+
+    Rich is imported here rather than at module import so that loading a
+    command module (which `nh` does for every subcommand) stays cheap.
+
+    Returns:
+        Rich Console instance
+    """
+    from rich.console import Console
+
+    return Console()
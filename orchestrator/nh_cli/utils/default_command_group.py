@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Type
+import importlib
+from difflib import get_close_matches
+from typing import Dict, Iterable, List, Optional, Tuple, Type
 
+import click
+import typer
 from typer.core import TyperGroup
 
 
@@ -35,3 +39,54 @@ def create_default_command_group(default_command: str) -> Type[DefaultCommandGro
 
     _Group.default_command = default_command
     return _Group
+
+
+class LazyCommandGroup(TyperGroup):
+    """Typer group whose subcommand modules are imported only when needed.
+
+    Each lazy subcommand is a module exposing a Typer ``app``; it is mounted the
+    same way ``Typer.add_typer`` would mount it, on first lookup.
+    """
+
+    # Subcommand name -> (module path, help text)
+    lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in self.lazy_commands if name not in self.commands]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            module_path, help_text = self.lazy_commands[cmd_name]
+            module = importlib.import_module(module_path)
+            # Build the group through add_typer so options and help match an eager mount
+            wrapper = typer.Typer()
+            wrapper.add_typer(module.app, name=cmd_name, help=help_text)
+            command = typer.main.get_command(wrapper).commands[cmd_name]
+            self.commands[cmd_name] = command
+        return command
+
+    def resolve_command(self, ctx: click.Context, args: List[str]):  # type: ignore[override]
+        try:
+            return super().resolve_command(ctx, args)
+        except click.UsageError as e:
+            # TyperGroup only suggests already-mounted commands; include lazy ones
+            if self.suggest_commands and args and "Did you mean" not in e.message:
+                matches = get_close_matches(args[0], self.list_commands(ctx))
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    e.message = f"{e.message.rstrip('.')}. Did you mean {suggestions}?"
+            raise
+
+
+def create_lazy_command_group(
+    commands: Dict[str, Tuple[str, str]],
+) -> Type[LazyCommandGroup]:
+    """Factory returning a Typer group class that lazily mounts the given subcommands."""
+
+    class _Group(LazyCommandGroup):
+        pass
+
+    _Group.lazy_commands = commands
+    return _Group
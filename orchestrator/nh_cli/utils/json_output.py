@@ -0,0 +1,34 @@
+"""JSON output helper for ``--json`` command modes."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # Fall back to stdlib json
+
+
+def emit_json(data: Any, indent: Optional[int] = None) -> None:
+    """Write data to stdout as a single JSON document.
+
+    Output bypasses Rich so long values are never wrapped or scanned for markup.
+
+    Args:
+        data: JSON-serializable data
+        indent: Indentation level (None for compact output)
+    """
+    # Keep ordering with anything already written through the text layer
+    sys.stdout.flush()
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        sys.stdout.buffer.write(orjson.dumps(data, option=option) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        # Compact separators match orjson's output byte for byte
+        separators = (",", ":") if indent is None else None
+        json.dump(data, sys.stdout, indent=indent, separators=separators)
+        sys.stdout.write("\n")
@@ -0,0 +1,19 @@
+"""Operator identity helpers shared by CLI commands."""
+
+import os
+from functools import cache
+from getpass import getuser
+
+
+@cache
+def get_current_operator() -> str:
+    """Return the name of the user running the CLI.
+
+    Prefers ``USER``/``LOGNAME`` and only falls back to ``getpass.getuser()``,
+    whose passwd lookup can be slow on NSS/LDAP-managed hosts. Resolved once
+    per process.
+
+    Returns:
+        Operator name
+    """
+    return os.environ.get("USER") or os.environ.get("LOGNAME") or getuser()
@@ -0,0 +1,91 @@
+"""Repository path helpers shared by CLI commands."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from functools import cache
+from pathlib import Path
+from typing import Iterable
+
+
+@cache
+def get_repo_root() -> Path:
+    """Return the repository root for the current CLI invocation.
+
+    Commands may be run from the repository root or from its ``orchestrator``
+    directory. The working directory is resolved once per process; call
+    ``get_repo_root.cache_clear()`` after changing directories.
+
+    Returns:
+        Repository root directory
+    """
+    cwd = Path.cwd()
+    return cwd.parent if cwd.name == "orchestrator" else cwd
+
+
+def get_orchestrator_root() -> Path:
+    """Return the ``orchestrator`` package directory for the current invocation.
+
+    Derived from the cached repository root, so it follows
+    ``get_repo_root.cache_clear()``.
+
+    Returns:
+        Orchestrator directory
+    """
+    repo_root = get_repo_root()
+    return repo_root if repo_root.name == "orchestrator" else repo_root / "orchestrator"
+
+
+def get_config_cache_path() -> Path:
+    """Return the per-user cache file for this repository's parsed configuration.
+
+    The cache lives outside the working tree under ``$XDG_CACHE_HOME/neurohelix``
+    (``~/.cache/neurohelix`` by default), one file per repository.
+
+    Returns:
+        Path of the config cache file
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    # The XDG spec says relative paths are invalid and must be ignored
+    base = Path(cache_home) if os.path.isabs(cache_home) else Path.home() / ".cache"
+    repo_id = hashlib.sha256(os.fsencode(get_repo_root().resolve())).hexdigest()[:16]
+    return base / "neurohelix" / f"nh_config-{repo_id}.pkl"
+
+
+def path_present(path: Path) -> bool:
+    """Check whether a path exists with a single ``os.stat`` call.
+
+    Args:
+        path: Path to check (symlinks are followed)
+
+    Returns:
+        True if the path exists, False if it or a parent component is missing
+    """
+    try:
+        os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
+
+
+def scan_parent_dirs(paths: Iterable[Path]) -> dict[Path, dict[str, os.DirEntry]]:
+    """Scan each distinct parent directory of the given paths once.
+
+    Lets callers check several sibling paths with one directory read instead
+    of a stat per path.
+
+    Args:
+        paths: Paths whose parents should be listed
+
+    Returns:
+        Mapping of parent directory to its entries keyed by name (empty if missing)
+    """
+    listings: dict[Path, dict[str, os.DirEntry]] = {}
+    for parent in dict.fromkeys(path.parent for path in paths):
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {entry.name: entry for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            listings[parent] = {}
+    return listings
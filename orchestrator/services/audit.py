@@ -51,7 +51,7 @@ class AuditService:
             operator=operator,
             cli_version=self.cli_version,
             command=command,
-            affected_paths=affected_paths or [],
+            affected_paths=affected_paths or (),
             metadata=metadata,
         )
 
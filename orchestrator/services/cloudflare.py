@@ -9,6 +9,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+# Cloudflare deployment IDs are 32 lowercase hex characters
+_DEPLOY_ID_RE = re.compile(r"([a-f0-9]{32})")
+
 
 @dataclass
 class CloudflareService:
@@ -55,13 +58,16 @@ class CloudflareService:
             return None
 
         for line in result.stdout.splitlines():
-            parts = [segment.strip() for segment in line.split("|")]
-            if len(parts) >= 4 and parts[0] and (
-                "active" in parts[3].lower() or "success" in parts[3].lower()
-            ):
-                return parts[0]
+            # Only split rows that could carry an active/success status column
+            lower = line.lower()
+            if "active" in lower or "success" in lower:
+                parts = [segment.strip() for segment in line.split("|")]
+                if len(parts) >= 4 and parts[0] and (
+                    "active" in parts[3].lower() or "success" in parts[3].lower()
+                ):
+                    return parts[0]
 
-            match = re.search(r"([a-f0-9]{32})", line)
+            match = _DEPLOY_ID_RE.search(line)
             if match:
                 return match.group(1)
 
@@ -1,12 +1,25 @@
 """Ledger and audit logging service."""
 
 import hashlib
+import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from config.settings_schema import AuditLogEntry, LedgerEntry
-from adapters.filesystem import append_jsonl, ensure_directory, read_jsonl
+from config.settings_schema import AuditLogEntry, LedgerEntry, LedgerEntryListAdapter
+from adapters.filesystem import (
+    append_jsonl,
+    append_text,
+    compute_file_hash,
+    ensure_directory,
+    read_jsonl,
+)
+
+# Files modified more recently than this are not memoized: a rewrite within the
+# same timestamp tick can leave mtime and size unchanged
+_RACY_MTIME_NS = 2_000_000_000
 
 
 class LedgerService:
@@ -27,6 +40,9 @@ class LedgerService:
         ensure_directory(self.audit_dir)
         ensure_directory(self.runs_dir)
 
+        # Registry digests keyed by (path, inode, mtime_ns, size)
+        self._registry_hash_cache: dict[tuple[str, int, int, int], str] = {}
+
     def write_ledger_entry(
         self,
         date: str,
@@ -75,13 +91,13 @@ class LedgerService:
             success=success,
             retries=retries,
             output_sha256=output_sha256,
-            dependent_inputs=dependent_inputs or [],
-            output_paths=output_paths or [],
+            dependent_inputs=dependent_inputs or (),
+            output_paths=output_paths or (),
             error_message=error_message,
         )
 
         ledger_path = self.ledger_dir / f"{date}.jsonl"
-        append_jsonl(ledger_path, entry.model_dump())
+        append_jsonl(ledger_path, entry)
 
     def read_ledger_entries(self, date: str) -> list[LedgerEntry]:
         """Read all ledger entries for a date.
@@ -94,7 +110,7 @@ class LedgerService:
         """
         ledger_path = self.ledger_dir / f"{date}.jsonl"
         entries = read_jsonl(ledger_path)
-        return [LedgerEntry(**entry) for entry in entries]
+        return LedgerEntryListAdapter.validate_python(entries)
 
     def write_audit_entry(
         self,
@@ -118,7 +134,7 @@ class LedgerService:
             operator=operator,
             cli_version=cli_version,
             command=command,
-            affected_paths=affected_paths or [],
+            affected_paths=affected_paths or (),
             metadata=metadata,
         )
 
@@ -143,19 +159,33 @@ class LedgerService:
     def compute_registry_hash(self, prompts_tsv_path: Path) -> str:
         """Compute hash of the registry file.
 
+        The digest is reused while the file's stat signature is unchanged.
+
         Args:
             prompts_tsv_path: Path to prompts.tsv
 
         Returns:
             SHA256 hash of the file
         """
-        if not prompts_tsv_path.exists():
+        try:
+            st = os.stat(prompts_tsv_path)
+        except FileNotFoundError:
             return ""
 
-        sha256 = hashlib.sha256()
-        with open(prompts_tsv_path, "rb") as f:
-            sha256.update(f.read())
-        return sha256.hexdigest()
+        key = (str(prompts_tsv_path), st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._registry_hash_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Streams the file instead of reading it into memory in one piece
+        try:
+            digest = compute_file_hash(prompts_tsv_path)
+        except FileNotFoundError:
+            return ""
+
+        if time.time_ns() - st.st_mtime_ns > _RACY_MTIME_NS:
+            self._registry_hash_cache[key] = digest
+        return digest
 
     def compute_config_fingerprint(self, config: dict) -> str:
         """Compute fingerprint of configuration.
@@ -166,9 +196,9 @@ class LedgerService:
         Returns:
             SHA256 hash of configuration
         """
-        config_str = str(sorted(config.items()))
-        sha256 = hashlib.sha256(config_str.encode())
-        return sha256.hexdigest()
+        # Canonical JSON sorts keys at every level, so nested ordering is irrelevant
+        payload = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     def get_run_log_path(self, date: str) -> Path:
         """Get path to human-readable run log.
@@ -191,10 +221,7 @@ class LedgerService:
         """
         log_path = self.get_run_log_path(date)
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_line = f"[{timestamp}] [{level}] {message}\n"
-
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(log_line)
+        append_text(log_path, f"[{timestamp}] [{level}] {message}\n")
 
     def get_summary_stats(self, date: str) -> dict:
         """Get summary statistics from ledger entries.
@@ -7,6 +7,7 @@ from typing import Optional
 
 from config.settings_schema import (
     CompletionMarker,
+    CompletionMarkerAdapter,
     PromptPolicy,
     RunManifest,
     WaveType,
@@ -138,7 +139,7 @@ class ManifestService:
 
         # Write marker beside the output file
         marker_path = output_path.parent / f".nh_status_{prompt_id}.json"
-        write_json(marker_path, marker.model_dump())
+        write_json(marker_path, marker)
         return marker_path
 
     def read_completion_marker(self, output_path: Path, prompt_id: Optional[str] = None) -> Optional[CompletionMarker]:
@@ -159,7 +160,7 @@ class ManifestService:
 
         try:
             data = read_json(marker_path)
-            return CompletionMarker(**data)
+            return CompletionMarkerAdapter.validate_python(data)
         except Exception:
             return None
 
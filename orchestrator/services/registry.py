@@ -2,10 +2,20 @@
 
 import csv
 from abc import ABC, abstractmethod
+from collections import Counter
 from pathlib import Path
-from typing import Protocol
+from typing import Optional, Protocol
 
-from config.settings_schema import ConcurrencyClass, PromptPolicy, WaveType
+from pydantic import ValidationError
+
+from config.settings_schema import (
+    ConcurrencyClass,
+    PromptPolicy,
+    PromptPolicyListAdapter,
+    WaveType,
+    parse_concurrency_class,
+    parse_wave,
+)
 
 
 class RegistryProvider(Protocol):
@@ -15,9 +25,14 @@ class RegistryProvider(Protocol):
         """Load prompts from the registry."""
         ...
 
-    def validate(self) -> tuple[bool, list[str]]:
+    def validate(
+        self, prompts: Optional[list[PromptPolicy]] = None
+    ) -> tuple[bool, list[str]]:
         """Validate the registry.
 
+        Args:
+            prompts: Already-loaded prompts to check instead of re-reading the source
+
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
@@ -49,7 +64,7 @@ class TSVRegistryProvider:
         if not self.tsv_path.exists():
             raise FileNotFoundError(f"Registry TSV not found: {self.tsv_path}")
 
-        prompts = []
+        rows = []
         with open(self.tsv_path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f, delimiter="\t")
 
@@ -68,94 +83,108 @@ class TSVRegistryProvider:
             for row_num, row in enumerate(reader, start=2):
                 try:
                     # Parse wave enum
-                    wave = WaveType(row["wave"].lower())
+                    wave = parse_wave(row["wave"].lower())
 
                     # Parse concurrency class if present
                     concurrency_class = ConcurrencyClass.MEDIUM
                     if "concurrency_class" in row and row["concurrency_class"]:
-                        concurrency_class = ConcurrencyClass(row["concurrency_class"].lower())
-
-                    # Build prompt policy
-                    policy = PromptPolicy(
-                        prompt_id=row["prompt_id"],
-                        title=row["title"],
-                        wave=wave,
-                        category=row["category"],
-                        model=row.get("model", "gemini-2.5-pro"),
-                        tools=row.get("tools") if row.get("tools") else None,
-                        temperature=float(row.get("temperature", "0.7")),
-                        token_budget=int(row.get("token_budget", "32000")),
-                        timeout_sec=int(row.get("timeout_sec", "120")),
-                        max_retries=int(row.get("max_retries", "3")),
-                        concurrency_class=concurrency_class,
-                        expected_outputs=row["expected_outputs"],
-                        prompt=row["prompt"],
-                        notes=row.get("notes") if row.get("notes") else None,
+                        concurrency_class = parse_concurrency_class(
+                            row["concurrency_class"].lower()
+                        )
+
+                    # Collect prompt policy fields; validated as one batch below
+                    rows.append(
+                        {
+                            "prompt_id": row["prompt_id"],
+                            "title": row["title"],
+                            "wave": wave,
+                            "category": row["category"],
+                            "model": row.get("model", "gemini-2.5-pro"),
+                            "tools": row.get("tools") if row.get("tools") else None,
+                            "temperature": float(row.get("temperature", "0.7")),
+                            "token_budget": int(row.get("token_budget", "32000")),
+                            "timeout_sec": int(row.get("timeout_sec", "120")),
+                            "max_retries": int(row.get("max_retries", "3")),
+                            "concurrency_class": concurrency_class,
+                            "expected_outputs": row["expected_outputs"],
+                            "prompt": row["prompt"],
+                            "notes": row.get("notes") if row.get("notes") else None,
+                        }
                     )
-                    prompts.append(policy)
                 except (ValueError, KeyError) as e:
                     raise ValueError(
                         f"Error parsing TSV row {row_num}: {e}"
                     ) from e
 
+        try:
+            prompts = PromptPolicyListAdapter.validate_python(rows)
+        except ValidationError as e:
+            # First error location is the index into rows; data starts on line 2
+            row_num = e.errors()[0]["loc"][0] + 2
+            raise ValueError(f"Error parsing TSV row {row_num}: {e}") from e
+
         self._prompts = prompts
         return prompts
 
-    def validate(self) -> tuple[bool, list[str]]:
-        """Validate the loaded registry.
+    def validate(
+        self, prompts: Optional[list[PromptPolicy]] = None
+    ) -> tuple[bool, list[str]]:
+        """Validate the registry.
+
+        Args:
+            prompts: Already-loaded prompts to check; defaults to the last load()
 
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-
-        # Load if not already loaded
-        if self._prompts is None:
-            try:
-                self.load()
-            except Exception as e:
-                return False, [f"Failed to load registry: {e}"]
-
-        if not self._prompts:
-            return False, ["Registry is empty"]
-
-        # Check for duplicate prompt IDs
-        prompt_ids = [p.prompt_id for p in self._prompts]
-        duplicates = set([pid for pid in prompt_ids if prompt_ids.count(pid) > 1])
-        if duplicates:
-            errors.append(f"Duplicate prompt IDs found: {duplicates}")
-
-        # Check wave ordering is valid
-        wave_order = {
-            WaveType.SEARCH: 1,
-            WaveType.AGGREGATOR: 2,
-            WaveType.TAGGER: 3,
-            WaveType.RENDER: 4,
-            WaveType.EXPORT: 5,
-            WaveType.PUBLISH: 6,
-        }
-
-        # Group by wave and validate each wave
-        waves_present = set(p.wave for p in self._prompts)
-        for wave in waves_present:
-            wave_prompts = [p for p in self._prompts if p.wave == wave]
-
-            # Validate temperature limits for prompts with tools
-            for prompt in wave_prompts:
-                if prompt.tools and prompt.temperature > 1.0:
-                    errors.append(
-                        f"Prompt '{prompt.prompt_id}' has tools enabled but temperature > 1.0"
-                    )
+        if prompts is None:
+            # Load if not already loaded
+            if self._prompts is None:
+                try:
+                    self.load()
+                except Exception as e:
+                    return False, [f"Failed to load registry: {e}"]
+            prompts = self._prompts
+
+        return validate_prompts(prompts)
+
+
+def validate_prompts(prompts: list[PromptPolicy]) -> tuple[bool, list[str]]:
+    """Check a set of prompt policies for registry-level consistency.
+
+    Args:
+        prompts: Prompt policies to validate
+
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    if not prompts:
+        return False, ["Registry is empty"]
+
+    errors = []
+
+    # Check for duplicate prompt IDs
+    id_counts = Counter(p.prompt_id for p in prompts)
+    duplicates = {pid for pid, count in id_counts.items() if count > 1}
+    if duplicates:
+        errors.append(f"Duplicate prompt IDs found: {duplicates}")
 
-        # Validate that waves are in logical order (no missing critical waves)
-        if WaveType.SEARCH not in waves_present:
-            errors.append("Missing critical wave: SEARCH")
+    # Validate temperature limits for prompts with tools
+    for prompt in prompts:
+        if prompt.tools and prompt.temperature > 1.0:
+            errors.append(
+                f"Prompt '{prompt.prompt_id}' has tools enabled but temperature > 1.0"
+            )
 
-        if WaveType.AGGREGATOR not in waves_present:
-            errors.append("Missing critical wave: AGGREGATOR")
+    # Validate that waves are in logical order (no missing critical waves)
+    waves_present = {p.wave for p in prompts}
+    if WaveType.SEARCH not in waves_present:
+        errors.append("Missing critical wave: SEARCH")
 
-        return len(errors) == 0, errors
+    if WaveType.AGGREGATOR not in waves_present:
+        errors.append("Missing critical wave: AGGREGATOR")
 
+    return len(errors) == 0, errors
 
 
 def get_registry_provider(registry_path: Path, format_type: str = "tsv") -> RegistryProvider:
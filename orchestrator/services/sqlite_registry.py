@@ -2,14 +2,45 @@
 
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from pydantic import ValidationError
 
 from config.settings_schema import (
     PromptPolicy,
+    PromptPolicyListAdapter,
     WaveType,
-    ConcurrencyClass,
+    parse_concurrency_class,
+    parse_wave,
 )
-from services.registry import RegistryProvider
+from services.registry import RegistryProvider, validate_prompts
+
+
+def _policy_fields(row: sqlite3.Row) -> dict[str, Any]:
+    """Map a prompts table row to PromptPolicy fields.
+
+    Args:
+        row: Row selected from the prompts table
+
+    Returns:
+        Dictionary of PromptPolicy field values
+    """
+    return {
+        "prompt_id": row["prompt_id"],
+        "title": row["title"],
+        "wave": parse_wave(row["wave"]),
+        "category": row["category"],
+        "model": row["model"],
+        "tools": row["tools"] or None,
+        "temperature": row["temperature"],
+        "token_budget": row["token_budget"],
+        "timeout_sec": row["timeout_sec"],
+        "max_retries": row["max_retries"],
+        "concurrency_class": parse_concurrency_class(row["concurrency_class"]),
+        "expected_outputs": row["expected_outputs"],
+        "prompt": row["prompt"],
+        "notes": row["notes"],
+    }
 
 
 class SQLiteRegistryProvider(RegistryProvider):
@@ -105,33 +136,44 @@ class SQLiteRegistryProvider(RegistryProvider):
                 """
             )
 
-            prompts = []
+            rows = []
             for row in cursor:
                 try:
-                    policy = PromptPolicy(
-                        prompt_id=row["prompt_id"],
-                        title=row["title"],
-                        wave=WaveType(row["wave"]),
-                        category=row["category"],
-                        model=row["model"],
-                        tools=row["tools"] or None,
-                        temperature=row["temperature"],
-                        token_budget=row["token_budget"],
-                        timeout_sec=row["timeout_sec"],
-                        max_retries=row["max_retries"],
-                        concurrency_class=ConcurrencyClass(row["concurrency_class"]),
-                        expected_outputs=row["expected_outputs"],
-                        prompt=row["prompt"],
-                        notes=row["notes"],
-                    )
-                    prompts.append(policy)
+                    rows.append(_policy_fields(row))
                 except Exception as e:
                     raise ValueError(
                         f"Invalid prompt policy for '{row['prompt_id']}': {e}"
                     ) from e
 
+            try:
+                prompts = PromptPolicyListAdapter.validate_python(rows)
+            except ValidationError as e:
+                prompt_id = rows[e.errors()[0]["loc"][0]]["prompt_id"]
+                raise ValueError(
+                    f"Invalid prompt policy for '{prompt_id}': {e}"
+                ) from e
+
             return prompts
 
+    def validate(
+        self, prompts: Optional[list[PromptPolicy]] = None
+    ) -> tuple[bool, list[str]]:
+        """Validate the registry.
+
+        Args:
+            prompts: Already-loaded prompts to check; loaded from the database if omitted
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        if prompts is None:
+            try:
+                prompts = self.load()
+            except Exception as e:
+                return False, [f"Failed to load registry: {e}"]
+
+        return validate_prompts(prompts)
+
     def save(self, prompts: list[PromptPolicy]) -> None:
         """Save prompt policies to SQLite database.
 
@@ -207,22 +249,7 @@ class SQLiteRegistryProvider(RegistryProvider):
             if not row:
                 return None
 
-            return PromptPolicy(
-                prompt_id=row["prompt_id"],
-                title=row["title"],
-                wave=WaveType(row["wave"]),
-                category=row["category"],
-                model=row["model"],
-                tools=row["tools"] or None,
-                temperature=row["temperature"],
-                token_budget=row["token_budget"],
-                timeout_sec=row["timeout_sec"],
-                max_retries=row["max_retries"],
-                concurrency_class=ConcurrencyClass(row["concurrency_class"]),
-                expected_outputs=row["expected_outputs"],
-                prompt=row["prompt"],
-                notes=row["notes"],
-            )
+            return PromptPolicy(**_policy_fields(row))
 
     def get_by_wave(self, wave: WaveType) -> list[PromptPolicy]:
         """Get all prompt policies for a specific wave.
@@ -247,28 +274,9 @@ class SQLiteRegistryProvider(RegistryProvider):
                 (wave.value,),
             )
 
-            prompts = []
-            for row in cursor:
-                prompts.append(
-                    PromptPolicy(
-                        prompt_id=row["prompt_id"],
-                        title=row["title"],
-                        wave=WaveType(row["wave"]),
-                        category=row["category"],
-                        model=row["model"],
-                        tools=row["tools"] or None,
-                        temperature=row["temperature"],
-                        token_budget=row["token_budget"],
-                        timeout_sec=row["timeout_sec"],
-                        max_retries=row["max_retries"],
-                        concurrency_class=ConcurrencyClass(row["concurrency_class"]),
-                        expected_outputs=row["expected_outputs"],
-                        prompt=row["prompt"],
-                        notes=row["notes"],
-                    )
-                )
-
-            return prompts
+            return PromptPolicyListAdapter.validate_python(
+                [_policy_fields(row) for row in cursor]
+            )
 
     def count(self) -> int:
         """Get total number of prompts in registry.
@@ -0,0 +1,82 @@
+"""Unit tests for CLI path helpers."""
+
+import pytest
+
+from nh_cli.utils.paths import (
+    get_config_cache_path,
+    get_orchestrator_root,
+    get_repo_root,
+    path_present,
+    scan_parent_dirs,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_repo_root_cache():
+    get_repo_root.cache_clear()
+    yield
+    get_repo_root.cache_clear()
+
+
+def test_repo_root_from_orchestrator_dir(tmp_path, monkeypatch):
+    orchestrator_dir = tmp_path / "orchestrator"
+    orchestrator_dir.mkdir()
+    monkeypatch.chdir(orchestrator_dir)
+
+    assert get_repo_root() == tmp_path
+
+
+def test_repo_root_is_resolved_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first = get_repo_root()
+
+    monkeypatch.chdir(tmp_path.parent)
+
+    assert get_repo_root() is first
+
+
+def test_orchestrator_root_from_either_directory(tmp_path, monkeypatch):
+    orchestrator_dir = tmp_path / "orchestrator"
+    orchestrator_dir.mkdir()
+
+    monkeypatch.chdir(tmp_path)
+    assert get_orchestrator_root() == orchestrator_dir
+
+    get_repo_root.cache_clear()
+    monkeypatch.chdir(orchestrator_dir)
+    assert get_orchestrator_root() == orchestrator_dir
+
+
+def test_scan_parent_dirs_lists_each_parent_once(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "x").mkdir()
+    (tmp_path / "a" / "y.txt").write_text("y")
+
+    listings = scan_parent_dirs(
+        [tmp_path / "a" / "x", tmp_path / "a" / "y.txt", tmp_path / "missing" / "z"]
+    )
+
+    assert set(listings) == {tmp_path / "a", tmp_path / "missing"}
+    assert set(listings[tmp_path / "a"]) == {"x", "y.txt"}
+    assert listings[tmp_path / "missing"] == {}
+
+
+def test_path_present(tmp_path):
+    (tmp_path / "file.txt").write_text("x")
+
+    assert path_present(tmp_path / "file.txt")
+    assert not path_present(tmp_path / "missing")
+    assert not path_present(tmp_path / "file.txt" / "child")
+
+
+def test_config_cache_path_outside_repo(tmp_path, monkeypatch):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    cache_home = tmp_path / "xdg"
+    monkeypatch.chdir(repo)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+
+    cache_path = get_config_cache_path()
+
+    assert cache_path.parent == cache_home / "neurohelix"
+    assert repo not in cache_path.parents
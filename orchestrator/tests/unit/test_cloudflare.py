@@ -38,3 +38,23 @@ def test_cloudflare_service_parses_output(monkeypatch, tmp_path):
     deploy_id = service.get_latest_deployment_id()
     assert deploy_id == "12345abc"
     assert "wrangler" in captured["cmd"]
+
+
+def test_cloudflare_service_skips_rows_without_status(monkeypatch, tmp_path):
+    service = CloudflareService(repo_root=tmp_path, project_name="demo", api_token="token")
+    deploy_id = "0123456789abcdef0123456789abcdef"
+    stdout = "\n".join(
+        [
+            "Id | Created | Source | Status",
+            "99999999 | 2025-01-02 | git | Failure",
+            f"{deploy_id} | 2025-01-01 | git | Failure",
+        ]
+    )
+
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        lambda cmd, **kwargs: SimpleNamespace(returncode=0, stdout=stdout, stderr=""),
+    )
+
+    assert service.get_latest_deployment_id() == deploy_id
@@ -0,0 +1,41 @@
+"""Unit tests for Typer command group helpers."""
+
+import typer
+from typer.testing import CliRunner
+
+from nh_cli.utils.default_command_group import create_lazy_command_group
+
+
+def _lazy_app() -> typer.Typer:
+    app = typer.Typer(
+        cls=create_lazy_command_group(
+            {"diag": ("nh_cli.commands.diag", "Print diagnostics and system status")}
+        )
+    )
+
+    @app.callback()
+    def callback():
+        pass
+
+    return app
+
+
+def test_lazy_command_group_mounts_subcommand_on_demand():
+    command = typer.main.get_command(_lazy_app())
+    ctx = command.make_context("nh", ["diag"], resilient_parsing=True)
+
+    assert command.list_commands(ctx) == ["diag"]
+    assert "diag" not in command.commands
+
+    diag = command.get_command(ctx, "diag")
+    assert diag.name == "diag"
+    assert diag.help == "Print diagnostics and system status"
+    assert "main" in diag.commands
+    assert command.commands["diag"] is diag
+
+
+def test_lazy_command_group_suggests_unmounted_commands():
+    result = CliRunner().invoke(_lazy_app(), ["dia"])
+
+    assert result.exit_code == 2
+    assert "Did you mean 'diag'?" in result.output
@@ -1,8 +1,13 @@
 """Unit tests for filesystem utilities."""
 
+import hashlib
+import json
 import tempfile
 import time
+from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -12,11 +17,14 @@ from adapters.filesystem import (
     compute_file_hash,
     compute_directory_hash,
     ensure_directory,
+    write_bytes,
     write_json,
     read_json,
     append_jsonl,
+    close_append_files,
     read_jsonl,
 )
+from config.settings_schema import LedgerEntry
 
 
 @pytest.fixture
@@ -58,6 +66,35 @@ def test_filelock_acquire_twice_fails(temp_dir):
     lock1.release()
 
 
+def test_filelock_writes_metadata_without_temp_files(temp_dir):
+    """Test the lock file is created with metadata and no leftover temp files."""
+    lock_path = temp_dir / "test.lock"
+    lock = FileLock(lock_path, ttl_seconds=60)
+
+    lock.acquire(command="test command")
+
+    assert [p.name for p in temp_dir.iterdir()] == ["test.lock"]
+    metadata = lock._read_lock_metadata()
+    assert metadata["command"] == "test command"
+    assert metadata["ttl"] == 60
+
+    lock.release()
+
+
+def test_filelock_reads_legacy_json_metadata(temp_dir):
+    """Test a JSON lock left by an older version is still honoured."""
+    lock_path = temp_dir / "test.lock"
+    lock_path.write_text(
+        json.dumps({"pid": 1, "command": "old", "timestamp": time.time(), "ttl": 60})
+    )
+
+    lock = FileLock(lock_path, ttl_seconds=60)
+    with pytest.raises(LockError) as exc_info:
+        lock.acquire(command="new")
+
+    assert "for command 'old'" in str(exc_info.value)
+
+
 def test_filelock_stale_lock_removed(temp_dir):
     """Test that stale locks are automatically removed."""
     lock_path = temp_dir / "test.lock"
@@ -127,6 +164,15 @@ def test_compute_file_hash(temp_dir):
     assert hash1 != hash3
 
 
+def test_compute_file_hash_large_file(temp_dir):
+    """Test memory-mapped hashing of large files matches sha256."""
+    test_file = temp_dir / "large.bin"
+    content = b"0123456789abcdef" * (1 << 17)  # 2 MiB
+    test_file.write_bytes(content)
+
+    assert compute_file_hash(test_file) == hashlib.sha256(content).hexdigest()
+
+
 def test_compute_file_hash_nonexistent(temp_dir):
     """Test computing hash of nonexistent file raises error."""
     test_file = temp_dir / "nonexistent.txt"
@@ -156,6 +202,63 @@ def test_compute_directory_hash(temp_dir):
     assert hash1 != hash3
 
 
+def test_compute_directory_hash_is_order_stable(temp_dir):
+    """Test that parallel hashing combines file hashes in sorted name order."""
+    for i in range(20):
+        (temp_dir / f"file{i:02d}.txt").write_text(f"Content {i}")
+
+    expected = "\n".join(
+        f"file{i:02d}.txt:{compute_file_hash(temp_dir / f'file{i:02d}.txt')}"
+        for i in range(20)
+    )
+
+    assert compute_directory_hash(temp_dir, "*.txt") == hashlib.sha256(
+        expected.encode()
+    ).hexdigest()
+
+
+def test_compute_directory_hash_small_set_hashed_inline(temp_dir):
+    """Test that a few files are hashed without starting a thread pool."""
+    (temp_dir / "file1.txt").write_text("Content 1")
+    expected = f"file1.txt:{compute_file_hash(temp_dir / 'file1.txt')}"
+
+    with patch("adapters.filesystem.ThreadPoolExecutor") as mock_pool:
+        directory_hash = compute_directory_hash(temp_dir, "*.txt")
+
+    mock_pool.assert_not_called()
+    assert directory_hash == hashlib.sha256(expected.encode()).hexdigest()
+
+
+def test_compute_directory_hash_skips_dirs_and_non_matching(temp_dir):
+    """Test only regular files matching the pattern contribute to the hash."""
+    (temp_dir / "file1.txt").write_text("Content 1")
+    hash1 = compute_directory_hash(temp_dir, "*.txt")
+
+    (temp_dir / "notes.md").write_text("Ignored")
+    (temp_dir / "subdir.txt").mkdir()
+
+    assert compute_directory_hash(temp_dir, "*.txt") == hash1
+
+
+def test_compute_directory_hash_path_patterns(temp_dir):
+    """Test patterns with a separator or ** still match nested files."""
+    (temp_dir / "sub").mkdir()
+    (temp_dir / "sub" / "data.json").write_text("{}")
+    (temp_dir / "top.md").write_text("Top")
+    (temp_dir / "sub" / "nested.md").write_text("Nested")
+
+    def expected(*paths):
+        lines = "\n".join(f"{p.name}:{compute_file_hash(p)}" for p in paths)
+        return hashlib.sha256(lines.encode()).hexdigest()
+
+    assert compute_directory_hash(temp_dir, "sub/*.json") == expected(
+        temp_dir / "sub" / "data.json"
+    )
+    assert compute_directory_hash(temp_dir, "**/*.md") == expected(
+        temp_dir / "sub" / "nested.md", temp_dir / "top.md"
+    )
+
+
 def test_compute_directory_hash_nonexistent(temp_dir):
     """Test computing hash of nonexistent directory returns empty string."""
     nonexistent = temp_dir / "nonexistent"
@@ -175,6 +278,71 @@ def test_ensure_directory(temp_dir):
     assert test_dir.is_dir()
 
 
+def test_ensure_directory_is_cached(temp_dir):
+    """Test an already-ensured directory is not re-created or chmod-ed."""
+    test_dir = temp_dir / "cached"
+
+    ensure_directory(test_dir)
+    with patch("adapters.filesystem.os.chmod") as mock_chmod:
+        ensure_directory(test_dir)
+
+    mock_chmod.assert_not_called()
+
+
+def test_append_jsonl_recreates_removed_directory(temp_dir):
+    """Test appending still works after an ensured directory is removed."""
+    import shutil
+
+    test_file = temp_dir / "logs" / "test.jsonl"
+    append_jsonl(test_file, {"id": 1})
+
+    shutil.rmtree(test_file.parent)
+    append_jsonl(test_file, {"id": 2})
+
+    assert read_jsonl(test_file) == [{"id": 2}]
+
+
+def test_append_jsonl_reopens_rotated_file(temp_dir):
+    """Test appends follow the path after the file is moved away."""
+    test_file = temp_dir / "test.jsonl"
+    rotated = temp_dir / "test.jsonl.1"
+
+    append_jsonl(test_file, {"id": 1})
+    test_file.rename(rotated)
+    append_jsonl(test_file, {"id": 2})
+
+    assert read_jsonl(rotated) == [{"id": 1}]
+    assert read_jsonl(test_file) == [{"id": 2}]
+
+
+def test_append_jsonl_evicts_least_recent_handle(temp_dir):
+    """Test the cache of open append handles stays bounded."""
+    from adapters import filesystem
+
+    close_append_files()
+    with patch.object(filesystem, "_APPEND_FDS_MAX", 2):
+        for i in range(3):
+            append_jsonl(temp_dir / f"log{i}.jsonl", {"id": i})
+
+        assert list(filesystem._APPEND_FDS) == [
+            str(temp_dir / "log1.jsonl"),
+            str(temp_dir / "log2.jsonl"),
+        ]
+    close_append_files()
+
+
+def test_write_bytes_truncates_and_appends(temp_dir):
+    """Test writing bytes replaces content and append mode extends it."""
+    test_file = temp_dir / "out.bin"
+
+    write_bytes(test_file, b"first\n")
+    write_bytes(test_file, b"second\n")
+    assert test_file.read_bytes() == b"second\n"
+
+    write_bytes(test_file, b"third\n", append=True)
+    assert test_file.read_bytes() == b"second\nthird\n"
+
+
 def test_write_and_read_json(temp_dir):
     """Test writing and reading JSON."""
     test_file = temp_dir / "test.json"
@@ -189,6 +357,19 @@ def test_write_and_read_json(temp_dir):
     assert loaded_data == test_data
 
 
+def test_write_json_serializes_datetimes_as_str(temp_dir):
+    """Test datetimes are written the same way as json.dump(default=str)."""
+    test_file = temp_dir / "test.json"
+    stamp = datetime(2025, 1, 2, 3, 4, 5)
+
+    write_json(test_file, {"started_at": stamp})
+
+    assert read_json(test_file) == {"started_at": str(stamp)}
+    assert test_file.read_text() == json.dumps(
+        {"started_at": stamp}, indent=2, default=str
+    )
+
+
 def test_read_json_nonexistent(temp_dir):
     """Test reading nonexistent JSON file raises error."""
     test_file = temp_dir / "nonexistent.json"
@@ -218,6 +399,26 @@ def test_append_and_read_jsonl(temp_dir):
     assert loaded_entries == entries
 
 
+def test_append_jsonl_dataclass_matches_asdict(temp_dir):
+    """Test that dataclass entries serialize like their asdict() form."""
+    entry = LedgerEntry(
+        run_id="run",
+        prompt_id="prompt",
+        registry_hash="abc",
+        config_fingerprint="def",
+        started_at=datetime(2025, 1, 1, 12, 30),
+        success=True,
+        output_paths=("out.md",),
+    )
+    dataclass_file = temp_dir / "dataclass.jsonl"
+    dict_file = temp_dir / "dict.jsonl"
+
+    append_jsonl(dataclass_file, entry)
+    append_jsonl(dict_file, asdict(entry))
+
+    assert dataclass_file.read_bytes() == dict_file.read_bytes()
+
+
 def test_read_jsonl_nonexistent(temp_dir):
     """Test reading nonexistent JSONL file returns empty list."""
     test_file = temp_dir / "nonexistent.jsonl"
@@ -227,6 +428,14 @@ def test_read_jsonl_nonexistent(temp_dir):
     assert entries == []
 
 
+def test_read_jsonl_blank_file(temp_dir):
+    """Test reading a JSONL file with only blank lines returns empty list."""
+    test_file = temp_dir / "blank.jsonl"
+    test_file.write_text("\n  \n")
+
+    assert read_jsonl(test_file) == []
+
+
 def test_jsonl_with_empty_lines(temp_dir):
     """Test reading JSONL with empty lines."""
     test_file = temp_dir / "test.jsonl"
@@ -247,6 +456,16 @@ def test_jsonl_with_empty_lines(temp_dir):
     assert entries[2]["id"] == 3
 
 
+@pytest.mark.parametrize("bad_lines", [["1,2"], ["[1", "2]"]])
+def test_read_jsonl_rejects_malformed_line(temp_dir, bad_lines):
+    """Test a corrupt line raises instead of merging with its neighbours."""
+    test_file = temp_dir / "test.jsonl"
+    test_file.write_text("\n".join(['{"a": 1}', *bad_lines, '{"b": 2}']) + "\n")
+
+    with pytest.raises(json.JSONDecodeError, match="line 2"):
+        read_jsonl(test_file)
+
+
 def test_write_json_creates_parent_directory(temp_dir):
     """Test that write_json creates parent directories."""
     test_file = temp_dir / "nested" / "deep" / "test.json"
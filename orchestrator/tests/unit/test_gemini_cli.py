@@ -12,11 +12,20 @@ from adapters.gemini_cli import (
     GeminiCLIAdapter,
     GeminiCLIError,
     RateLimitDetectedError,
+    _probe_gemini_version,
 )
 from config.settings_schema import PromptPolicy, WaveType, ConcurrencyClass
 from services.rate_limiter import RateLimitError
 
 
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    """Reset the cached Gemini CLI version probe around each test."""
+    _probe_gemini_version.cache_clear()
+    yield
+    _probe_gemini_version.cache_clear()
+
+
 @pytest.fixture
 def temp_repo_root():
     """Create a temporary repository root."""
@@ -43,6 +52,19 @@ def sample_policy():
     )
 
 
+def stream_stdout(*results):
+    """Build a subprocess.run side effect that writes each result's stdout
+    to the file passed as ``stdout=``, like the real CLI would."""
+    remaining = list(results)
+
+    def run(cmd, **kwargs):
+        result = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        kwargs["stdout"].write(result.stdout.encode("utf-8"))
+        return result
+
+    return run
+
+
 @pytest.fixture
 def adapter_no_rate_limit(temp_repo_root):
     """Create adapter with rate limiting disabled."""
@@ -83,7 +105,7 @@ def test_execute_prompt_success(mock_run, adapter_no_rate_limit, sample_policy,
     mock_result.returncode = 0
     mock_result.stdout = "Test output content"
     mock_result.stderr = ""
-    mock_run.return_value = mock_result
+    mock_run.side_effect = stream_stdout(mock_result)
 
     exit_code, output, started_at, ended_at, retries = adapter_no_rate_limit.execute_prompt(
         policy=sample_policy,
@@ -92,7 +114,7 @@ def test_execute_prompt_success(mock_run, adapter_no_rate_limit, sample_policy,
     )
 
     assert exit_code == 0
-    assert output == "Test output content"
+    assert output == ""
     assert retries == 0
     assert isinstance(started_at, datetime)
     assert isinstance(ended_at, datetime)
@@ -166,7 +188,7 @@ def test_execute_prompt_retry_on_failure(mock_sleep, mock_run, adapter_no_rate_l
     success_result.stdout = "Success after retry"
     success_result.stderr = ""
 
-    mock_run.side_effect = [failed_result, failed_result, success_result]
+    mock_run.side_effect = stream_stdout(failed_result, failed_result, success_result)
 
     exit_code, output, started_at, ended_at, retries = adapter_no_rate_limit.execute_prompt(
         policy=sample_policy,
@@ -175,14 +197,15 @@ def test_execute_prompt_retry_on_failure(mock_sleep, mock_run, adapter_no_rate_l
     )
 
     assert exit_code == 0
-    assert output == "Success after retry"
+    assert output_path.read_text() == "Success after retry"
     assert retries == 2  # Failed twice before succeeding
 
-    # Verify exponential backoff was used
+    # Verify jittered backoff was used
     assert mock_sleep.call_count == 2
-    # First backoff: 2^0 = 1, second backoff: 2^1 = 2
-    mock_sleep.assert_any_call(1)
-    mock_sleep.assert_any_call(2)
+    first, second = (call.args[0] for call in mock_sleep.call_args_list)
+    # First backoff: uniform(1, 3), second: uniform(1, 3 * first)
+    assert 1 <= first <= 3
+    assert 1 <= second <= 3 * first
 
 
 @patch("adapters.gemini_cli.subprocess.run")
@@ -238,8 +261,49 @@ def test_execute_prompt_rate_limit_detection(mock_sleep, mock_run, adapter_no_ra
     assert exit_code == 0
     assert retries == 1
 
-    # Verify longer backoff for rate limits (30 seconds)
-    mock_sleep.assert_called_once_with(30)
+    # Verify longer backoff for rate limits (30-90 seconds on first retry)
+    mock_sleep.assert_called_once()
+    assert 30 <= mock_sleep.call_args.args[0] <= 90
+
+
+@patch("adapters.gemini_cli.subprocess.run")
+@patch("adapters.gemini_cli.time.sleep")
+def test_execute_prompt_rate_limit_retry_after(mock_sleep, mock_run, adapter_no_rate_limit, sample_policy, temp_repo_root):
+    """Test a Retry-After hint in stderr sets the rate limit backoff."""
+    rate_limit_result = Mock()
+    rate_limit_result.returncode = 1
+    rate_limit_result.stdout = ""
+    rate_limit_result.stderr = "Error: 429 Too Many Requests. Retry-After: 45"
+
+    success_result = Mock()
+    success_result.returncode = 0
+    success_result.stdout = "Success"
+    success_result.stderr = ""
+
+    mock_run.side_effect = [rate_limit_result, success_result]
+
+    adapter_no_rate_limit.execute_prompt(
+        policy=sample_policy,
+        prompt_text="Test prompt",
+        output_path=temp_repo_root / "output.md",
+    )
+
+    mock_sleep.assert_called_once_with(45.0)
+
+
+def test_backoff_delay_caps_retry_after(adapter_no_rate_limit):
+    """Test a large Retry-After hint is clamped to the rate limit cap."""
+    delay = adapter_no_rate_limit._backoff_delay("p", True, "429 retry-after: 86400")
+
+    assert delay == 120.0
+
+
+def test_backoff_delay_is_capped(adapter_no_rate_limit):
+    """Test jittered backoff stays within its base and cap."""
+    delays = [adapter_no_rate_limit._backoff_delay("p") for _ in range(50)]
+
+    assert all(1 <= delay <= 60 for delay in delays)
+    assert adapter_no_rate_limit._prev_backoff["p"] == delays[-1]
 
 
 @patch("adapters.gemini_cli.subprocess.run")
@@ -261,6 +325,33 @@ def test_execute_prompt_timeout(mock_run, adapter_no_rate_limit, sample_policy,
     assert "Timeout" in str(exc_info.value)
 
 
+@patch("adapters.gemini_cli.subprocess.run")
+def test_timeout_keeps_existing_output(mock_run, adapter_no_rate_limit, sample_policy, temp_repo_root):
+    """Test a timed-out run leaves the previous output file untouched."""
+    import subprocess
+
+    output_path = temp_repo_root / "output.md"
+    output_path.write_text("Earlier output")
+
+    def run(cmd, **kwargs):
+        kwargs["stdout"].write(b"partial")
+        raise subprocess.TimeoutExpired(cmd=cmd, timeout=120)
+
+    mock_run.side_effect = run
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        adapter_no_rate_limit._invoke_gemini_cli(
+            prompt="Test prompt",
+            model=sample_policy.model,
+            temperature=sample_policy.temperature,
+            timeout_sec=120,
+            output_path=output_path,
+        )
+
+    assert output_path.read_text() == "Earlier output"
+    assert list(temp_repo_root.iterdir()) == [output_path]
+
+
 @patch("adapters.gemini_cli.subprocess.run")
 def test_invoke_gemini_cli_environment_variables(mock_run, adapter_no_rate_limit, sample_policy, temp_repo_root):
     """Test environment variable handling."""
@@ -285,17 +376,40 @@ def test_invoke_gemini_cli_environment_variables(mock_run, adapter_no_rate_limit
     assert env["GEMINI_APPROVAL_MODE"] == "yolo"
 
 
+@patch("adapters.gemini_cli.subprocess.run")
+def test_invoke_gemini_cli_respects_approval_mode(mock_run, sample_policy, temp_repo_root, monkeypatch):
+    """Test an existing GEMINI_APPROVAL_MODE is passed through unchanged."""
+    monkeypatch.setenv("GEMINI_APPROVAL_MODE", "default")
+    adapter = GeminiCLIAdapter(temp_repo_root, enable_rate_limiting=False)
+
+    mock_result = Mock()
+    mock_result.returncode = 0
+    mock_result.stdout = "Success"
+    mock_result.stderr = ""
+    mock_run.return_value = mock_result
+
+    adapter.execute_prompt(
+        policy=sample_policy,
+        prompt_text="Test",
+        output_path=temp_repo_root / "output.md",
+    )
+
+    assert mock_run.call_args[1]["env"]["GEMINI_APPROVAL_MODE"] == "default"
+
+
 @patch("adapters.gemini_cli.subprocess.run")
 def test_check_gemini_cli_available(mock_run, adapter_no_rate_limit):
     """Test checking if Gemini CLI is available."""
     # CLI available
     mock_result = Mock()
     mock_result.returncode = 0
+    mock_result.stdout = "1.2.3\n"
     mock_run.return_value = mock_result
 
     assert adapter_no_rate_limit.check_gemini_cli_available() is True
 
     # CLI not available
+    _probe_gemini_version.cache_clear()
     mock_run.side_effect = FileNotFoundError()
     assert adapter_no_rate_limit.check_gemini_cli_available() is False
 
@@ -314,10 +428,29 @@ def test_get_gemini_version(mock_run, adapter_no_rate_limit):
     assert version == "gemini version 1.2.3"
 
     # Version not available
+    _probe_gemini_version.cache_clear()
     mock_run.side_effect = FileNotFoundError()
     assert adapter_no_rate_limit.get_gemini_version() is None
 
 
+@patch("adapters.gemini_cli.subprocess.run")
+def test_gemini_version_probed_once(mock_run, temp_repo_root):
+    """Test the version probe runs once and is shared across adapters."""
+    mock_result = Mock()
+    mock_result.returncode = 0
+    mock_result.stdout = "1.2.3\n"
+    mock_run.return_value = mock_result
+
+    adapter1 = GeminiCLIAdapter(temp_repo_root, enable_rate_limiting=False)
+    adapter2 = GeminiCLIAdapter(temp_repo_root, enable_rate_limiting=False)
+
+    assert adapter1.check_gemini_cli_available() is True
+    assert adapter1.get_gemini_version() == "1.2.3"
+    assert adapter2.check_gemini_cli_available() is True
+
+    assert mock_run.call_count == 1
+
+
 def test_is_rate_limit_error(adapter_no_rate_limit):
     """Test rate limit error detection."""
     # Test various rate limit indicators
@@ -326,6 +459,8 @@ def test_is_rate_limit_error(adapter_no_rate_limit):
     assert adapter_no_rate_limit._is_rate_limit_error("Quota exceeded for requests") is True
     assert adapter_no_rate_limit._is_rate_limit_error("Too many requests per minute") is True
     assert adapter_no_rate_limit._is_rate_limit_error("Resource exhausted") is True
+    assert adapter_no_rate_limit._is_rate_limit_error("RESOURCE_EXHAUSTED: RATE LIMIT") is True
+    assert adapter_no_rate_limit._is_rate_limit_error("60 Requests Per Minute allowed") is True
 
     # Non-rate-limit errors
     assert adapter_no_rate_limit._is_rate_limit_error("Internal server error") is False
@@ -334,6 +469,14 @@ def test_is_rate_limit_error(adapter_no_rate_limit):
     assert adapter_no_rate_limit._is_rate_limit_error(None) is False
 
 
+def test_is_rate_limit_error_large_output(adapter_no_rate_limit):
+    """Test detection in error output beyond the Hyperscan size threshold."""
+    noise = "x" * (64 * 1024)
+
+    assert adapter_no_rate_limit._is_rate_limit_error(noise + " QUOTA EXCEEDED") is True
+    assert adapter_no_rate_limit._is_rate_limit_error(noise) is False
+
+
 @patch("adapters.gemini_cli.subprocess.run")
 def test_execute_with_rate_limiter_wait(mock_run, temp_repo_root, sample_policy):
     """Test rate limiter integration."""
@@ -384,6 +527,9 @@ def test_execute_with_rate_limit_exceeded(mock_run, temp_repo_root, sample_polic
         )
 
     assert "Rate limit exceeded" in str(exc_info.value)
+    # The daily limit is not retried
+    mock_rate_limiter.wait_if_needed.assert_called_once()
+    mock_run.assert_not_called()
 
 
 def test_output_directory_creation(adapter_no_rate_limit, sample_policy, temp_repo_root):
@@ -430,3 +576,91 @@ def test_execute_prompt_captures_stderr_on_failure(mock_run, adapter_no_rate_lim
 
     # Verify error message includes stderr
     assert "Detailed error message from CLI" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_execute_prompt_async_streams_output(adapter_no_rate_limit, sample_policy, temp_repo_root):
+    """Test async execution writes CLI stdout to the output file."""
+    output_path = temp_repo_root / "out" / "output.md"
+
+    # Stand-in CLI that echoes its last argument (the prompt)
+    with patch(
+        "adapters.gemini_cli._command_prefix",
+        return_value=("sh", "-c", 'printf "%s" "$0"'),
+    ):
+        exit_code, output, started_at, ended_at, retries = (
+            await adapter_no_rate_limit.execute_prompt_async(
+                policy=sample_policy,
+                prompt_text="Async prompt",
+                output_path=output_path,
+            )
+        )
+
+    assert exit_code == 0
+    assert output == ""
+    assert retries == 0
+    assert output_path.read_text() == "Async prompt"
+
+
+@pytest.mark.asyncio
+async def test_execute_prompt_async_failure(adapter_no_rate_limit, sample_policy, temp_repo_root):
+    """Test async execution surfaces stderr after exhausting retries."""
+    policy = sample_policy.model_copy(update={"max_retries": 0})
+
+    with patch(
+        "adapters.gemini_cli._command_prefix",
+        return_value=("sh", "-c", "echo boom >&2; exit 3"),
+    ):
+        with pytest.raises(GeminiCLIError) as exc_info:
+            await adapter_no_rate_limit.execute_prompt_async(
+                policy=policy,
+                prompt_text="Async prompt",
+                output_path=temp_repo_root / "output.md",
+            )
+
+    assert "after 1 attempts" in str(exc_info.value)
+    assert "boom" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_execute_prompt_async_shares_backoff(adapter_no_rate_limit, sample_policy, temp_repo_root):
+    """Test async retries use the same capped Retry-After backoff."""
+    policy = sample_policy.model_copy(update={"max_retries": 1})
+
+    with patch(
+        "adapters.gemini_cli._command_prefix",
+        return_value=("sh", "-c", "echo '429 retry-after: 86400' >&2; exit 1"),
+    ), patch("adapters.gemini_cli.asyncio.sleep") as mock_sleep:
+        with pytest.raises(GeminiCLIError) as exc_info:
+            await adapter_no_rate_limit.execute_prompt_async(
+                policy=policy,
+                prompt_text="Async prompt",
+                output_path=temp_repo_root / "output.md",
+            )
+
+    mock_sleep.assert_called_once_with(120.0)
+    assert "after 2 attempts" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_execute_prompt_async_timeout_keeps_existing_output(adapter_no_rate_limit, temp_repo_root):
+    """Test an async timeout leaves the previous output file untouched."""
+    import subprocess
+
+    output_path = temp_repo_root / "output.md"
+    output_path.write_text("Earlier output")
+
+    with patch(
+        "adapters.gemini_cli._command_prefix",
+        return_value=("sh", "-c", "printf partial; sleep 5"),
+    ):
+        with pytest.raises(subprocess.TimeoutExpired):
+            await adapter_no_rate_limit._invoke_gemini_cli_async(
+                prompt="Async prompt",
+                model="test-model",
+                timeout_sec=0.5,
+                output_path=output_path,
+            )
+
+    assert output_path.read_text() == "Earlier output"
+    assert list(temp_repo_root.iterdir()) == [output_path]
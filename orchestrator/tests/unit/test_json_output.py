@@ -0,0 +1,31 @@
+"""Unit tests for the JSON output helper."""
+
+import pytest
+
+from nh_cli.utils import json_output
+from nh_cli.utils.json_output import emit_json
+
+DATA = {"a": 1, "b": [True, None, "x"]}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_emit_json_matches_without_orjson(indent, capsys, monkeypatch):
+    """Test the stdlib fallback writes the same bytes as orjson."""
+    pytest.importorskip("orjson")
+
+    emit_json(DATA, indent=indent)
+    with_orjson = capsys.readouterr().out
+
+    monkeypatch.setattr(json_output, "orjson", None)
+    emit_json(DATA, indent=indent)
+
+    assert capsys.readouterr().out == with_orjson
+
+
+def test_emit_json_compact(capsys, monkeypatch):
+    """Test compact output has no whitespace after separators."""
+    monkeypatch.setattr(json_output, "orjson", None)
+
+    emit_json(DATA)
+
+    assert capsys.readouterr().out == '{"a":1,"b":[true,null,"x"]}\n'
@@ -1,6 +1,7 @@
 """Unit tests for LedgerService."""
 
 import json
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -148,6 +149,28 @@ def test_compute_registry_hash(ledger_service, temp_repo_root):
     assert hash1 != hash3
 
 
+def test_compute_registry_hash_is_memoized(ledger_service, temp_repo_root):
+    """Test that an unchanged registry is not re-hashed."""
+    registry_path = temp_repo_root / "test_registry.tsv"
+    registry_path.write_text("prompt_id\ttitle\ntest1\tTest 1\n")
+    os.utime(registry_path, ns=(1_000_000_000, 1_000_000_000))
+    hash1 = ledger_service.compute_registry_hash(registry_path)
+
+    # Same size and mtime: served from the cache
+    registry_path.write_text("prompt_id\ttitle\ntest2\tTest 2\n")
+    os.utime(registry_path, ns=(1_000_000_000, 1_000_000_000))
+    assert ledger_service.compute_registry_hash(registry_path) == hash1
+
+    # A new mtime invalidates the cached digest
+    os.utime(registry_path, ns=(2_000_000_000, 2_000_000_000))
+    assert ledger_service.compute_registry_hash(registry_path) != hash1
+
+
+def test_compute_registry_hash_missing_file(ledger_service, temp_repo_root):
+    """Test that a missing registry hashes to an empty string."""
+    assert ledger_service.compute_registry_hash(temp_repo_root / "missing.tsv") == ""
+
+
 def test_compute_config_fingerprint(ledger_service):
     """Test computing config fingerprint."""
     config1 = {"key1": "value1", "key2": "value2"}
@@ -168,6 +191,17 @@ def test_compute_config_fingerprint(ledger_service):
     assert hash1 != hash3
 
 
+def test_compute_config_fingerprint_nested_order(ledger_service):
+    """Test that nested dict ordering does not change the fingerprint."""
+    config1 = {"waves": ["search"], "options": {"a": 1, "b": 2}}
+    config2 = {"options": {"b": 2, "a": 1}, "waves": ["search"]}
+
+    hash1 = ledger_service.compute_config_fingerprint(config1)
+    hash2 = ledger_service.compute_config_fingerprint(config2)
+
+    assert hash1 == hash2
+
+
 def test_get_summary_stats_empty(ledger_service, temp_repo_root):
     """Test getting summary stats with no entries."""
     date = "2025-11-14"
@@ -54,6 +54,20 @@ test_prompt\tTest Prompt
         with pytest.raises(ValueError, match="Missing required columns"):
             provider.load()
 
+    def test_load_reports_invalid_row_number(self, tmp_path):
+        """Test batch validation errors point at the offending TSV row."""
+        tsv_path = tmp_path / "prompts.tsv"
+        tsv_content = """prompt_id\ttitle\twave\tcategory\texpected_outputs\tprompt
+good_prompt\tGood\tsearch\tResearch\tgood.md\tFirst prompt
+bad prompt\tBad\tsearch\tResearch\tbad.md\tSecond prompt
+"""
+        tsv_path.write_text(tsv_content)
+
+        provider = TSVRegistryProvider(tsv_path)
+
+        with pytest.raises(ValueError, match="TSV row 3"):
+            provider.load()
+
     def test_validate_duplicate_ids(self, tmp_path):
         """Test validation catches duplicate prompt IDs."""
         tsv_path = tmp_path / "prompts.tsv"
@@ -100,6 +114,25 @@ aggregator\tAgg\taggregator\tSynthesis\t\t0.7\tagg.md\tAgg prompt
             "tools enabled but temperature > 1.0" in error for error in errors
         )
 
+    def test_validate_uses_given_prompts_without_reloading(self, tmp_path):
+        """Test validation of an already-loaded list does not re-read the TSV."""
+        tsv_path = tmp_path / "prompts.tsv"
+        tsv_content = """prompt_id\ttitle\twave\tcategory\texpected_outputs\tprompt
+search1\tSearch\tsearch\tResearch\tsearch1.md\tPrompt 1
+agg\tAgg\taggregator\tSynthesis\tagg.md\tPrompt 2
+"""
+        tsv_path.write_text(tsv_content)
+
+        provider = TSVRegistryProvider(tsv_path)
+        prompts = provider.load()
+        tsv_path.unlink()
+
+        assert provider.validate(prompts) == (True, [])
+        assert provider.validate(prompts[:1]) == (
+            False,
+            ["Missing critical wave: AGGREGATOR"],
+        )
+
     def test_default_values(self, tmp_path):
         """Test that default values are applied correctly."""
         tsv_path = tmp_path / "prompts.tsv"
@@ -0,0 +1,114 @@
+"""Unit tests for reprocess command helpers."""
+
+import os
+import subprocess
+
+import typer
+
+from nh_cli.commands import run as run_cmd
+from nh_cli.commands.reprocess import (
+    _build_cleanup_targets,
+    _execute_cleanup,
+    _resolve_targets,
+    _run_in_process,
+    _run_subprocess,
+)
+
+DATE = "2025-01-02"
+
+
+def test_execute_cleanup_removes_literal_and_glob_targets(tmp_path):
+    outputs_dir = tmp_path / "data" / "outputs" / "daily" / DATE
+    outputs_dir.mkdir(parents=True)
+    (outputs_dir / "prompt.md").write_text("output")
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    (logs_dir / f"orchestrator_{DATE}.log").write_text("log")
+    (logs_dir / f"orchestrator_run_{DATE}_1.log").write_text("log")
+    (logs_dir / "orchestrator_2025-01-03.log").write_text("other day")
+
+    summary = _execute_cleanup(tmp_path, _build_cleanup_targets(tmp_path, DATE), dry_run=False)
+
+    assert summary.touched == 3
+    assert not outputs_dir.exists()
+    assert [p.name for p in logs_dir.iterdir()] == ["orchestrator_2025-01-03.log"]
+
+
+def test_execute_cleanup_unlinks_symlinked_directory(tmp_path):
+    target_dir = tmp_path / "elsewhere"
+    target_dir.mkdir()
+    (target_dir / "keep.md").write_text("keep")
+    outputs_parent = tmp_path / "data" / "outputs" / "daily"
+    outputs_parent.mkdir(parents=True)
+    (outputs_parent / DATE).symlink_to(target_dir, target_is_directory=True)
+
+    summary = _execute_cleanup(tmp_path, _build_cleanup_targets(tmp_path, DATE), dry_run=False)
+
+    assert summary.touched == 1
+    assert not (outputs_parent / DATE).is_symlink()
+    assert (target_dir / "keep.md").exists()
+
+
+def test_execute_cleanup_dry_run_keeps_files(tmp_path):
+    report = tmp_path / "data" / "reports" / f"daily_report_{DATE}.md"
+    report.parent.mkdir(parents=True)
+    report.write_text("report")
+
+    summary = _execute_cleanup(tmp_path, _build_cleanup_targets(tmp_path, DATE), dry_run=True)
+
+    assert summary.touched == 1
+    assert report.exists()
+
+
+def test_execute_cleanup_uses_targets_resolved_for_plan(tmp_path):
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    (logs_dir / f"orchestrator_{DATE}.log").write_text("log")
+    targets = _build_cleanup_targets(tmp_path, DATE)
+    _resolve_targets(targets)
+
+    # Written after the plan was resolved, so it is left alone
+    (logs_dir / f"orchestrator_late_{DATE}.log").write_text("log")
+    summary = _execute_cleanup(tmp_path, targets, dry_run=False)
+
+    assert summary.touched == 1
+    assert [p.name for p in logs_dir.iterdir()] == [f"orchestrator_late_{DATE}.log"]
+
+
+def test_run_in_process_scopes_override_env(monkeypatch):
+    monkeypatch.delenv("RUN_MODE", raising=False)
+    monkeypatch.setenv("MANUAL_OVERRIDE_REASON", "previous")
+    seen = {}
+
+    def fake_main(**kwargs):
+        seen.update(kwargs, run_mode=os.environ.get("RUN_MODE"))
+        raise typer.Exit(code=20)
+
+    monkeypatch.setattr(run_cmd, "main", fake_main)
+
+    code = _run_in_process(
+        DATE, "search", {"RUN_MODE": "manual_override", "MANUAL_OVERRIDE_REASON": "test"}
+    )
+
+    assert code == 20
+    assert seen["date"] == DATE and seen["force"] == "search"
+    assert seen["run_mode"] == "manual_override"
+    assert "RUN_MODE" not in os.environ
+    assert os.environ["MANUAL_OVERRIDE_REASON"] == "previous"
+
+
+def test_run_subprocess_passes_console_width(monkeypatch):
+    seen = {}
+
+    def fake_run(cmd, check, env):
+        seen.update(env)
+        return subprocess.CompletedProcess(cmd, 7)
+
+    monkeypatch.delenv("COLUMNS", raising=False)
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    code = _run_subprocess(["nh", "run"], {"RUN_MODE": "manual_override"})
+
+    assert code == 7
+    assert seen["RUN_MODE"] == "manual_override"
+    assert seen["COLUMNS"].isdigit()
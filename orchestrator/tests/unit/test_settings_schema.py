@@ -0,0 +1,147 @@
+"""Unit tests for settings schema models."""
+
+import ast
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from config.settings_schema import (
+    AuditLogEntry,
+    CompletionMarker,
+    CompletionMarkerAdapter,
+    ConcurrencyClass,
+    PromptPolicy,
+    RunManifest,
+    WaveType,
+    parse_concurrency_class,
+    parse_wave,
+)
+
+
+@pytest.fixture
+def policy_data():
+    """Minimal valid prompt policy fields."""
+    return {
+        "prompt_id": "test_prompt-1",
+        "title": "Test Prompt",
+        "wave": "search",
+        "category": "Research",
+        "expected_outputs": "test_prompt.md",
+        "prompt": "Test prompt text",
+    }
+
+
+def test_prompt_policy_is_frozen(policy_data):
+    """Test prompt policies cannot be mutated after validation."""
+    policy = PromptPolicy(**policy_data)
+
+    assert policy.wave is WaveType.SEARCH
+    with pytest.raises(ValidationError):
+        policy.model = "other-model"
+
+
+def test_completion_marker_is_frozen():
+    """Test completion markers cannot be mutated after construction."""
+    now = datetime.now()
+    marker = CompletionMarker(prompt_id="p1", started_at=now, ended_at=now, exit_code=0)
+
+    with pytest.raises(FrozenInstanceError):
+        marker.exit_code = 1
+
+
+def test_completion_marker_adapter_validates_rows():
+    """Test markers read from disk are coerced and validated."""
+    marker = CompletionMarkerAdapter.validate_python(
+        {
+            "prompt_id": "p1",
+            "started_at": "2025-01-01 08:00:00",
+            "ended_at": "2025-01-01 08:01:00",
+            "exit_code": 0,
+        }
+    )
+    assert marker.ended_at == datetime(2025, 1, 1, 8, 1)
+
+    with pytest.raises(ValidationError):
+        CompletionMarkerAdapter.validate_python(
+            {
+                "prompt_id": "p1",
+                "started_at": "2025-01-01 08:00:00",
+                "ended_at": "2025-01-01 08:01:00",
+                "exit_code": 0,
+                "retries": -1,
+            }
+        )
+
+
+def test_run_manifest_is_mutable():
+    """Test run manifests accept results as the run progresses."""
+    manifest = RunManifest(run_id="run-1", date="2025-01-01", started_at=datetime.now())
+
+    manifest.completed_prompts = ["p1"]
+
+    assert manifest.completed_prompts == ["p1"]
+
+
+@pytest.mark.parametrize("prompt_id", ["", "has space", "dot.id", "slash/id"])
+def test_prompt_policy_rejects_invalid_prompt_id(policy_data, prompt_id):
+    """Test prompt_id must be alphanumeric with underscores/hyphens."""
+    policy_data["prompt_id"] = prompt_id
+
+    with pytest.raises(ValidationError, match="prompt_id"):
+        PromptPolicy(**policy_data)
+
+
+def test_enum_lookups_return_members():
+    assert parse_wave("aggregator") is WaveType.AGGREGATOR
+    assert parse_concurrency_class("high") is ConcurrencyClass.HIGH
+
+
+@pytest.mark.parametrize(
+    "parser,value",
+    [(parse_wave, "unknown"), (parse_concurrency_class, "HIGH")],
+)
+def test_enum_lookups_raise_value_error(parser, value):
+    with pytest.raises(ValueError, match="is not a valid"):
+        parser(value)
+
+
+def test_audit_entries_share_empty_path_default():
+    entries = [
+        AuditLogEntry(
+            timestamp=datetime.now(), operator="system", cli_version="1.0", command="cleanup"
+        )
+        for _ in range(2)
+    ]
+
+    assert entries[0].affected_paths == ()
+    assert entries[0].affected_paths is entries[1].affected_paths
+
+
+def _adapters_built_on_import(*names: str) -> list[bool]:
+    """Import the schema module in a fresh interpreter and report adapter state."""
+    code = (
+        "import config.settings_schema as s; "
+        f"print([getattr(s, n).pydantic_complete for n in {list(names)!r}])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[2],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return ast.literal_eval(result.stdout)
+
+
+def test_prompt_policy_adapter_schema_is_deferred():
+    assert _adapters_built_on_import("PromptPolicyListAdapter") == [False]
+
+
+def test_record_adapter_schemas_are_deferred():
+    built = _adapters_built_on_import("CompletionMarkerAdapter", "LedgerEntryListAdapter")
+    assert built == [False, False]
@@ -147,6 +147,16 @@ def test_count(temp_db, sample_prompts):
     assert provider.count() == 2
 
 
+def test_validate(temp_db, sample_prompts):
+    """Test validating prompts stored in the database."""
+    provider = SQLiteRegistryProvider(temp_db)
+
+    assert provider.validate() == (False, ["Registry is empty"])
+
+    provider.save(sample_prompts)
+    assert provider.validate() == (True, [])
+
+
 def test_save_overwrites_existing(temp_db, sample_prompts):
     """Test that save overwrites existing prompts."""
     provider = SQLiteRegistryProvider(temp_db)
@@ -5,10 +5,21 @@ from __future__ import annotations
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from config.toml_config import ConfigLoader, NHConfig, get_config
+from config.toml_config import (
+    ConfigLoader,
+    NHConfig,
+    OrchestratorConfig,
+    _config_schema_signature,
+    _parse_env_file,
+    get_config,
+    get_config_loader,
+    load_cached_config,
+    reset_config_cache,
+)
 
 
 @pytest.fixture
@@ -131,6 +142,86 @@ def test_get_registry_path_from_env(temp_repo, cleanup_env):
     assert registry_path == temp_repo / "custom.tsv"
 
 
+def test_parse_env_file(temp_repo):
+    env_path = temp_repo / ".env"
+    env_path.write_text(
+        "# comment\n"
+        "\n"
+        "PLAIN=value\n"
+        "export EXPORTED=yes\n"
+        'DOUBLE="quoted # kept"\n'
+        "SINGLE='single'\n"
+        "TRAILING=value # comment\n"
+        "EMPTY=\n"
+        "NO_EQUALS\n"
+    )
+
+    assert _parse_env_file(env_path) == {
+        "PLAIN": "value",
+        "EXPORTED": "yes",
+        "DOUBLE": "quoted # kept",
+        "SINGLE": "single",
+        "TRAILING": "value",
+        "EMPTY": "",
+    }
+
+
+def test_parse_env_file_quoted_value_with_trailing_comment(temp_repo):
+    env_path = temp_repo / ".env"
+    env_path.write_text(
+        'DOUBLE="value" # comment\n'
+        "SINGLE='token'   # comment\n"
+        'URL="https://example.com/#anchor" # docs\n'
+        'BROKEN="unterminated\n'
+    )
+
+    assert _parse_env_file(env_path) == {
+        "DOUBLE": "value",
+        "SINGLE": "token",
+        "URL": "https://example.com/#anchor",
+    }
+
+
+def test_parse_env_file_decodes_double_quoted_escapes(temp_repo):
+    env_path = temp_repo / ".env"
+    env_path.write_text(
+        'MULTI="line1\\nline2"\n'
+        'QUOTE="say \\"hi\\""\n'
+        "RAW='line1\\nline2'\n"
+    )
+
+    assert _parse_env_file(env_path) == {
+        "MULTI": "line1\nline2",
+        "QUOTE": 'say "hi"',
+        "RAW": "line1\\nline2",
+    }
+
+
+def test_env_file_stack_skips_directories(temp_repo):
+    (temp_repo / ".env").mkdir()
+    (temp_repo / ".env.dev").write_text("NH_SUCCESS_NOTIFIER_SCRIPT=scripts/dev_notify.sh\n")
+
+    # The loader writes into os.environ; restore it afterwards
+    with patch.dict(os.environ):
+        os.environ.pop("NH_SUCCESS_NOTIFIER_SCRIPT", None)
+        config = ConfigLoader(temp_repo).load()
+
+    assert config.notifier.success_script == "scripts/dev_notify.sh"
+
+
+def test_registry_path_refreshed_on_reload(temp_repo, monkeypatch):
+    monkeypatch.setenv("NH_REGISTRY_BACKEND", "tsv")
+    monkeypatch.setenv("NH_REGISTRY_TSV_PATH", "first.tsv")
+    loader = ConfigLoader(temp_repo)
+    assert loader.get_registry_path() == temp_repo / "first.tsv"
+
+    monkeypatch.setenv("NH_REGISTRY_TSV_PATH", "second.tsv")
+    assert loader.get_registry_path() == temp_repo / "first.tsv"
+
+    loader.load(reload=True)
+    assert loader.get_registry_path() == temp_repo / "second.tsv"
+
+
 def test_create_sample_config(temp_repo):
     loader = ConfigLoader(temp_repo)
     config_path = loader.create_sample_config()
@@ -149,6 +240,22 @@ def test_legacy_toml_triggers_warning(temp_repo):
     assert config.orchestrator.max_parallel_jobs == 6
 
 
+def test_legacy_toml_parsed_once_when_unchanged(temp_repo, monkeypatch):
+    monkeypatch.delenv("CLOUDFLARE_ACCOUNT_ID", raising=False)
+    legacy_path = temp_repo / ".nh.toml"
+    legacy_path.write_text('[cloudflare]\naccount_id = "legacy-account"')
+    loader = ConfigLoader(temp_repo)
+
+    with pytest.warns(DeprecationWarning):
+        loader.load()
+    with patch("tomllib.load") as mock_load:
+        with pytest.warns(DeprecationWarning):
+            config = loader.load(reload=True)
+
+    mock_load.assert_not_called()
+    assert config.cloudflare.account_id == "legacy-account"
+
+
 def test_boolean_env_var_parsing(temp_repo, monkeypatch):
     loader = ConfigLoader(temp_repo)
     for true_value in ["true", "1", "yes", "TRUE"]:
@@ -176,6 +283,17 @@ def test_cloudflare_env_vars(temp_repo, monkeypatch):
     assert config.cloudflare.project_name == "test-project"
 
 
+def test_maintenance_and_notifier_env_vars(temp_repo, monkeypatch):
+    monkeypatch.setenv("NH_REQUIRE_CLEAN_GIT", "no")
+    monkeypatch.setenv("ENABLE_NOTIFICATIONS", "yes")
+    monkeypatch.setenv("NH_FAILURE_NOTIFIER_SCRIPT", "scripts/custom.sh")
+    loader = ConfigLoader(temp_repo)
+    config = loader.load()
+    assert config.maintenance.require_clean_git is False
+    assert config.notifier.enable_success is True
+    assert config.notifier.failure_script == "scripts/custom.sh"
+
+
 def test_pydantic_validation(temp_repo, monkeypatch):
     monkeypatch.setenv("NH_MAX_PARALLEL_JOBS", "100")
     loader = ConfigLoader(temp_repo)
@@ -183,11 +301,109 @@ def test_pydantic_validation(temp_repo, monkeypatch):
         loader.load()
 
 
+def test_nh_config_is_frozen_and_ignores_unknown_sections():
+    config = NHConfig(unknown_section={"key": "value"})
+    assert not hasattr(config, "unknown_section")
+    with pytest.raises(Exception):
+        config.orchestrator = None
+
+
 def test_get_config_function(temp_repo):
     config = get_config(temp_repo)
     assert isinstance(config, NHConfig)
 
 
+def test_get_config_is_cached_per_repo(temp_repo):
+    reset_config_cache()
+    try:
+        assert get_config_loader(temp_repo) is get_config_loader(temp_repo / ".")
+        assert get_config(temp_repo) is get_config(temp_repo)
+    finally:
+        reset_config_cache()
+
+
+def test_load_cached_config_reused_across_processes(temp_repo):
+    cache_path = temp_repo / "var" / "cache" / "nh_config.pkl"
+    with patch.dict(os.environ, {"NH_DEFAULT_MODEL": "cached-model"}):
+        reset_config_cache()
+        try:
+            first = load_cached_config(temp_repo, cache_path)
+            assert cache_path.exists()
+            assert cache_path.stat().st_mode & 0o077 == 0
+
+            # A fresh loader (as in a new process) is served from the pickle
+            reset_config_cache()
+            with patch("config.toml_config.ConfigLoader.load") as mock_load:
+                second = load_cached_config(temp_repo, cache_path)
+            mock_load.assert_not_called()
+            assert second == first
+            assert get_config(temp_repo) is second
+        finally:
+            reset_config_cache()
+
+
+def test_load_cached_config_keeps_secrets_out_of_cache(temp_repo):
+    cache_path = temp_repo / "cache.pkl"
+    with patch.dict(os.environ, {"CLOUDFLARE_API_TOKEN": "secret-token"}):
+        reset_config_cache()
+        try:
+            first = load_cached_config(temp_repo, cache_path)
+            assert first.cloudflare.api_token == "secret-token"
+            assert b"secret-token" not in cache_path.read_bytes()
+
+            # A hit takes the secret from the environment, not the pickle
+            reset_config_cache()
+            with patch("config.toml_config.ConfigLoader.load") as mock_load:
+                second = load_cached_config(temp_repo, cache_path)
+            mock_load.assert_not_called()
+            assert second.cloudflare.api_token == "secret-token"
+        finally:
+            reset_config_cache()
+
+
+def test_load_cached_config_invalidated_by_env_change(temp_repo):
+    cache_path = temp_repo / "cache.pkl"
+    reset_config_cache()
+    try:
+        with patch.dict(os.environ, {"NH_DEFAULT_MODEL": "first"}):
+            load_cached_config(temp_repo, cache_path)
+        reset_config_cache()
+        with patch.dict(os.environ, {"NH_DEFAULT_MODEL": "second"}):
+            config = load_cached_config(temp_repo, cache_path)
+        assert config.orchestrator.default_model == "second"
+    finally:
+        reset_config_cache()
+
+
+def test_load_cached_config_invalidated_by_default_change(temp_repo, monkeypatch):
+    cache_path = temp_repo / "cache.pkl"
+    # Defaults only apply to a section no env var overrides
+    for env_var in (
+        "NH_DEFAULT_MODEL",
+        "NH_MAX_PARALLEL_JOBS",
+        "NH_ENABLE_RATE_LIMITING",
+        "GEMINI_APPROVAL_MODE",
+    ):
+        monkeypatch.delenv(env_var, raising=False)
+    reset_config_cache()
+    _config_schema_signature.cache_clear()
+    try:
+        load_cached_config(temp_repo, cache_path)
+
+        # As if max_parallel_jobs = 4 were edited to 8 in a later release
+        defaults = OrchestratorConfig.__init__.__defaults__
+        monkeypatch.setattr(
+            OrchestratorConfig.__init__, "__defaults__", (defaults[0], 8, *defaults[2:])
+        )
+        reset_config_cache()
+        _config_schema_signature.cache_clear()
+        config = load_cached_config(temp_repo, cache_path)
+        assert config.orchestrator.max_parallel_jobs == 8
+    finally:
+        reset_config_cache()
+        _config_schema_signature.cache_clear()
+
+
 def test_partial_env_defaults(temp_repo, cleanup_env):
     env_path = temp_repo / ".env"
     env_path.write_text("NH_DEFAULT_MODEL=custom")